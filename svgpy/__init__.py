@@ -20,7 +20,7 @@ from svgpy.base import \
     SVGElement, SVGGeometryElement, SVGGradientElement, SVGGraphicsElement, \
     SVGPathData, SVGPathDataSettings, SVGPreserveAspectRatio, \
     SVGURIReference, SVGZoomAndPan
-from svgpy.core import Font, SVGLength
+from svgpy.core import Font, LengthResolver, SVGLength
 from svgpy.css import CSS, CSSConditionRule, CSSFontFaceRule, \
     CSSFontFeatureValuesRule, CSSGroupingRule, CSSImageValue, CSSImportRule, \
     CSSKeywordValue, CSSMathClamp, CSSMathInvert, CSSMathMax, CSSMathMin, \
@@ -44,11 +44,13 @@ from svgpy.exception import AbortError, ConstraintError, DataCloneError, \
     URLMismatchError, VersionError, WrongDocumentError
 from svgpy.geometry import DOMMatrix, DOMMatrixReadOnly, DOMRect, \
     DOMRectReadOnly
-from svgpy.path import PathParser, SVGPathSegment
+from svgpy.path import PathData, PathLengthIndex, PathParser, \
+    SVGPathSegment
 from svgpy.text import SVGTextContentElement, SVGTextPositioningElement
 from svgpy.transform import SVGTransform, SVGTransformList
 from svgpy.url import Location, URL, URLSearchParams
-from svgpy.utils import CaseInsensitiveMapping, QualifiedName
+from svgpy.utils import CaseInsensitiveMapping, LRUCache, QualifiedName, \
+    ResourceLoader
 from svgpy.window import Document, SVGDOMImplementation, Window, XMLDocument, \
     window
 
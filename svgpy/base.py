@@ -13,6 +13,7 @@
 # limitations under the License.
 
 
+import copy
 from abc import abstractmethod
 
 from .core import SVGLength
@@ -22,9 +23,469 @@ from .formatter import format_coordinate_pair_sequence, \
     to_coordinate_pair_sequence
 from .geometry.matrix import DOMMatrix
 from .geometry.rect import DOMRect
-from .path import PathParser
-from .transform import SVGTransformList
-from .utils import QualifiedName
+from .path import PathLengthIndex, PathParser
+from .transform import ParsedTransformList, SVGTransformList
+from .utils import LRUCache, QualifiedName
+
+
+# units of the lengths that can be resolved without the referencing element
+_CONTEXT_FREE_UNITS = frozenset([
+    None,
+    SVGLength.TYPE_NUMBER,
+    SVGLength.TYPE_PX,
+    SVGLength.TYPE_CM,
+    SVGLength.TYPE_MM,
+    SVGLength.TYPE_IN,
+    SVGLength.TYPE_PT,
+    SVGLength.TYPE_PC,
+    SVGLength.TYPE_Q,
+])
+
+# (parent viewport size, 'width', 'height') -> SVG viewport size
+# the cached lengths are shared: SVGElement.get_viewport_size() returns copies
+_viewport_size_cache = LRUCache(maxsize=1024)
+
+# (SVG viewport size, 'x', 'y') -> SVG viewport position
+_viewport_position_cache = LRUCache(maxsize=1024)
+
+# (SVG viewport, viewBox, preserveAspectRatio) -> matrix components
+_viewport_matrix_cache = LRUCache(maxsize=1024)
+
+# 'transform' attribute -> ParsedTransformList, for the elements without
+# a document (see Document.transform_cache)
+_transform_cache = LRUCache(maxsize=1024)
+
+# attributes of an 'svg' or 'symbol' element that the CTMs depend on
+_VIEWPORT_ATTRIBUTES = ('x', 'y', 'width', 'height', 'viewBox',
+                        'preserveAspectRatio')
+
+
+def _copy_length(length, direction):
+    """Returns a copy of the length without the referencing element, or the
+    length itself if it cannot be resolved without the referencing element.
+    """
+    unit = length.unit
+    if unit not in _CONTEXT_FREE_UNITS:
+        return length
+    return SVGLength(length.value(unit), unit, direction=direction)
+
+
+def _get_length_key(length):
+    unit = length.unit
+    if unit not in _CONTEXT_FREE_UNITS:
+        return None
+    return length.value(unit), unit
+
+
+def _copy_matrix(matrix):
+    if matrix.is2d:
+        return DOMMatrix([matrix.a, matrix.b, matrix.c, matrix.d, matrix.e,
+                          matrix.f])
+    return copy.deepcopy(matrix)
+
+
+def _get_ctm_key(element, viewport):
+    """Returns the values that the CTM of the element depends on, except the
+    ones of its ancestors.
+    """
+    key = element.getparent(), element.get('transform')
+    if viewport:
+        key += tuple(element.get(name) for name in _VIEWPORT_ATTRIBUTES)
+    return key
+
+
+def _get_parsed_transform_list(element):
+    """Returns the shared ParsedTransformList object of the 'transform'
+    attribute of the element, or None.
+    """
+    transform = element.get('transform')
+    if transform is None or transform == 'none':
+        return None
+    doc = element.getroottree().getroot().owner_document
+    cache = doc.transform_cache if doc is not None else _transform_cache
+    parsed = cache.get(transform)
+    if parsed is None:
+        parsed = ParsedTransformList(transform)
+        cache[transform] = parsed
+    return parsed
+
+
+def _get_initial_viewport_size(element):
+    doc = element.owner_document
+    win = doc.default_view if doc is not None else None
+    if win is None:
+        return Screen.DEFAULT_SCREEN_WIDTH, Screen.DEFAULT_SCREEN_HEIGHT
+    return win.inner_width, win.inner_height
+
+
+def _is_context_free(value):
+    """Returns True if the value of the 'width', 'height', 'x' or 'y'
+    attribute of an SVG viewport depends only on the parent SVG viewport.
+    """
+    if value in ('auto', 'inherit'):
+        return True
+    _, unit = SVGLength.parse(value)
+    return (unit in _CONTEXT_FREE_UNITS
+            or unit in (SVGLength.TYPE_PERCENTAGE,
+                        SVGLength.TYPE_VMAX,
+                        SVGLength.TYPE_VMIN))
+
+
+def _get_viewport_size(root, parent_vpw, parent_vph):
+    """Returns the size of the SVG viewport established by the element.
+
+    The results are shared by the elements with the same 'width' and
+    'height' attributes in the SVG viewports of the same size. Changing the
+    attributes or the size of the parent SVG viewport (or the initial
+    viewport, i.e. Window.inner_width and Window.inner_height) changes the
+    key, so no explicit invalidation is needed.
+    """
+    _width = root.get('width', 'auto')
+    _height = root.get('height', 'auto')
+    key = (_get_length_key(parent_vpw), _get_length_key(parent_vph),
+           _width, _height)
+    size = _viewport_size_cache.get(key)
+    if size is not None:
+        return size
+
+    if _width == 'auto':
+        _width = '100%'
+    if _width == 'inherit':
+        vpw = parent_vpw
+    else:
+        vpw = SVGLength(_width,
+                        context=root,
+                        direction=SVGLength.DIRECTION_HORIZONTAL)
+        unit = vpw.unit
+        if unit in (SVGLength.TYPE_PERCENTAGE, SVGLength.TYPE_VW):
+            vpw = vpw.value(SVGLength.TYPE_PERCENTAGE) / 100 \
+                  * parent_vpw
+        elif unit == SVGLength.TYPE_VH:
+            vpw = vpw.value(SVGLength.TYPE_PERCENTAGE) / 100 \
+                  * parent_vph
+        elif unit == SVGLength.TYPE_VMAX:
+            vpw = max(parent_vpw, parent_vph)
+        elif unit == SVGLength.TYPE_VMIN:
+            vpw = min(parent_vpw, parent_vph)
+
+    if _height == 'auto':
+        _height = '100%'
+    if _height == 'inherit':
+        vph = parent_vph
+    else:
+        vph = SVGLength(_height,
+                        context=root,
+                        direction=SVGLength.DIRECTION_VERTICAL)
+        unit = vph.unit
+        if unit in (SVGLength.TYPE_PERCENTAGE, SVGLength.TYPE_VH):
+            vph = vph.value(SVGLength.TYPE_PERCENTAGE) / 100 \
+                  * parent_vph
+        elif unit == SVGLength.TYPE_VW:
+            vph = vph.value(SVGLength.TYPE_PERCENTAGE) / 100 \
+                  * parent_vpw
+        elif unit == SVGLength.TYPE_VMAX:
+            vph = max(parent_vpw, parent_vph)
+        elif unit == SVGLength.TYPE_VMIN:
+            vph = min(parent_vpw, parent_vph)
+
+    if (None not in key[:2]
+            and _is_context_free(key[2])
+            and _is_context_free(key[3])
+            and vpw.unit in _CONTEXT_FREE_UNITS
+            and vph.unit in _CONTEXT_FREE_UNITS):
+        _viewport_size_cache[key] = (
+            _copy_length(vpw, SVGLength.DIRECTION_HORIZONTAL),
+            _copy_length(vph, SVGLength.DIRECTION_VERTICAL))
+    return vpw, vph
+
+
+def _get_viewport_position(root, vpw, vph):
+    """Returns the position of the SVG viewport established by the element.
+    """
+    _x = root.get('x', '0')
+    _y = root.get('y', '0')
+    key = _get_length_key(vpw), _get_length_key(vph), _x, _y
+    position = _viewport_position_cache.get(key)
+    if position is not None:
+        return position
+
+    vpx = SVGLength(_x,
+                    context=root,
+                    direction=SVGLength.DIRECTION_HORIZONTAL)
+    unit = vpx.unit
+    if unit in (SVGLength.TYPE_PERCENTAGE, SVGLength.TYPE_VW):
+        vpx = vpx.value(SVGLength.TYPE_PERCENTAGE) / 100 * vpw
+    elif unit == SVGLength.TYPE_VH:
+        vpx = vpx.value(SVGLength.TYPE_PERCENTAGE) / 100 * vph
+    elif unit == SVGLength.TYPE_VMAX:
+        vpx = max(vpw, vph)
+    elif unit == SVGLength.TYPE_VMIN:
+        vpx = min(vpw, vph)
+
+    vpy = SVGLength(_y,
+                    context=root,
+                    direction=SVGLength.DIRECTION_VERTICAL)
+    unit = vpy.unit
+    if unit in (SVGLength.TYPE_PERCENTAGE, SVGLength.TYPE_VH):
+        vpy = vpy.value(SVGLength.TYPE_PERCENTAGE) / 100 * vph
+    elif unit == SVGLength.TYPE_VW:
+        vpy = vpy.value(SVGLength.TYPE_PERCENTAGE) / 100 * vpw
+    elif unit == SVGLength.TYPE_VMAX:
+        vpy = max(vpw, vph)
+    elif unit == SVGLength.TYPE_VMIN:
+        vpy = min(vpw, vph)
+
+    if (None not in key[:2]
+            and _is_context_free(_x)
+            and _is_context_free(_y)
+            and vpx.unit in _CONTEXT_FREE_UNITS
+            and vpy.unit in _CONTEXT_FREE_UNITS):
+        _viewport_position_cache[key] = (
+            _copy_length(vpx, SVGLength.DIRECTION_HORIZONTAL),
+            _copy_length(vpy, SVGLength.DIRECTION_VERTICAL))
+    return vpx, vpy
+
+
+def _get_viewport_transformation_matrix(ex, ey, ew, eh, vbx, vby, vbw, vbh,
+                                        par):
+    ctm = DOMMatrix()
+    align = par.align
+    if align == SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_UNKNOWN:
+        align = SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMIDYMID
+    meet_or_slice = par.meet_or_slice
+    if meet_or_slice == SVGPreserveAspectRatio.SVG_MEETORSLICE_UNKNOWN:
+        meet_or_slice = SVGPreserveAspectRatio.SVG_MEETORSLICE_MEET
+    sx = ew / vbw
+    sy = eh / vbh
+    if align != SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_NONE:
+        if meet_or_slice == SVGPreserveAspectRatio.SVG_MEETORSLICE_MEET:
+            if sx < sy:
+                sy = sx
+            elif sx > sy:
+                sx = sy
+        elif meet_or_slice == SVGPreserveAspectRatio.SVG_MEETORSLICE_SLICE:
+            if sx > sy:
+                sy = sx
+            elif sx < sy:
+                sx = sy
+    tx = ex - vbx * sx
+    ty = ey - vby * sy
+    if align in (SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMIDYMIN,
+                 SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMIDYMID,
+                 SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMIDYMAX):
+        # 'xMid'
+        tx += (ew - vbw * sx) / 2
+    if align in (SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMAXYMIN,
+                 SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMAXYMID,
+                 SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMAXYMAX):
+        # 'xMax'
+        tx += ew - vbw * sx
+    if align in (SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMINYMID,
+                 SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMIDYMID,
+                 SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMAXYMID):
+        # 'YMid'
+        ty += (eh - vbh * sy) / 2
+    if align in (SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMINYMAX,
+                 SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMIDYMAX,
+                 SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMAXYMAX):
+        # 'YMax'
+        ty += eh - vbh * sy
+    ctm.translate_self(tx.value(), ty.value())
+    ctm.scale_self(sx.value(tx.unit), sy.value(tx.unit))
+    return ctm
+
+
+class CTMResolver(object):
+    """Resolves the current transformation matrices (CTM) of the elements of
+    a document.
+
+    The elements are visited once from the top down: the 'transform'
+    attribute of each element is parsed once, the viewport transformation
+    matrix of each SVG viewport is computed once, and the matrices of the
+    ancestors are reused by their descendants.
+
+    A resolved CTM is used as long as the 'transform' attributes, the SVG
+    viewport attributes and the parents of the element and its ancestors,
+    and the size of the initial viewport are unchanged. The entries that no
+    longer validate are discarded.
+    """
+
+    def __init__(self):
+        self._entries = dict()
+
+    def _discard(self, root):
+        for element in root.iter():
+            self._entries.pop(element, None)
+
+    def _get_entry(self, element):
+        entry = self._entries.get(element)
+        if entry is None:
+            return None
+        if entry.viewport_size != _get_initial_viewport_size(element):
+            self._entries.clear()
+            return None
+        ancestor = element
+        while ancestor is not None:
+            ancestor_entry = self._entries.get(ancestor)
+            if ancestor_entry is None:
+                # an unresolved ancestor
+                self._discard(element)
+                return None
+            elif ancestor_entry.key != _get_ctm_key(
+                    ancestor, len(ancestor_entry.key) > 2):
+                # the descendants of the changed ancestor are invalid
+                self._discard(ancestor)
+                return None
+            ancestor = ancestor.getparent()
+        return entry
+
+    def get_ctm(self, element):
+        """Gets the resolved CTM of the element.
+
+        Arguments:
+            element (SVGGraphicsElement): An element of the document.
+        Returns:
+            DOMMatrix: A copy of the resolved CTM, or None if the element is
+                not resolved or its CTM may have changed.
+        """
+        entry = self._get_entry(element)
+        if entry is None or entry.ctm is None:
+            return None
+        return _copy_matrix(entry.ctm)
+
+    def get_screen_ctm(self, element):
+        """Gets the resolved screen CTM of the element.
+
+        Arguments:
+            element (SVGGraphicsElement): An element of the document.
+        Returns:
+            DOMMatrix: A copy of the resolved screen CTM, or None if the
+                element is not resolved or its screen CTM may have changed.
+        """
+        entry = self._get_entry(element)
+        if entry is None or entry.screen_ctm is None:
+            return None
+        farthest = entry.farthest
+        if (farthest is not None
+                and entry.zoom != (farthest.current_scale,
+                                   tuple(farthest.current_translate))):
+            return None
+        return _copy_matrix(entry.screen_ctm)
+
+    def resolve(self, root):
+        """Resolves the CTMs of the element and its descendants in document
+        order.
+
+        Arguments:
+            root (Element): The root of the subtree.
+        """
+        elements = list()
+        element = root.getparent()
+        while element is not None:
+            elements.insert(0, element)
+            element = element.getparent()
+        elements.extend(root.iter())
+        viewport_size = _get_initial_viewport_size(root)
+        # discard the entries of the elements that have been removed or
+        # modified since they were resolved
+        for element in list(self._entries):
+            if element in self._entries:
+                self._get_entry(element)
+        viewport_matrices = dict()
+        chain_matrices = dict()
+
+        def _get_chain_matrix(roots, zoom=None):
+            # the product of the zoom and pan, and the viewport
+            # transformation matrices of the SVG viewports
+            key = roots, zoom
+            matrix = chain_matrices.get(key)
+            if matrix is not None:
+                return matrix
+            if len(roots) == 0:
+                matrix = DOMMatrix()
+                if zoom is not None:
+                    scale, (tx, ty) = zoom
+                    matrix *= DOMMatrix([scale, 0, 0, scale, tx, ty])
+            else:
+                viewport = roots[-1]
+                vtm = viewport_matrices.get(viewport)
+                if vtm is None:
+                    vtm = viewport.get_viewport_transformation_matrix(
+                        recursive=False)
+                    viewport_matrices[viewport] = vtm
+                matrix = _copy_matrix(_get_chain_matrix(roots[:-1], zoom))
+                matrix *= vtm
+            chain_matrices[key] = matrix
+            return matrix
+
+        for element in elements:
+            if not isinstance(element, Element):
+                continue
+            parent_entry = self._entries.get(element.getparent())
+            if parent_entry is None:
+                farthest = None
+                viewports = ()
+                local = None
+            else:
+                farthest = parent_entry.farthest
+                viewports = parent_entry.viewports
+                local = parent_entry.local
+            local_name = element.local_name
+            is_viewport = local_name in ('svg', 'symbol')
+            if farthest is None and local_name == 'svg':
+                farthest = element
+            if is_viewport:
+                viewports += (element,)
+                local = None
+            if element.istransformable():
+                parsed = _get_parsed_transform_list(element)
+                if parsed is not None and len(parsed) > 0:
+                    local = (DOMMatrix() if local is None
+                             else _copy_matrix(local))
+                    for matrix in parsed.matrices:
+                        local *= matrix
+
+            entry = _CTMEntry(_get_ctm_key(element, is_viewport),
+                              viewport_size, farthest, viewports, local)
+            if isinstance(element, SVGGraphicsElement):
+                if farthest is None:
+                    entry.ctm = DOMMatrix()
+                    entry.screen_ctm = DOMMatrix()
+                else:
+                    if element is farthest:
+                        roots = screen_roots = (element,)
+                    elif is_viewport:
+                        roots = viewports[-2:]
+                        screen_roots = viewports
+                    else:
+                        roots = viewports[-1:]
+                        screen_roots = viewports
+                    entry.zoom = (farthest.current_scale,
+                                  tuple(farthest.current_translate))
+                    ctm = _copy_matrix(_get_chain_matrix(roots))
+                    screen_ctm = _copy_matrix(
+                        _get_chain_matrix(screen_roots, entry.zoom))
+                    if local is not None:
+                        ctm *= local
+                        screen_ctm *= local
+                    entry.ctm = ctm
+                    entry.screen_ctm = screen_ctm
+            self._entries[element] = entry
+
+
+class _CTMEntry(object):
+    __slots__ = ('ctm', 'farthest', 'key', 'local', 'screen_ctm',
+                 'viewport_size', 'viewports', 'zoom')
+
+    def __init__(self, key, viewport_size, farthest, viewports, local):
+        self.key = key
+        self.viewport_size = viewport_size
+        self.farthest = farthest
+        self.viewports = viewports
+        self.local = local
+        self.ctm = None
+        self.screen_ctm = None
+        self.zoom = None
 
 
 class HTMLOrSVGElement(Element):
@@ -248,93 +709,23 @@ class SVGElement(ElementCSSInlineStyle, HTMLOrSVGElement):
                 break
             element = root.getparent()
 
-        win = (self.owner_document.default_view
-               if self.owner_document is not None
-               else None)
-        if win is None:
-            initial_viewport_width = Screen.DEFAULT_SCREEN_WIDTH
-            initial_viewport_height = Screen.DEFAULT_SCREEN_HEIGHT
-        else:
-            initial_viewport_width = win.inner_width
-            initial_viewport_height = win.inner_height
-        parent_vpw = vpw = SVGLength(initial_viewport_width,
-                                     direction=SVGLength.DIRECTION_HORIZONTAL)
-        parent_vph = vph = SVGLength(initial_viewport_height,
-                                     direction=SVGLength.DIRECTION_VERTICAL)
+        initial_viewport_width, initial_viewport_height = \
+            _get_initial_viewport_size(self)
+        vpw = SVGLength(initial_viewport_width,
+                        direction=SVGLength.DIRECTION_HORIZONTAL)
+        vph = SVGLength(initial_viewport_height,
+                        direction=SVGLength.DIRECTION_VERTICAL)
         for root in roots:
-            _width = root.get('width', 'auto')
-            if _width == 'auto':
-                _width = '100%'
-            if _width == 'inherit':
-                vpw = parent_vpw
-            else:
-                vpw = SVGLength(_width,
-                                context=root,
-                                direction=SVGLength.DIRECTION_HORIZONTAL)
-                unit = vpw.unit
-                if unit in (SVGLength.TYPE_PERCENTAGE, SVGLength.TYPE_VW):
-                    vpw = vpw.value(SVGLength.TYPE_PERCENTAGE) / 100 \
-                          * parent_vpw
-                elif unit == SVGLength.TYPE_VH:
-                    vpw = vpw.value(SVGLength.TYPE_PERCENTAGE) / 100 \
-                          * parent_vph
-                elif unit == SVGLength.TYPE_VMAX:
-                    vpw = max(parent_vpw, parent_vph)
-                elif unit == SVGLength.TYPE_VMIN:
-                    vpw = min(parent_vpw, parent_vph)
-            parent_vpw = vpw
-
-            _height = root.get('height', 'auto')
-            if _height == 'auto':
-                _height = '100%'
-            if _height == 'inherit':
-                vph = parent_vph
-            else:
-                vph = SVGLength(_height,
-                                context=root,
-                                direction=SVGLength.DIRECTION_VERTICAL)
-                unit = vph.unit
-                if unit in (SVGLength.TYPE_PERCENTAGE, SVGLength.TYPE_VH):
-                    vph = vph.value(SVGLength.TYPE_PERCENTAGE) / 100 \
-                          * parent_vph
-                elif unit == SVGLength.TYPE_VW:
-                    vph = vph.value(SVGLength.TYPE_PERCENTAGE) / 100 \
-                          * parent_vpw
-                elif unit == SVGLength.TYPE_VMAX:
-                    vph = max(parent_vpw, parent_vph)
-                elif unit == SVGLength.TYPE_VMIN:
-                    vph = min(parent_vpw, parent_vph)
-            parent_vph = vph
+            vpw, vph = _get_viewport_size(root, vpw, vph)
         if len(roots) == 0:
             vpx = SVGLength(0)
             vpy = SVGLength(0)
         else:
-            root = roots[-1]
-            vpx = SVGLength(root.get('x', '0'),
-                            context=root,
-                            direction=SVGLength.DIRECTION_HORIZONTAL)
-            unit = vpx.unit
-            if unit in (SVGLength.TYPE_PERCENTAGE, SVGLength.TYPE_VW):
-                vpx = vpx.value(SVGLength.TYPE_PERCENTAGE) / 100 * vpw
-            elif unit == SVGLength.TYPE_VH:
-                vpx = vpx.value(SVGLength.TYPE_PERCENTAGE) / 100 * vph
-            elif unit == SVGLength.TYPE_VMAX:
-                vpx = max(vpw, vph)
-            elif unit == SVGLength.TYPE_VMIN:
-                vpx = min(vpw, vph)
-
-            vpy = SVGLength(root.get('y', '0'),
-                            context=root,
-                            direction=SVGLength.DIRECTION_VERTICAL)
-            unit = vpy.unit
-            if unit in (SVGLength.TYPE_PERCENTAGE, SVGLength.TYPE_VH):
-                vpy = vpy.value(SVGLength.TYPE_PERCENTAGE) / 100 * vph
-            elif unit == SVGLength.TYPE_VW:
-                vpy = vpy.value(SVGLength.TYPE_PERCENTAGE) / 100 * vpw
-            elif unit == SVGLength.TYPE_VMAX:
-                vpy = max(vpw, vph)
-            elif unit == SVGLength.TYPE_VMIN:
-                vpy = min(vpw, vph)
+            vpx, vpy = _get_viewport_position(roots[-1], vpw, vph)
+            vpx = _copy_length(vpx, SVGLength.DIRECTION_HORIZONTAL)
+            vpy = _copy_length(vpy, SVGLength.DIRECTION_VERTICAL)
+        vpw = _copy_length(vpw, SVGLength.DIRECTION_HORIZONTAL)
+        vph = _copy_length(vph, SVGLength.DIRECTION_VERTICAL)
 
         # TODO: check a range: max-width, max-height, min-width and min-height.
         return vpx, vpy, vpw, vph
@@ -352,10 +743,10 @@ class SVGGraphicsElement(SVGElement):
         # <transform-list> = <transform-function>+
         # Initial: none
         # Inherited: no
-        transform = self.get('transform')
-        if transform is None or transform == 'none':
+        parsed = _get_parsed_transform_list(self)
+        if parsed is None:
             return None
-        return SVGTransformList.parse(transform)
+        return parsed.to_transform_list()
 
     @transform.setter
     def transform(self, transform):
@@ -398,18 +789,20 @@ class SVGGraphicsElement(SVGElement):
             vtm = root.get_viewport_transformation_matrix(recursive=False)
             ctm *= vtm
 
-        transform_list = SVGTransformList()
+        matrices = list()
         element = self
         while element is not None:
             if element.istransformable():
-                transform = element.transform
-                if transform is not None:
-                    transform_list[0:0] = transform
+                parsed = _get_parsed_transform_list(element)
+                if parsed is not None:
+                    matrices[0:0] = parsed.matrices
             if element.local_name in ('svg', 'symbol'):
                 break
             element = element.getparent()
-        if len(transform_list) > 0:
-            matrix = transform_list.matrix
+        if len(matrices) > 0:
+            matrix = DOMMatrix()
+            for transform_matrix in matrices:
+                matrix *= transform_matrix
             ctm *= matrix
         return ctm
 
@@ -435,10 +828,9 @@ class SVGGraphicsElement(SVGElement):
                         continue
                     bbox |= child.get_bbox(options, _depth)
             if _depth > 1:
-                transform_list = self.transform  # type: SVGTransformList
-                if transform_list is not None:
-                    matrix = transform_list.matrix
-                    bbox.transform_self(matrix)
+                parsed = _get_parsed_transform_list(self)
+                if parsed is not None:
+                    bbox.transform_self(parsed.matrix)
         else:
             settings = SVGPathDataSettings()
             settings.normalize = True
@@ -455,6 +847,11 @@ class SVGGraphicsElement(SVGElement):
         Returns:
             DOMMatrix: The current transformation matrix (CTM).
         """
+        doc = self.owner_document
+        if doc is not None and doc.ctm_resolver is not None:
+            ctm = doc.ctm_resolver.get_ctm(self)
+            if ctm is not None:
+                return ctm
         ctm = self._get_ctm(SVGElement.NEAREST_VIEWPORT)
         return ctm
 
@@ -486,6 +883,11 @@ class SVGGraphicsElement(SVGElement):
         Returns:
             DOMMatrix: The current transformation matrix (CTM).
         """
+        doc = self.owner_document
+        if doc is not None and doc.ctm_resolver is not None:
+            ctm = doc.ctm_resolver.get_screen_ctm(self)
+            if ctm is not None:
+                return ctm
         ctm = self._get_ctm(SVGElement.FARTHEST_VIEWPORT)
         return ctm
 
@@ -494,14 +896,12 @@ class SVGGraphicsElement(SVGElement):
         if len(path_data) == 0:
             return path_data
         if self.local_name == 'use':
-            transform_list = self.instance_root.transform
-            if transform_list is not None:
-                matrix = transform_list.matrix
-                path_data = PathParser.transform(path_data, matrix)
-        transform_list = self.transform  # type: SVGTransformList
-        if transform_list is not None:
-            matrix = transform_list.matrix
-            path_data = PathParser.transform(path_data, matrix)
+            parsed = _get_parsed_transform_list(self.instance_root)
+            if parsed is not None:
+                path_data = PathParser.transform(path_data, parsed.matrix)
+        parsed = _get_parsed_transform_list(self)
+        if parsed is not None:
+            path_data = PathParser.transform(path_data, parsed.matrix)
         return path_data
 
     def get_viewport_transformation_matrix(self, recursive=True):
@@ -520,50 +920,21 @@ class SVGGraphicsElement(SVGElement):
         if ew is None or eh is None:
             return ctm
         vbx, vby, vbw, vbh, par = view_box
-        align = par.align
-        if align == SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_UNKNOWN:
-            align = SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMIDYMID
-        meet_or_slice = par.meet_or_slice
-        if meet_or_slice == SVGPreserveAspectRatio.SVG_MEETORSLICE_UNKNOWN:
-            meet_or_slice = SVGPreserveAspectRatio.SVG_MEETORSLICE_MEET
-        sx = ew / vbw
-        sy = eh / vbh
-        if align != SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_NONE:
-            if meet_or_slice == SVGPreserveAspectRatio.SVG_MEETORSLICE_MEET:
-                if sx < sy:
-                    sy = sx
-                elif sx > sy:
-                    sx = sy
-            elif meet_or_slice == SVGPreserveAspectRatio.SVG_MEETORSLICE_SLICE:
-                if sx > sy:
-                    sy = sx
-                elif sx < sy:
-                    sx = sy
-        tx = ex - vbx * sx
-        ty = ey - vby * sy
-        if align in (SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMIDYMIN,
-                     SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMIDYMID,
-                     SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMIDYMAX):
-            # 'xMid'
-            tx += (ew - vbw * sx) / 2
-        if align in (SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMAXYMIN,
-                     SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMAXYMID,
-                     SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMAXYMAX):
-            # 'xMax'
-            tx += ew - vbw * sx
-        if align in (SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMINYMID,
-                     SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMIDYMID,
-                     SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMAXYMID):
-            # 'YMid'
-            ty += (eh - vbh * sy) / 2
-        if align in (SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMINYMAX,
-                     SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMIDYMAX,
-                     SVGPreserveAspectRatio.SVG_PRESERVEASPECTRATIO_XMAXYMAX):
-            # 'YMax'
-            ty += eh - vbh * sy
-        ctm.translate_self(tx.value(), ty.value())
-        ctm.scale_self(sx.value(tx.unit), sy.value(tx.unit))
-        return ctm
+        key = (_get_length_key(ex), _get_length_key(ey),
+               _get_length_key(ew), _get_length_key(eh),
+               _get_length_key(vbx), _get_length_key(vby),
+               _get_length_key(vbw), _get_length_key(vbh),
+               par.align, par.meet_or_slice)
+        if None in key:
+            return _get_viewport_transformation_matrix(
+                ex, ey, ew, eh, vbx, vby, vbw, vbh, par)
+        values = _viewport_matrix_cache.get(key)
+        if values is None:
+            matrix = _get_viewport_transformation_matrix(
+                ex, ey, ew, eh, vbx, vby, vbw, vbh, par)
+            values = matrix.a, matrix.b, matrix.c, matrix.d, matrix.e, matrix.f
+            _viewport_matrix_cache[key] = values
+        return DOMMatrix(list(values))
 
 
 class SVGFitToViewBox(Element):
@@ -610,6 +981,36 @@ class SVGFitToViewBox(Element):
 class SVGGeometryElement(SVGGraphicsElement):
     """Represents the [SVG2] SVGGeometryElement."""
 
+    _geometry_attributes = None
+    """tuple[str, ...]: The names of the length attributes that define the
+    geometry of the element, or None if the geometry is not defined by the
+    attributes of the element alone.
+    """
+
+    def _init(self):
+        super()._init()
+        self._path_length_index = None
+        self._path_length_key = None
+
+    def _get_geometry_key(self):
+        """Returns the texts of the attributes that define the geometry of
+        the element, or None if the geometry also depends on the context of
+        the element (e.g. percentages, font-relative lengths or 'inherit').
+        """
+        if self._geometry_attributes is None:
+            return None
+        key = tuple(self.get(name) for name in self._geometry_attributes)
+        for value in key:
+            if value is None or value == 'auto':
+                continue
+            try:
+                _, unit = SVGLength.parse(value)
+            except ValueError:
+                return None
+            if unit not in _CONTEXT_FREE_UNITS:
+                return None
+        return key
+
     def get_path_data(self, settings=None):
         """Returns a list of path segments that corresponds to the path data.
 
@@ -622,9 +1023,95 @@ class SVGGeometryElement(SVGGraphicsElement):
         """
         raise NotImplementedError  # implement in a subclass
 
+    def get_path_length_index(self):
+        """Returns the cumulative arc-length table of the path.
+        The table is built once and rebuilt when the attributes that define
+        the geometry of the element change. If the geometry depends on the
+        context of the element, the computed geometry is compared instead.
+
+        Returns:
+            PathLengthIndex: The cumulative arc-length table of the path.
+        """
+        key = self._get_geometry_key()
+        if key is None:
+            key = self.get_computed_geometry()
+        if self._path_length_index is None or key != self._path_length_key:
+            self._path_length_index = PathLengthIndex(self.get_path_data())
+            self._path_length_key = key
+        return self._path_length_index
+
+    def get_path_segment_at_length(self, distance):
+        """Returns the index of the path segment at the distance along the
+        path.
+
+        Arguments:
+            distance (float): The distance along the path.
+        Returns:
+            int: The index of the path segment in the list returned by
+                get_path_data().
+        """
+        return self.get_path_length_index().get_segment_at_length(distance)
+
+    def get_path_segments_at_lengths(self, distances):
+        """Returns the indices of the path segments at the distances along
+        the path.
+
+        Arguments:
+            distances (list[float] | numpy.ndarray): The distances along the
+                path.
+        Returns:
+            numpy.ndarray: The indices of the path segments in the list
+                returned by get_path_data().
+        """
+        return self.get_path_length_index().get_segments_at_lengths(distances)
+
     def get_point_at_length(self, distance):
-        # TODO: implement SVGGeometryElement.getPointAtLength().
-        pass
+        """Returns the point at the distance along the path.
+
+        Arguments:
+            distance (float): The distance along the path. It is clamped to
+                the range from 0 to the total length of the path.
+        Returns:
+            tuple[float, float]: The absolute coordinates of the point.
+        """
+        return self.get_path_length_index().get_point_at_length(distance)
+
+    def get_points_at_lengths(self, distances):
+        """Returns the points at the distances along the path.
+
+        Arguments:
+            distances (list[float] | numpy.ndarray): The distances along the
+                path. They are clamped to the range from 0 to the total length
+                of the path.
+        Returns:
+            numpy.ndarray: An array of shape (n, 2) of the absolute
+                coordinates of the points.
+        """
+        return self.get_path_length_index().get_points_at_lengths(distances)
+
+    def get_tangent_at_length(self, distance):
+        """Returns the direction of the path at the distance along the path.
+
+        Arguments:
+            distance (float): The distance along the path. It is clamped to
+                the range from 0 to the total length of the path.
+        Returns:
+            float: The angle of the tangent from the x-axis in degrees.
+        """
+        return self.get_path_length_index().get_tangent_at_length(distance)
+
+    def get_tangents_at_lengths(self, distances):
+        """Returns the directions of the path at the distances along the path.
+
+        Arguments:
+            distances (list[float] | numpy.ndarray): The distances along the
+                path. They are clamped to the range from 0 to the total length
+                of the path.
+        Returns:
+            numpy.ndarray: The angles of the tangents from the x-axis in
+                degrees.
+        """
+        return self.get_path_length_index().get_tangents_at_lengths(distances)
 
     def get_total_length(self):
         """Returns the total length of the path.
@@ -632,10 +1119,7 @@ class SVGGeometryElement(SVGGraphicsElement):
         Returns:
             float: The total length of the path.
         """
-        path_data = self.get_path_data()
-        if len(path_data) == 0:
-            return 0
-        return PathParser.get_total_length(path_data)
+        return self.get_path_length_index().total_length
 
 
 class SVGPathData(Element):
@@ -13,13 +13,12 @@
 # limitations under the License.
 
 
-import copy
 import html
 import math
 import re
 import shlex
+import sys
 import unicodedata
-from decimal import Decimal, InvalidOperation
 
 import numpy as np
 
@@ -27,6 +26,39 @@ from .css.screen import Screen
 from .fontconfig import FontConfig
 from .formatter import format_number_sequence
 from .freetype import FreeType, FTFace
+from .utils import LRUCache
+
+_KEEP_UNIT = object()
+
+_UNKNOWN_PLACES = object()
+
+
+def _decimal_places(number):
+    # the number of decimal places of a short decimal value (e.g. 0.25 -> 2),
+    # or None
+    text = repr(number)
+    if 'e' in text or 'n' in text:
+        return None  # exponent, inf or nan
+    integer, _, fraction = text.lstrip('-').partition('.')
+    if fraction == '0':
+        fraction = ''
+    if len((integer + fraction).lstrip('0')) > 15:
+        return None
+    return len(fraction)
+
+
+def _add(a, places_a, b, places_b):
+    """Returns a + b and its number of decimal places. The sum of two short
+    decimal values is exact as well as the decimal arithmetic, e.g.
+    0.1 + 0.2 = 0.3 instead of 0.30000000000000004.
+    """
+    number = a + b
+    if places_a is None or places_b is None:
+        if abs(number) <= 8 * sys.float_info.epsilon * max(abs(a), abs(b)):
+            number = 0.0  # below the precision of the operands
+        return number, None
+    places = max(places_a, places_b)
+    return round(number, places), places
 
 
 class CSSUtils(object):
@@ -1008,14 +1040,31 @@ class SVGLength(object):
     # 1pc = 1in/6
     _TO_PIXEL_SIZE_MAP = {
         TYPE_PX: 1.0,
-        TYPE_IN: Decimal(96),
-        TYPE_CM: Decimal(96) / Decimal(2.54),
-        TYPE_MM: Decimal(96) / Decimal(25.4),
-        TYPE_Q: Decimal(96) / Decimal(2.54) / Decimal(40),
-        TYPE_PT: Decimal(96) / Decimal(72),
-        TYPE_PC: Decimal(96) / Decimal(6),
+        TYPE_IN: 96.0,
+        TYPE_CM: 96 / 2.54,
+        TYPE_MM: 96 / 25.4,
+        TYPE_Q: 96 / 2.54 / 40,
+        TYPE_PT: 96 / 72,
+        TYPE_PC: 96 / 6,
     }
 
+    # (numerator, denominator) of _TO_PIXEL_SIZE_MAP: multiplying first
+    # keeps the conversions of the decimal values exact, e.g. 14pt = 1344/72px
+    _TO_PIXEL_RATIO_MAP = {
+        TYPE_PX: (1.0, 1.0),
+        TYPE_IN: (96.0, 1.0),
+        TYPE_CM: (96.0, 2.54),
+        TYPE_MM: (96.0, 25.4),
+        TYPE_Q: (96.0, 101.6),
+        TYPE_PT: (96.0, 72.0),
+        TYPE_PC: (96.0, 6.0),
+    }
+
+    # attribute text -> (number, unit)
+    _parse_cache = LRUCache(maxsize=4096)
+
+    __slots__ = ('_context', '_direction', '_number', '_places', '_unit')
+
     def __init__(self, value=None, unit=None, context=None, direction=None):
         """Constructs a SVGLength object.
 
@@ -1049,25 +1098,25 @@ class SVGLength(object):
             self.new_value(value, unit)
         else:
             self._number, self._unit = SVGLength.parse(value)
+            self._places = _UNKNOWN_PLACES
 
     def __abs__(self):
-        x = copy.deepcopy(self)
-        x._number = abs(x._number)
-        return x
+        return self._new(abs(self._number))
 
     def __add__(self, other):
         if not isinstance(other, SVGLength):
             return NotImplemented
-        x = copy.deepcopy(self)
-        if x._unit is None and other.unit is not None:
-            x.convert(other.unit)
-        x._number += Decimal(other.value(x._unit))
-        return x
+        unit = self._get_common_unit(other)
+        return self._new(*_add(self.value(unit),
+                               self._get_decimal_places(unit),
+                               other.value(unit),
+                               other._get_decimal_places(unit)),
+                         unit=unit)
 
     def __eq__(self, other):
         if not isinstance(other, SVGLength):
             return NotImplemented
-        o = Decimal(other.value(self._unit))
+        o = other.value(self._unit)
         return math.isclose(self._number, o,
                             rel_tol=SVGLength.rel_tol,
                             abs_tol=SVGLength.abs_tol)
@@ -1075,7 +1124,7 @@ class SVGLength(object):
     def __ge__(self, other):
         if not isinstance(other, SVGLength):
             return NotImplemented
-        o = Decimal(other.value(self._unit))
+        o = other.value(self._unit)
         if math.isclose(self._number, o,
                         rel_tol=SVGLength.rel_tol, abs_tol=SVGLength.abs_tol):
             return True
@@ -1084,7 +1133,7 @@ class SVGLength(object):
     def __gt__(self, other):
         if not isinstance(other, SVGLength):
             return NotImplemented
-        o = Decimal(other.value(self._unit))
+        o = other.value(self._unit)
         if math.isclose(self._number, o,
                         rel_tol=SVGLength.rel_tol, abs_tol=SVGLength.abs_tol):
             return False
@@ -1095,18 +1144,23 @@ class SVGLength(object):
             return NotImplemented
         if self._unit is None and other.unit is not None:
             self.convert(other.unit)
-        self._number += Decimal(other.value(self._unit))
+        self._number, self._places = _add(
+            self._number,
+            self._get_decimal_places(self._unit),
+            other.value(self._unit),
+            other._get_decimal_places(self._unit))
         return self
 
     def __imul__(self, other):
         if isinstance(other, SVGLength):
             if self._unit is None and other.unit is not None:
                 self.convert(other.unit)
-            self._number *= Decimal(other.value(self._unit))
+            self._number *= other.value(self._unit)
         elif isinstance(other, (int, float)):
-            self._number *= Decimal(other)
+            self._number *= other
         else:
             return NotImplemented
+        self._places = _UNKNOWN_PLACES
         return self
 
     def __isub__(self, other):
@@ -1114,24 +1168,29 @@ class SVGLength(object):
             return NotImplemented
         if self._unit is None and other.unit is not None:
             self.convert(other.unit)
-        self._number -= Decimal(other.value(self._unit))
+        self._number, self._places = _add(
+            self._number,
+            self._get_decimal_places(self._unit),
+            -other.value(self._unit),
+            other._get_decimal_places(self._unit))
         return self
 
     def __itruediv__(self, other):
         if isinstance(other, SVGLength):
             if self._unit is None and other.unit is not None:
                 self.convert(other.unit)
-            self._number /= Decimal(other.value(self._unit))
+            self._number /= other.value(self._unit)
         elif isinstance(other, (int, float)):
-            self._number /= Decimal(other)
+            self._number /= other
         else:
             return NotImplemented
+        self._places = _UNKNOWN_PLACES
         return self
 
     def __le__(self, other):
         if not isinstance(other, SVGLength):
             return NotImplemented
-        o = Decimal(other.value(self._unit))
+        o = other.value(self._unit)
         if math.isclose(self._number, o,
                         rel_tol=SVGLength.rel_tol, abs_tol=SVGLength.abs_tol):
             return True
@@ -1140,37 +1199,33 @@ class SVGLength(object):
     def __lt__(self, other):
         if not isinstance(other, SVGLength):
             return NotImplemented
-        o = Decimal(other.value(self._unit))
+        o = other.value(self._unit)
         if math.isclose(self._number, o,
                         rel_tol=SVGLength.rel_tol, abs_tol=SVGLength.abs_tol):
             return False
         return self._number < o
 
     def __mul__(self, other):
-        x = copy.deepcopy(self)
         if isinstance(other, SVGLength):
-            if x._unit is None and other.unit is not None:
-                x.convert(other.unit)
-            x._number *= Decimal(other.value(x._unit))
+            unit = self._get_common_unit(other)
+            return self._new(self.value(unit) * other.value(unit), unit=unit)
         elif isinstance(other, (int, float)):
-            x._number *= Decimal(other)
-        else:
-            return NotImplemented
-        return x
+            return self._new(self._number * other)
+        return NotImplemented
 
     def __neg__(self):
-        x = copy.deepcopy(self)
-        x._number = -x._number
-        return x
+        return self._new(-self._number)
 
     def __pos__(self):
-        x = copy.deepcopy(self)
-        return x
+        return self._new(self._number)
 
     def __pow__(self, power, modulo=None):
-        x = copy.deepcopy(self)
-        x._number = pow(x._number, power, modulo)
-        return x
+        if modulo is None:
+            return self._new(pow(self._number, power))
+        if not self._number.is_integer():
+            raise ValueError('pow() 3rd argument not allowed unless all'
+                             ' arguments are integers')
+        return self._new(float(pow(int(self._number), power, modulo)))
 
     def __repr__(self):
         return '<{}.{} object at {} ({:g} {})>'.format(
@@ -1181,28 +1236,56 @@ class SVGLength(object):
         return self.__mul__(other)
 
     def __str__(self):
-        return '{:g}{}'.format(self._number,
-                               self._unit if self._unit is not None else '')
+        number = '{:.15g}'.format(self._number)
+        if 'e' in number:
+            number = np.format_float_positional(float(number), trim='-')
+        if number == '-0':
+            number = '0'
+        return '{}{}'.format(number,
+                             self._unit if self._unit is not None else '')
 
     def __sub__(self, other):
         if not isinstance(other, SVGLength):
             return NotImplemented
-        x = copy.deepcopy(self)
-        if x._unit is None and other.unit is not None:
-            x.convert(other.unit)
-        x._number -= Decimal(other.value(x._unit))
-        return x
+        unit = self._get_common_unit(other)
+        return self._new(*_add(self.value(unit),
+                               self._get_decimal_places(unit),
+                               -other.value(unit),
+                               other._get_decimal_places(unit)),
+                         unit=unit)
 
     def __truediv__(self, other):
-        x = copy.deepcopy(self)
         if isinstance(other, SVGLength):
-            if x._unit is None and other.unit is not None:
-                x.convert(other.unit)
-            x._number /= Decimal(other.value(x._unit))
+            unit = self._get_common_unit(other)
+            return self._new(self.value(unit) / other.value(unit), unit=unit)
         elif isinstance(other, (int, float)):
-            x._number /= Decimal(other)
-        else:
-            return NotImplemented
+            return self._new(self._number / other)
+        return NotImplemented
+
+    def _get_common_unit(self, other):
+        if self._unit is None and other.unit is not None:
+            return other.unit
+        return self._unit
+
+    def _get_decimal_places(self, unit):
+        # the number of decimal places of the value in the unit, or None
+        if unit != self._unit:
+            return _decimal_places(self.value(unit))
+        places = self._places
+        if places is _UNKNOWN_PLACES:
+            places = self._places = _decimal_places(self._number)
+        return places
+
+    def _new(self, number, places=_UNKNOWN_PLACES, unit=_KEEP_UNIT):
+        """Returns a new SVGLength object that shares the context and the
+        direction of this object.
+        """
+        x = SVGLength.__new__(type(self))
+        x._context = self._context
+        x._direction = self._direction
+        x._number = number
+        x._places = places
+        x._unit = self._unit if unit is _KEEP_UNIT else unit
         return x
 
     @property
@@ -1221,9 +1304,9 @@ class SVGLength(object):
             if unit not in SVGLength.SUPPORTED_UNITS:
                 raise ValueError('Unknown unit: ' + repr(unit))
         try:
-            return Decimal(number).normalize(), unit
-        except InvalidOperation:
-            return Decimal(0), unit
+            return float(number), unit
+        except (TypeError, ValueError):
+            return 0.0, unit
 
     def convert(self, unit):
         """Resets the stored unit.
@@ -1233,7 +1316,8 @@ class SVGLength(object):
         """
         if unit == self._unit:
             return
-        self._number = Decimal(self.value(unit))
+        self._number = self.value(unit)
+        self._places = _UNKNOWN_PLACES
         self._unit = unit
 
     def isabsolute(self):
@@ -1264,31 +1348,38 @@ class SVGLength(object):
             number (float): The new value.
             unit (str): The unit string.
         """
-        self._number = Decimal(number)
+        self._number = float(number)
+        self._places = _UNKNOWN_PLACES
         self._unit = unit
 
     @staticmethod
     def parse(text):
         if text is None:
-            return Decimal(0), None
+            return 0.0, None
         elif isinstance(text, str):
+            cache = SVGLength._parse_cache
+            value = cache.get(text)
+            if value is not None:
+                return value
             match = SVGLength.RE_LENGTH.match(text.strip())
             if match is None:
                 raise ValueError('Expected number, got \'{}\''.format(text))
             number = match.group('number')
             unit = match.group('unit')
-        else:
-            number = text
-            unit = None
-        return SVGLength._normalize(number, unit)
+            value = SVGLength._normalize(number, unit)
+            cache[text] = value
+            return value
+        return SVGLength._normalize(text, None)
 
-    def tostring(self, unit=None, direction=None):
+    def tostring(self, unit=None, direction=None, resolver=None):
         """Returns a string with the unit, formatted according to the specified
         precision.
 
         Arguments:
             unit (str, optional): The unit string.
             direction (int, optional): The direction of this length value.
+            resolver (LengthResolver, optional): The resolution context of
+                the relative lengths.
         Returns:
             str: The value in specified unit.
         Examples:
@@ -1309,17 +1400,20 @@ class SVGLength(object):
         """
         if unit is None:
             unit = self._unit
-        number = self.value(unit, direction=direction)
+        number = self.value(unit, direction=direction, resolver=resolver)
         value = format_number_sequence([number])[0]
         return '{0}{1}'.format(value, unit if unit is not None else '')
 
-    def value(self, unit=None, direction=None):
+    def value(self, unit=None, direction=None, resolver=None):
         """Returns the value in specified unit, or in pixels if the unit is
         None or SVGLength.TYPE_NUMBER.
 
         Arguments:
             unit (str, optional): The unit string.
             direction (int, optional): The direction of this length value.
+            resolver (LengthResolver, optional): The resolution context of
+                the relative lengths. If None, the font sizes and the viewport
+                size are computed from the referencing element.
         Returns:
             float: The value in specified unit.
         Examples:
@@ -1353,13 +1447,11 @@ class SVGLength(object):
         vmin = None
         vmax = None
         font = None
+        if resolver is None:
+            resolver = LengthResolver(self._context)
         if self._unit == SVGLength.TYPE_REMS or unit == SVGLength.TYPE_REMS:
             # <font-relative lengths>: rem
-            if self._context is None:
-                root_font_size = Decimal(Font.default_font_size)
-            else:
-                root = self._context.getroottree().getroot()
-                root_font_size = Decimal(CSSUtils.compute_font_size(root))
+            root_font_size = resolver.root_font_size
 
         if (self._unit in [SVGLength.TYPE_EMS, SVGLength.TYPE_PERCENTAGE,
                            SVGLength.TYPE_EXS, SVGLength.TYPE_CAPS,
@@ -1371,15 +1463,7 @@ class SVGLength(object):
             # <font-relative lengths>: em
             # <font-percentage lengths>: %
             # falls back for 'ex' | 'cap' | 'ch' | 'ic' units
-            if self._context is None:
-                element_font_size = Decimal(Font.default_font_size)
-            else:
-                context = self._context.getparent()
-                if context is None:
-                    element_font_size = Decimal(Font.default_font_size)
-                else:
-                    element_font_size = Decimal(
-                        CSSUtils.compute_font_size(context))
+            element_font_size = resolver.font_size
 
         if (self._unit in [SVGLength.TYPE_VW, SVGLength.TYPE_VH,
                            SVGLength.TYPE_VMIN, SVGLength.TYPE_VMAX,
@@ -1388,19 +1472,7 @@ class SVGLength(object):
                             SVGLength.TYPE_VMIN, SVGLength.TYPE_VMAX,
                             SVGLength.TYPE_PERCENTAGE]):
             # <viewport-percentage lengths>: % | vw | vh | vmin | vmax
-            if self._context is None:
-                vw = 100
-                vh = 100
-            else:
-                view_box = self._context.get_view_box()
-                if view_box is not None:
-                    _, _, vbw, vbh, _ = view_box
-                    vw = vbw.value()
-                    vh = vbh.value()
-                else:
-                    _, _, vpw, vph = self._context.get_viewport_size()
-                    vw = vpw.value()
-                    vh = vph.value()
+            vw, vh = resolver.viewport_size
             vmin = min(vw, vh)
             vmax = max(vw, vh)
 
@@ -1426,12 +1498,12 @@ class SVGLength(object):
             # <viewport-percentage lengths> | <font-percentage lengths>:
             # percentage units to pixels
             if direction == SVGLength.DIRECTION_HORIZONTAL:
-                px = self._number * Decimal(vw) / 100
+                px = self._number * float(vw) / 100
             elif direction == SVGLength.DIRECTION_VERTICAL:
-                px = self._number * Decimal(vh) / 100
+                px = self._number * float(vh) / 100
             elif direction == SVGLength.DIRECTION_UNSPECIFIED:
                 k = math.sqrt(vw ** 2 + vh ** 2) / math.sqrt(2)
-                px = self._number * Decimal(k) / 100
+                px = self._number * float(k) / 100
             else:
                 px = self._number * element_font_size / 100
         elif self._unit in [SVGLength.TYPE_EXS, SVGLength.TYPE_CAPS,
@@ -1449,7 +1521,7 @@ class SVGLength(object):
                     k = font.ch_advance
                 else:  # self._unit == SVGLength.TYPE_ICS:
                     k = font.ic_advance
-                val = Decimal(k)
+                val = float(k)
                 if val == 0:
                     val = element_font_size
                 px = self._number * val
@@ -1465,22 +1537,22 @@ class SVGLength(object):
                 k = vmin
             else:  # self._unit == SVGLength.TYPE_VMAX:
                 k = vmax
-            px = self._number * Decimal(k) / 100
+            px = self._number * float(k) / 100
         elif self._unit in [SVGLength.TYPE_DPI, SVGLength.TYPE_DPCM,
                             SVGLength.TYPE_DPPX]:
             # <resolution lengths> units to 'dppx'
             if self._unit == SVGLength.TYPE_DPI:
-                px = self._number / Decimal(96)
+                px = self._number / float(96)
             elif self._unit == SVGLength.TYPE_DPCM:
-                px = self._number / Decimal(96) * Decimal(2.54)
+                px = self._number / float(96) * float(2.54)
             else:  # self._unit == SVGLength.TYPE_DPPX
                 px = self._number
         else:
             # <absolute lengths> units to pixels
-            k = SVGLength._TO_PIXEL_SIZE_MAP.get(self._unit)
-            if k is None:
+            ratio = SVGLength._TO_PIXEL_RATIO_MAP.get(self._unit)
+            if ratio is None:
                 raise NotImplementedError('Unknown unit: ' + repr(self._unit))
-            px = self._number * k
+            px = self._number * ratio[0] / ratio[1]
 
         # convert to specified units
         if unit in [None, SVGLength.TYPE_NUMBER, SVGLength.TYPE_PX]:
@@ -1497,12 +1569,12 @@ class SVGLength(object):
         elif unit in [SVGLength.TYPE_PERCENTAGE]:
             # to <viewport-percentage lengths> | <font-percentage lengths>
             if direction == SVGLength.DIRECTION_HORIZONTAL:
-                px /= Decimal(vw)
+                px /= float(vw)
             elif direction == SVGLength.DIRECTION_VERTICAL:
-                px /= Decimal(vh)
+                px /= float(vh)
             elif direction == SVGLength.DIRECTION_UNSPECIFIED:
                 k = math.sqrt(vw ** 2 + vh ** 2) / math.sqrt(2)
-                px /= Decimal(k)
+                px /= float(k)
             else:
                 px /= element_font_size
             return float(px * 100)
@@ -1534,7 +1606,7 @@ class SVGLength(object):
                     k = font.ch_advance
                 else:  # unit == SVGLength.TYPE_ICS:
                     k = font.ic_advance
-                val = Decimal(k)
+                val = float(k)
                 if val == 0:
                     val = element_font_size
                 px /= val
@@ -1551,18 +1623,125 @@ class SVGLength(object):
                 k = vmin
             else:  # unit == SVGLength.TYPE_VMAX:
                 k = vmax
-            return float(px / Decimal(k) * 100)
+            return float(px / float(k) * 100)
         elif unit in [SVGLength.TYPE_DPI, SVGLength.TYPE_DPCM,
                       SVGLength.TYPE_DPPX]:
             # 'dppx' to <resolution lengths> 'dpi' | 'dpcm'
             if unit == SVGLength.TYPE_DPI:
-                px *= Decimal(96)
+                px *= float(96)
             elif unit == SVGLength.TYPE_DPCM:
-                px *= Decimal(96) / Decimal(2.54)
+                px *= float(96) / float(2.54)
             return float(px)
 
         # to <absolute lengths> units
-        k = SVGLength._TO_PIXEL_SIZE_MAP.get(unit)
-        if k is None:
+        ratio = SVGLength._TO_PIXEL_RATIO_MAP.get(unit)
+        if ratio is None:
             raise NotImplementedError('Unknown unit: ' + repr(unit))
-        return float(px / k)
+        return float(px * ratio[1] / ratio[0])
+
+
+class LengthResolver(object):
+    """Represents the resolution context of the relative lengths of an
+    element.
+
+    The font size, the root font size and the viewport size are computed
+    once when first needed, and shared by all lengths resolved with this
+    object.
+    """
+
+    __slots__ = ('_context', '_font_size', '_root_font_size',
+                 '_viewport_size')
+
+    def __init__(self, context=None):
+        """Constructs a LengthResolver object.
+
+        Arguments:
+            context (SVGElement, optional): The referencing element.
+        Examples:
+            >>> resolver = LengthResolver(rect)
+            >>> x = resolver.value(rect.get('x'),
+            ...                    direction=SVGLength.DIRECTION_HORIZONTAL)
+            >>> width = resolver.value(rect.get('width'),
+            ...                        direction=SVGLength.DIRECTION_HORIZONTAL)
+        """
+        self._context = context
+        self._font_size = None
+        self._root_font_size = None
+        self._viewport_size = None
+
+    @property
+    def context(self):
+        """SVGElement: The referencing element."""
+        return self._context
+
+    @property
+    def font_size(self):
+        """float: The font size of the parent of the referencing element, in
+        pixels.
+        """
+        if self._font_size is None:
+            parent = (self._context.getparent()
+                      if self._context is not None else None)
+            if parent is None:
+                self._font_size = float(Font.default_font_size)
+            else:
+                self._font_size = float(CSSUtils.compute_font_size(parent))
+        return self._font_size
+
+    @property
+    def root_font_size(self):
+        """float: The font size of the root element, in pixels."""
+        if self._root_font_size is None:
+            if self._context is None:
+                self._root_font_size = float(Font.default_font_size)
+            else:
+                root = self._context.getroottree().getroot()
+                self._root_font_size = float(
+                    CSSUtils.compute_font_size(root))
+        return self._root_font_size
+
+    @property
+    def viewport_size(self):
+        """tuple[float, float]: The width and height of the viewport that the
+        percentage lengths refer to, in pixels.
+        """
+        if self._viewport_size is None:
+            if self._context is None:
+                self._viewport_size = 100, 100
+            else:
+                view_box = self._context.get_view_box()
+                if view_box is not None:
+                    _, _, vbw, vbh, _ = view_box
+                    self._viewport_size = vbw.value(), vbh.value()
+                else:
+                    _, _, vpw, vph = self._context.get_viewport_size()
+                    self._viewport_size = vpw.value(), vph.value()
+        return self._viewport_size
+
+    def with_context(self, context):
+        """Returns a LengthResolver object for the specified element.
+
+        Arguments:
+            context (SVGElement): The referencing element.
+        Returns:
+            LengthResolver: This object if the context is the same element,
+                otherwise a new LengthResolver object.
+        """
+        if context is self._context:
+            return self
+        return LengthResolver(context)
+
+    def value(self, length, direction=None, unit=None):
+        """Returns the value of a length in specified unit, or in pixels if
+        the unit is None.
+
+        Arguments:
+            length (str, float, SVGLength): A length.
+            direction (int, optional): The direction of the length value.
+            unit (str, optional): The unit string.
+        Returns:
+            float: The value in specified unit.
+        """
+        if not isinstance(length, SVGLength):
+            length = SVGLength(length, context=self._context)
+        return length.value(unit, direction=direction, resolver=self)
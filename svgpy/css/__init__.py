@@ -20,7 +20,10 @@ from collections.abc import MutableMapping, MutableSequence
 from logging import getLogger
 from urllib.error import URLError
 
+import cssselect
 import tinycss2
+from lxml import etree
+from lxml.cssselect import LxmlTranslator
 
 from .longhands import Longhand
 from .props import PropertyDescriptor, PropertySyntax, \
@@ -35,7 +38,7 @@ from .types import CSSKeywordValue, CSSImageValue, CSSMathClamp, \
     StylePropertyMap, StylePropertyMapReadOnly, UnitType
 from ..exception import NoModificationAllowedError
 from ..utils import CaseInsensitiveMapping, dict_to_style, get_content_type, \
-    load, normalize_url, style_to_dict
+    get_resource_loader, normalize_url, style_to_dict
 
 _RE_COLLAPSIBLE_WHITESPACE = re.compile(r'(\x20){2,}')
 
@@ -1119,7 +1122,8 @@ class CSSFontFeatureValuesRule(CSSRule):
 class CSSImportRule(CSSRule):
     """Represents the '@import' at-rule."""
 
-    def __init__(self, rule, parent_style_sheet=None, parent_rule=None):
+    def __init__(self, rule, parent_style_sheet=None, parent_rule=None,
+                 loader=None):
         """Constructs a CSSImportRule object.
 
         Arguments:
@@ -1127,6 +1131,8 @@ class CSSImportRule(CSSRule):
             parent_style_sheet (CSSStyleSheet, optional): The parent CSS style
                 sheet.
             parent_rule (CSSRule, optional): The parent CSS rule.
+            loader (ResourceLoader, optional): A resource loader to load the
+                imported style sheet.
         """
         super().__init__(rule,
                          CSSRule.IMPORT_RULE,
@@ -1135,7 +1141,7 @@ class CSSImportRule(CSSRule):
         self._href = None
         self._media = MediaList()
         self._style_sheet = None
-        self._parse_prelude(rule.prelude)
+        self._parse_prelude(rule.prelude, loader)
 
     def __repr__(self):
         return repr({
@@ -1146,10 +1152,24 @@ class CSSImportRule(CSSRule):
             }
         })
 
-    def _parse_prelude(self, prelude):
+    def _get_import_chain(self):
+        """Returns the URLs of the style sheets that import this rule."""
+        urls = set()
+        css_style_sheet = self.parent_style_sheet
+        while css_style_sheet is not None:
+            if css_style_sheet.location is not None:
+                urls.add(css_style_sheet.location)
+            owner_rule = css_style_sheet.owner_rule
+            css_style_sheet = (owner_rule.parent_style_sheet
+                               if owner_rule is not None else None)
+        return urls
+
+    def _parse_prelude(self, prelude, loader=None):
         if self.parent_style_sheet is not None:
             owner_node = self.parent_style_sheet.owner_node
-            base_url = self.parent_style_sheet.href
+            base_url = self.parent_style_sheet.location
+            if base_url is None:
+                base_url = self.parent_style_sheet.href
             if base_url is None and owner_node is not None:
                 doc = owner_node.owner_document
                 if doc is not None:
@@ -1167,14 +1187,22 @@ class CSSImportRule(CSSRule):
                 mediums.append(token)
         if len(mediums) > 0:
             self._media.media_text = tinycss2.serialize(mediums)
-        if self._href is None:
+        if self._href is not None and self._href in self._get_import_chain():
+            logger = getLogger('{}.{}'.format(__name__,
+                                              self.__class__.__name__))
+            logger.info('circular import: \'{}\''.format(self._href))
+            self._style_sheet = CSSStyleSheet(owner_node=owner_node,
+                                              media=self._media.media_text,
+                                              owner_rule=self)
+        elif self._href is None:
             self._style_sheet = CSSStyleSheet(owner_node=owner_node,
                                               media=self._media.media_text,
                                               owner_rule=self)
         else:
             self._style_sheet = CSSParser.parse(self._href,
                                                 owner_node=owner_node,
-                                                parent_rule=self)
+                                                parent_rule=self,
+                                                loader=loader)
 
     @property
     def href(self):
@@ -1583,6 +1611,42 @@ class CSSStyleDeclaration(MutableMapping):
         return self._declarations().values()
 
 
+class _ElementTranslator(LxmlTranslator):
+    """Translates a selector into an XPath expression that is anchored at
+    the subject element of the selector.
+    """
+
+    _COMBINATOR_AXES = {
+        ' ': 'ancestor::',
+        '>': 'parent::',
+        '~': 'preceding-sibling::',
+    }
+
+    def selector_to_xpath(self, selector, prefix='descendant-or-self::',
+                          translate_pseudo_elements=True):
+        if translate_pseudo_elements and selector.pseudo_element:
+            raise cssselect.ExpressionError(
+                'Pseudo-elements are not supported.')
+        return (prefix or '') + str(self._to_xpath(selector.parsed_tree))
+
+    def _to_xpath(self, tree):
+        if not isinstance(tree, cssselect.parser.CombinedSelector):
+            xpath = self.xpath(tree)
+            xpath.path = ''
+            return xpath
+        xpath = self._to_xpath(tree.subselector)
+        left = self._to_xpath(tree.selector)
+        if tree.combinator == '+':
+            step = 'preceding-sibling::*[1]'
+            if left.element != '*':
+                step += '[self::{}]'.format(left.element)
+        else:
+            step = self._COMBINATOR_AXES[tree.combinator] + left.element
+        if left.condition:
+            step += '[{}]'.format(left.condition)
+        return xpath.add_condition(step)
+
+
 class CSSStyleRule(CSSRule):
     """Represents a style rule."""
 
@@ -1601,6 +1665,7 @@ class CSSStyleRule(CSSRule):
                          parent_rule=parent_rule)
         self._selector_text = normalize_text(tinycss2.serialize(rule.prelude))
         self._style = CSSStyleDeclaration(rule, parent_rule=self)
+        self._matchers = dict()
 
     def __repr__(self):
         return repr({
@@ -1610,6 +1675,102 @@ class CSSStyleRule(CSSRule):
             }
         })
 
+    def _compile(self, namespaces, whole_tree):
+        # A selector is tested on the element itself ('self::'); combinators
+        # are translated into conditions on the ancestors and preceding
+        # siblings of the element. A whole-tree selector uses the
+        # 'descendant-or-self::' axis instead.
+        translator = _ElementTranslator()
+        prefix = 'descendant-or-self::' if whole_tree else 'self::'
+        paths = [translator.selector_to_xpath(selector, prefix=prefix)
+                 for selector in cssselect.parse(self._selector_text)]
+        return etree.XPath(' | '.join(paths), namespaces=namespaces)
+
+    def _get_compiled(self, namespaces, whole_tree):
+        key = (whole_tree,
+               None if not namespaces else frozenset(namespaces.items()))
+        try:
+            return self._matchers[key]
+        except KeyError:
+            pass
+        matcher = None
+        try:
+            matcher = self._compile(namespaces, whole_tree)
+        except cssselect.ExpressionError as exp:
+            logger = getLogger(
+                '{}.{}'.format(__name__, type(self).__name__))
+            logger.info('ExpressionError: {}: \'{}\''.format(
+                exp,
+                self._selector_text))
+        except cssselect.SelectorSyntaxError as exp:
+            logger = getLogger(
+                '{}.{}'.format(__name__, type(self).__name__))
+            logger.info('SelectorSyntaxError: {}: \'{}\''.format(
+                exp,
+                self._selector_text))
+        self._matchers[key] = matcher
+        return matcher
+
+    def get_matcher(self, namespaces=None):
+        """Returns the compiled selector of the style rule that tests a single
+        element.
+        The compiled selector is cached per namespace map.
+
+        Arguments:
+            namespaces (dict, optional): A map of namespace prefixes to
+                namespace URIs.
+        Returns:
+            lxml.etree.XPath: The compiled selector, or None if the
+                selector is invalid or not supported.
+        """
+        return self._get_compiled(namespaces, False)
+
+    def get_selector(self, namespaces=None):
+        """Returns the compiled selector of the style rule that selects the
+        matching elements of a whole tree.
+        The compiled selector is cached per namespace map.
+
+        Arguments:
+            namespaces (dict, optional): A map of namespace prefixes to
+                namespace URIs.
+        Returns:
+            lxml.etree.XPath: The compiled selector, or None if the
+                selector is invalid or not supported.
+        """
+        return self._get_compiled(namespaces, True)
+
+    def matches(self, element, namespaces=None):
+        """Returns True if the element matches the selector of the style rule.
+
+        Arguments:
+            element (Element): An element to be tested.
+            namespaces (dict, optional): A map of namespace prefixes to
+                namespace URIs.
+        Returns:
+            bool: True if the element matches the selector.
+        """
+        matcher = self.get_matcher(namespaces)
+        if matcher is None:
+            return False
+        return element in matcher(element)
+
+    def select(self, root, namespaces=None):
+        """Finds all elements of the tree that match the selector of the style
+        rule.
+
+        Arguments:
+            root (Element): The root element of the tree.
+            namespaces (dict, optional): A map of namespace prefixes to
+                namespace URIs.
+        Returns:
+            list[Element]: A list of the matching elements in document
+                order.
+        """
+        selector = self.get_selector(namespaces)
+        if selector is None:
+            return []
+        return selector(root)
+
     @property
     def selector_text(self):
         """str: The associated group of selectors."""
@@ -1636,6 +1797,7 @@ class CSSStyleSheet(StyleSheet):
         super().__init__(**extra)
         self._owner_rule = owner_rule
         self._css_rules = list()
+        self._location = None
 
     def __repr__(self):
         return repr({
@@ -1647,6 +1809,13 @@ class CSSStyleSheet(StyleSheet):
             }
         })
 
+    @property
+    def location(self):
+        """str: The absolute URL that the style sheet was loaded from, or
+        None.
+        """
+        return self._location
+
     @property
     def owner_rule(self):
         """CSSRule: The owner CSS rule."""
@@ -1687,7 +1856,7 @@ class CSSStyleSheet(StyleSheet):
 class CSSParser(object):
     @classmethod
     def fromstring(cls, stylesheet, parent_style_sheet=None,
-                   parent_rule=None):
+                   parent_rule=None, loader=None):
         """Parses the CSS style sheet or fragment from a string.
 
         Arguments:
@@ -1695,6 +1864,8 @@ class CSSParser(object):
             parent_style_sheet (CSSStyleSheet, optional): The parent CSS style
                 sheet.
             parent_rule (CSSRule, optional): The parent CSS rule.
+            loader (ResourceLoader, optional): A resource loader to load the
+                imported style sheets.
         Returns:
             list[CSSRule]: A list of CSS rules.
        """
@@ -1706,7 +1877,8 @@ class CSSParser(object):
             css_rules = CSSParser.parse_rules(
                 rules,
                 parent_style_sheet=parent_style_sheet,
-                parent_rule=parent_rule)
+                parent_rule=parent_rule,
+                loader=loader)
             return css_rules
         except URLError as exp:
             logger = getLogger('{}.{}'.format(__name__, cls.__name__))
@@ -1715,7 +1887,7 @@ class CSSParser(object):
 
     @classmethod
     def parse(cls, url, owner_node=None, parent_style_sheet=None,
-              parent_rule=None, encoding=None):
+              parent_rule=None, encoding=None, loader=None):
         """Parses the CSS style sheet.
 
         Arguments:
@@ -1726,6 +1898,9 @@ class CSSParser(object):
             parent_rule (CSSRule, optional): The parent CSS rule.
             encoding (str, optional): An advisory character encoding for the
                 referenced style sheet.
+            loader (ResourceLoader, optional): A resource loader to load the
+                style sheet. Defaults to the resource loader of the document
+                of the owner node.
         Returns:
             CSSStyleSheet: A new CSSStyleSheet object.
         """
@@ -1745,10 +1920,13 @@ class CSSParser(object):
                 'media': owner_node.get('media'),
             })
         css_style_sheet = CSSStyleSheet(owner_rule=parent_rule, **extra)
+        css_style_sheet._location = url
         logger = getLogger('{}.{}'.format(__name__, cls.__name__))
         try:
             logger.debug('urlopen \'{}\''.format(url))
-            data, headers = load(url)
+            if loader is None:
+                loader = get_resource_loader(owner_node)
+            data, headers = loader.load(url)
             if encoding is None:
                 content_type = get_content_type(headers)
                 if content_type is None:
@@ -1763,7 +1941,8 @@ class CSSParser(object):
             css_rules = CSSParser.parse_rules(
                 rules,
                 parent_style_sheet=css_style_sheet,
-                parent_rule=parent_rule)
+                parent_rule=parent_rule,
+                loader=loader)
             css_style_sheet.css_rules.extend(css_rules)
         except URLError as exp:
             logger.info(
@@ -1771,7 +1950,8 @@ class CSSParser(object):
         return css_style_sheet
 
     @staticmethod
-    def parse_rules(rules, parent_style_sheet=None, parent_rule=None):
+    def parse_rules(rules, parent_style_sheet=None, parent_rule=None,
+                    loader=None):
         css_rules = list()
         for rule in rules:
             if rule.type == 'at-rule':
@@ -1794,7 +1974,8 @@ class CSSParser(object):
                     css_rule = CSSImportRule(
                         rule,
                         parent_style_sheet=parent_style_sheet,
-                        parent_rule=parent_rule)
+                        parent_rule=parent_rule,
+                        loader=loader)
                     css_rules.append(css_rule)
                 elif rule.lower_at_keyword == 'media':
                     # @media at-rule
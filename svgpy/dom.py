@@ -23,8 +23,9 @@ from .core import CSSUtils, Font, SVGLength
 from .css import CSSStyleDeclaration
 from .exception import HierarchyRequestError, InUseAttributeError, \
     InvalidCharacterError, NotFoundError
-from .style import get_css_rules, get_css_style, \
-    get_css_style_sheet_from_element
+from .style import ComputedStyle, get_css_rule_index, \
+    get_css_style_sheet_from_element, get_matched_css_rules, \
+    get_matched_css_style
 from .utils import QualifiedName, get_elements_by_class_name, \
     get_elements_by_tag_name, get_elements_by_tag_name_ns, \
     is_ascii_whitespace, style_to_dict
@@ -1792,10 +1793,16 @@ class Element(etree.ElementBase, Node, ParentNode, NonDocumentTypeChildNode):
     def get_computed_geometry(self):
         return {}  # override with a subclass
 
-    def get_computed_style(self):
-        """Gets the presentation attributes from ancestor elements."""
-        # TODO: implement Window.get_computed_style()
-        style = self.get_inherited_style()
+    def compute_style(self, inherited_style):
+        """Computes the style of the element from its inherited style.
+
+        Arguments:
+            inherited_style (dict): The inherited style of the element.
+                See get_inherited_style().
+        Returns:
+            dict: The computed style.
+        """
+        style = inherited_style
 
         # 'font-feature-settings' property
         style['font-feature-settings'] = CSSUtils.parse_font_feature_settings(
@@ -1860,191 +1867,30 @@ class Element(etree.ElementBase, Node, ParentNode, NonDocumentTypeChildNode):
         style.update(geometry)
         return style
 
-    def get_inherited_style(self):
-        def _update_font_prop(_value, _style, _inherited_style):
-            _other = CSSUtils.parse_font(_value)
-            for _key in _other:
-                if _key not in _style:
-                    _style[_key] = _other[_key]
-                    if _key == 'font-variant':
-                        _update_font_variant_prop(_other[_key],
-                                                  _style,
-                                                  _inherited_style)
-            _inherited_style.pop('font-style', None)
-            _inherited_style.pop('font-variant', None)
-            _inherited_style.pop('font-weight', None)
-            _inherited_style.pop('font-stretch', None)
-            _inherited_style.pop('font-size', None)
-            _inherited_style.pop('line-height', None)
-            _inherited_style.pop('font-size-adjust', None)
-            _inherited_style.pop('font-kerning', None)
-            _inherited_style.pop('font-language-override', None)
-            _inherited_style.pop('font-family', None)
-            _inherited_style.pop('font', None)
-
-        def _update_font_variant_prop(_value, _style, _inherited_style):
-            _other = CSSUtils.parse_font_variant(_value)
-            for _key in _other:
-                if _key not in _style:
-                    _style[_key] = _other[_key]
-            _inherited_style.pop('font-variant-alternates', None)
-            _inherited_style.pop('font-variant-caps', None)
-            _inherited_style.pop('font-variant-east-asian', None)
-            _inherited_style.pop('font-variant-ligatures', None)
-            _inherited_style.pop('font-variant-numeric', None)
-            _inherited_style.pop('font-variant-position', None)
-            _inherited_style.pop('font-variant', None)
-
-        # See https://svgwg.org/svg2-draft/propidx.html
-        style = dict()
-        non_inherited_props = \
-            {'alignment-baseline': 'baseline',
-             'baseline-shift': '0',
-             'clip': 'auto',
-             'clip-path': 'none',
-             'display': 'inline',
-             'dominant-baseline': 'auto',
-             'filter': 'none',
-             'flood-color': 'black',
-             'flood-opacity': '1',
-             'inline-size': '0',
-             'lighting-color': 'white',
-             'mask': 'no',
-             'opacity': '1',
-             'overflow': 'visible',
-             'stop-color': 'black',
-             'stop-opacity': '1',
-             'text-decoration': 'none',
-             'transform': 'none',
-             'unicode-bidi': 'normal',
-             'vector-effect': 'none',
-             }
-        for key in iter(non_inherited_props):
-            style.setdefault(key,
-                             self.get(key, non_inherited_props[key]))
-
-        inherited_props = \
-            {'clip-rule': 'nonzero',
-             'color': 'black',  # depends on user agent
-             'color-interpolation': 'sRGB',
-             'color-rendering': 'auto',
-             'cursor': 'auto',
-             'direction': 'ltr',
-             'fill': 'black',
-             'fill-opacity': '1',
-             'fill-rule': 'nonzero',
-             'font': None,
-             'font-family': None,
-             'font-feature-settings': 'normal',
-             'font-kerning': Font.CSS_DEFAULT_FONT_KERNING,
-             'font-language-override': Font.CSS_DEFAULT_FONT_LANGUAGE_OVERRIDE,
-             'font-size': Font.CSS_DEFAULT_FONT_SIZE,
-             'font-size-adjust': Font.CSS_DEFAULT_FONT_SIZE_ADJUST,
-             'font-stretch': Font.CSS_DEFAULT_FONT_STRETCH,
-             'font-style': Font.CSS_DEFAULT_FONT_STYLE,
-             'font-synthesis': 'weight style',
-             'font-variant': Font.CSS_DEFAULT_FONT_VARIANT,
-             'font-variant-alternates': ['normal'],
-             'font-variant-caps': 'normal',
-             'font-variant-east-asian': ['normal'],
-             'font-variant-ligatures': ['normal'],
-             'font-variant-numeric': ['normal'],
-             'font-variant-position': 'normal',
-             'font-weight': Font.CSS_DEFAULT_FONT_WEIGHT,
-             # 'glyph-orientation-vertical': 'auto',  # deprecated
-             'image-rendering': 'auto',
-             'lang': None,
-             'letter-spacing': 'normal',
-             'line-height': Font.CSS_DEFAULT_LINE_HEIGHT,
-             'marker': None,
-             'marker-end': 'none',
-             'marker-mid': 'none',
-             'marker-start': 'none',
-             'paint-order': 'normal',
-             'pointer-events': 'visiblePainted',
-             'shape-rendering': 'auto',
-             'stroke': 'none',
-             'stroke-dasharray': 'none',
-             'stroke-dashoffset': '0',
-             'stroke-linecap': 'butt',
-             'stroke-linejoin': 'miter',
-             'stroke-miterlimit': '4',
-             'stroke-opacity': '1',
-             'stroke-width': '1',
-             'tab-size': '8',
-             'text-anchor': 'start',
-             'text-orientation': 'mixed',
-             'text-rendering': 'auto',
-             'visibility': 'visible',
-             'white-space': 'normal',
-             'word-spacing': 'normal',
-             'writing-mode': 'horizontal-tb',
-             Element.XML_LANG: None,
-             }
-        # 'color-interpolation-filters', 'font-feature-settings',
-        # 'gradientTransform', 'glyph-orientation-horizontal',
-        # 'isolation',
-        # 'patternTransform',
-        # 'solid-color', 'solid-opacity',
-        # 'text-align', 'text-align-all', 'text-align-last',
-        # 'text-decoration-color', 'text-decoration-line',
-        # 'text-decoration-style', 'text-indent',
-        # 'text-overflow',
-        # 'transform', 'transform-box', 'transform-origin',
-        # 'vertical-align',
-        css_rules = get_css_rules(self)
-        element = self
-        while element is not None:
-            css_style, css_style_important = get_css_style(element, css_rules)
-            css_style.update(element.attrib)
-            _style = css_style.pop('style', None)
-            if _style is not None:
-                css_style.update(style_to_dict(_style))
-            css_style.update(css_style_important)
-            for key in iter(list(inherited_props.keys())):
-                value = css_style.get(key)
-                if value is not None and value not in ['inherit']:
-                    if key == 'font':
-                        # 'font' shorthand property
-                        style[key] = value
-                        _update_font_prop(value, style, inherited_props)
-                    elif key == 'font-family':
-                        # 'font-family' property
-                        style[key] = CSSUtils.parse_font_family(value)
-                        del inherited_props[key]
-                    elif key == 'font-variant':
-                        # 'font-variant' shorthand property
-                        style[key] = value
-                        _update_font_variant_prop(value, style,
-                                                  inherited_props)
-                    elif key == 'marker':
-                        # TODO: parse the 'marker' shorthand property.
-                        raise NotImplementedError
-                    else:
-                        if key in ['font-variant-alternates',
-                                   'font-variant-east-asian',
-                                   'font-variant-ligatures',
-                                   'font-variant-numeric']:
-                            style[key] = value.split()
-                        else:
-                            style[key] = value
-                        inherited_props.pop(key, None)
-            # 'display' property
-            display = css_style.get('display')
-            if display is not None and display == 'none':
-                style['display'] = 'none'
-            element = element.getparent()
-
-        for key, value in iter(inherited_props.items()):
-            if value is not None:
-                style[key] = value
+    def get_computed_style(self, frozen=False):
+        """Gets the presentation attributes from ancestor elements.
 
-        font_family = style.get('font-family')
-        if font_family is None:
-            style['font-family'] = CSSUtils.parse_font_family(
-                Font.default_font_family)
+        Arguments:
+            frozen (bool, optional): If True, returns an interned
+                ComputedStyle object instead of a dict.
+        Returns:
+            dict | ComputedStyle: The computed style.
+        """
+        # TODO: implement Window.get_computed_style()
+        doc = self.owner_document
+        if doc is not None and doc.style_resolver is not None:
+            return doc.style_resolver.get_computed_style(self, frozen=frozen)
+        style = self.compute_style(self.get_inherited_style())
+        return ComputedStyle.intern(style) if frozen else style
 
-        return style
+    def get_inherited_style(self):
+        """Gets the non-inherited properties of the element and the inherited
+        properties from its ancestors.
+        """
+        doc = self.owner_document
+        if doc is not None and doc.style_resolver is not None:
+            return doc.style_resolver.get_inherited_style(self)
+        return StyleResolver().get_inherited_style(self)
 
     def get_elements_by_class_name(self, class_names, nsmap=None):
         """Finds all matching sub-elements, by class names.
@@ -2395,6 +2241,478 @@ class Element(etree.ElementBase, Node, ParentNode, NonDocumentTypeChildNode):
         return etree.tostring(self, **kwargs)
 
 
+# See https://svgwg.org/svg2-draft/propidx.html
+_NON_INHERITED_PROPERTIES = \
+    {'alignment-baseline': 'baseline',
+     'baseline-shift': '0',
+     'clip': 'auto',
+     'clip-path': 'none',
+     'display': 'inline',
+     'dominant-baseline': 'auto',
+     'filter': 'none',
+     'flood-color': 'black',
+     'flood-opacity': '1',
+     'inline-size': '0',
+     'lighting-color': 'white',
+     'mask': 'no',
+     'opacity': '1',
+     'overflow': 'visible',
+     'stop-color': 'black',
+     'stop-opacity': '1',
+     'text-decoration': 'none',
+     'transform': 'none',
+     'unicode-bidi': 'normal',
+     'vector-effect': 'none',
+     }
+
+_INHERITED_PROPERTIES = \
+    {'clip-rule': 'nonzero',
+     'color': 'black',  # depends on user agent
+     'color-interpolation': 'sRGB',
+     'color-rendering': 'auto',
+     'cursor': 'auto',
+     'direction': 'ltr',
+     'fill': 'black',
+     'fill-opacity': '1',
+     'fill-rule': 'nonzero',
+     'font': None,
+     'font-family': None,
+     'font-feature-settings': 'normal',
+     'font-kerning': Font.CSS_DEFAULT_FONT_KERNING,
+     'font-language-override': Font.CSS_DEFAULT_FONT_LANGUAGE_OVERRIDE,
+     'font-size': Font.CSS_DEFAULT_FONT_SIZE,
+     'font-size-adjust': Font.CSS_DEFAULT_FONT_SIZE_ADJUST,
+     'font-stretch': Font.CSS_DEFAULT_FONT_STRETCH,
+     'font-style': Font.CSS_DEFAULT_FONT_STYLE,
+     'font-synthesis': 'weight style',
+     'font-variant': Font.CSS_DEFAULT_FONT_VARIANT,
+     'font-variant-alternates': ['normal'],
+     'font-variant-caps': 'normal',
+     'font-variant-east-asian': ['normal'],
+     'font-variant-ligatures': ['normal'],
+     'font-variant-numeric': ['normal'],
+     'font-variant-position': 'normal',
+     'font-weight': Font.CSS_DEFAULT_FONT_WEIGHT,
+     # 'glyph-orientation-vertical': 'auto',  # deprecated
+     'image-rendering': 'auto',
+     'lang': None,
+     'letter-spacing': 'normal',
+     'line-height': Font.CSS_DEFAULT_LINE_HEIGHT,
+     'marker': None,
+     'marker-end': 'none',
+     'marker-mid': 'none',
+     'marker-start': 'none',
+     'paint-order': 'normal',
+     'pointer-events': 'visiblePainted',
+     'shape-rendering': 'auto',
+     'stroke': 'none',
+     'stroke-dasharray': 'none',
+     'stroke-dashoffset': '0',
+     'stroke-linecap': 'butt',
+     'stroke-linejoin': 'miter',
+     'stroke-miterlimit': '4',
+     'stroke-opacity': '1',
+     'stroke-width': '1',
+     'tab-size': '8',
+     'text-anchor': 'start',
+     'text-orientation': 'mixed',
+     'text-rendering': 'auto',
+     'visibility': 'visible',
+     'white-space': 'normal',
+     'word-spacing': 'normal',
+     'writing-mode': 'horizontal-tb',
+     Element.XML_LANG: None,
+     }
+# 'color-interpolation-filters', 'font-feature-settings',
+# 'gradientTransform', 'glyph-orientation-horizontal',
+# 'isolation',
+# 'patternTransform',
+# 'solid-color', 'solid-opacity',
+# 'text-align', 'text-align-all', 'text-align-last',
+# 'text-decoration-color', 'text-decoration-line',
+# 'text-decoration-style', 'text-indent',
+# 'text-overflow',
+# 'transform', 'transform-box', 'transform-origin',
+# 'vertical-align',
+
+_SPECIAL_INHERITED_PROPERTIES = {'font', 'font-family', 'font-variant',
+                                 'marker'}
+
+_LIST_INHERITED_PROPERTIES = {'font-variant-alternates',
+                              'font-variant-east-asian',
+                              'font-variant-ligatures',
+                              'font-variant-numeric'}
+
+
+def _copy_style(style):
+    return {key: list(value) if isinstance(value, list) else value
+            for key, value in style.items()}
+
+
+def _update_font_prop(value, style, inherited_props):
+    other = CSSUtils.parse_font(value)
+    for key in other:
+        if key not in style:
+            style[key] = other[key]
+            if key == 'font-variant':
+                _update_font_variant_prop(other[key],
+                                          style,
+                                          inherited_props)
+    inherited_props.pop('font-style', None)
+    inherited_props.pop('font-variant', None)
+    inherited_props.pop('font-weight', None)
+    inherited_props.pop('font-stretch', None)
+    inherited_props.pop('font-size', None)
+    inherited_props.pop('line-height', None)
+    inherited_props.pop('font-size-adjust', None)
+    inherited_props.pop('font-kerning', None)
+    inherited_props.pop('font-language-override', None)
+    inherited_props.pop('font-family', None)
+    inherited_props.pop('font', None)
+
+
+def _update_font_variant_prop(value, style, inherited_props):
+    other = CSSUtils.parse_font_variant(value)
+    for key in other:
+        if key not in style:
+            style[key] = other[key]
+    inherited_props.pop('font-variant-alternates', None)
+    inherited_props.pop('font-variant-caps', None)
+    inherited_props.pop('font-variant-east-asian', None)
+    inherited_props.pop('font-variant-ligatures', None)
+    inherited_props.pop('font-variant-numeric', None)
+    inherited_props.pop('font-variant-position', None)
+    inherited_props.pop('font-variant', None)
+
+
+def _fold_inherited_style(declared_styles):
+    """Cascades the inherited properties over the declared styles of an
+    element and its ancestors, nearest first.
+    """
+    style = dict()
+    inherited_props = _copy_style(_INHERITED_PROPERTIES)
+    for css_style in declared_styles:
+        for key in iter(list(inherited_props.keys())):
+            value = css_style.get(key)
+            if value is not None and value not in ['inherit']:
+                if key == 'font':
+                    # 'font' shorthand property
+                    style[key] = value
+                    _update_font_prop(value, style, inherited_props)
+                elif key == 'font-family':
+                    # 'font-family' property
+                    style[key] = CSSUtils.parse_font_family(value)
+                    del inherited_props[key]
+                elif key == 'font-variant':
+                    # 'font-variant' shorthand property
+                    style[key] = value
+                    _update_font_variant_prop(value, style,
+                                              inherited_props)
+                elif key == 'marker':
+                    # TODO: parse the 'marker' shorthand property.
+                    raise NotImplementedError
+                else:
+                    if key in _LIST_INHERITED_PROPERTIES:
+                        style[key] = value.split()
+                    else:
+                        style[key] = value
+                    inherited_props.pop(key, None)
+        # 'display' property
+        display = css_style.get('display')
+        if display is not None and display == 'none':
+            style['display'] = 'none'
+
+    for key, value in iter(inherited_props.items()):
+        if value is not None:
+            style[key] = value
+
+    font_family = style.get('font-family')
+    if font_family is None:
+        style['font-family'] = CSSUtils.parse_font_family(
+            Font.default_font_family)
+    return style
+
+
+def _get_style_key(element):
+    """Returns the values that the style of the element depends on, except
+    the ones of its ancestors and the style sheets.
+    """
+    return (element.getparent(), element.getprevious(), element.getnext(),
+            tuple(element.items()), element.text)
+
+
+class StyleResolver(object):
+    """Resolves the styles of the elements of a document.
+
+    The declared style of an element (the matching CSS rules, the
+    presentation attributes and the 'style' attribute) is computed once, and
+    its inherited properties are derived from the already resolved style of
+    its parent.
+
+    Elements with the same tag, attributes and matching style rules share
+    one declared style. Elements whose parents share a style, and whose
+    declared styles are shared, share one inherited style. If they also have
+    the same text, they share one computed style. Elements that share a
+    style have ancestors with the same tags and attributes, and therefore the
+    same SVG viewports.
+
+    A resolved style is used as long as the attributes, the text, the parent
+    and the adjacent siblings of the element and its ancestors, and the
+    <style> and <link> elements of the document are unchanged. If a style
+    rule depends on the siblings of an element (e.g. 'rect + circle' or
+    ':first-child'), the adjacent siblings of the element and its ancestors
+    are checked as well. The shared styles are discarded when the style sheets
+    change, or when most of them are no longer used.
+    """
+
+    def __init__(self, css_rules=None, selector_first=False):
+        """Constructs a StyleResolver object.
+
+        Arguments:
+            css_rules (RuleIndex, optional): The CSS rules of the document.
+                If not specified, the CSS rules of the document of the first
+                resolved element are used.
+            selector_first (bool, optional): If True, each style rule is
+                evaluated once against the whole tree (see RuleIndex.match())
+                instead of being tested against each element.
+        """
+        self._css_rules = css_rules
+        self._selector_first = selector_first
+        self._matched_rules = None
+        self._keys = dict()
+        self._style_sources = None
+        self._declared_styles = dict()
+        self._inherited_styles = dict()
+        self._computed_styles = dict()
+        self._shared_declared_styles = dict()
+        self._shared_inherited_styles = dict()
+        self._shared_computed_styles = dict()
+        self._initial_style = None
+
+    def _get_inherited_style(self, element):
+        inherited_styles = self._inherited_styles
+        style = inherited_styles.get(element)
+        if style is not None:
+            return style
+        # resolve the unresolved ancestors from the top down
+        elements = list()
+        parent = element
+        while parent is not None and parent not in inherited_styles:
+            elements.append(parent)
+            parent = parent.getparent()
+        if parent is None:
+            if self._initial_style is None:
+                self._initial_style = _fold_inherited_style([])
+            parent_style = self._initial_style
+        else:
+            parent_style = inherited_styles[parent]
+        shared_styles = self._shared_inherited_styles
+        for element in reversed(elements):
+            key = (id(parent_style),
+                   id(self._get_declared_style(element)),
+                   element.tag)
+            style = shared_styles.get(key)
+            if style is None:
+                style = self._inherit_style(element, parent_style)
+                shared_styles[key] = style
+            inherited_styles[element] = style
+            self._keys[element] = _get_style_key(element)
+            parent_style = style
+        return parent_style
+
+    def _inherit_style(self, element, parent_style):
+        css_style = self._get_declared_style(element)
+        declared = [key for key in _INHERITED_PROPERTIES
+                    if css_style.get(key) not in (None, 'inherit')]
+        if not _SPECIAL_INHERITED_PROPERTIES.isdisjoint(declared):
+            # shorthand properties: cascade over the ancestors
+            declared_styles = list()
+            while element is not None:
+                declared_styles.append(self._get_declared_style(element))
+                element = element.getparent()
+            return _fold_inherited_style(declared_styles)
+        style = dict(parent_style)
+        for key in declared:
+            value = css_style[key]
+            if key in _LIST_INHERITED_PROPERTIES:
+                style[key] = value.split()
+            else:
+                style[key] = value
+        if css_style.get('display') == 'none':
+            style['display'] = 'none'
+        return style
+
+    def _discard(self, root=None):
+        if (root is not None
+                and len(self._shared_declared_styles)
+                > 2 * len(self._declared_styles) + 1024):
+            # most of the shared styles are no longer used
+            root = None
+        if root is None:
+            self._keys.clear()
+            self._declared_styles.clear()
+            self._inherited_styles.clear()
+            self._computed_styles.clear()
+            self._shared_declared_styles.clear()
+            self._shared_inherited_styles.clear()
+            self._shared_computed_styles.clear()
+        else:
+            for element in root.iter():
+                self._keys.pop(element, None)
+                self._declared_styles.pop(element, None)
+                self._inherited_styles.pop(element, None)
+                self._computed_styles.pop(element, None)
+        self._matched_rules = None
+
+    def _get_computed_style(self, element):
+        style = self._computed_styles.get(element)
+        if style is None:
+            key = (id(self._get_inherited_style(element)),
+                   element.tag,
+                   element.text,
+                   tuple(element.items()))
+            style = self._shared_computed_styles.get(key)
+            if style is None:
+                style = ComputedStyle.intern(element.compute_style(
+                    self._get_element_style(element)))
+                self._shared_computed_styles[key] = style
+            self._computed_styles[element] = style
+        return style
+
+    def _get_declared_style(self, element):
+        css_style = self._declared_styles.get(element)
+        if css_style is not None:
+            return css_style
+        css_rules = self.get_matched_rules(element)
+        attributes = tuple(element.items())
+        key = (element.tag,
+               attributes,
+               tuple(css_rules))
+        css_style = self._shared_declared_styles.get(key)
+        if css_style is None:
+            css_style, css_style_important = get_matched_css_style(css_rules)
+            css_style.update(attributes)
+            _style = css_style.pop('style', None)
+            if _style is not None:
+                css_style.update(style_to_dict(_style))
+            css_style.update(css_style_important)
+            self._shared_declared_styles[key] = css_style
+        self._declared_styles[element] = css_style
+        self._keys[element] = _get_style_key(element)
+        return css_style
+
+    def _get_element_style(self, element):
+        style = {key: element.get(key, value)
+                 for key, value in _NON_INHERITED_PROPERTIES.items()}
+        style.update(_copy_style(self._get_inherited_style(element)))
+        return style
+
+    def get_computed_style(self, element, frozen=False):
+        """Gets the computed style of the element.
+
+        Arguments:
+            element (Element): An element of the document.
+            frozen (bool, optional): If True, returns the shared
+                ComputedStyle object instead of a dict.
+        Returns:
+            dict | ComputedStyle: The computed style.
+        """
+        self.validate(element)
+        style = self._get_computed_style(element)
+        return style if frozen else style.to_dict()
+
+    def get_declared_style(self, element):
+        """Gets the declared style of the element: the matching CSS rules,
+        the presentation attributes and the 'style' attribute.
+
+        Arguments:
+            element (Element): An element of the document.
+        Returns:
+            dict: The declared style.
+        """
+        self.validate(element)
+        return self._get_declared_style(element)
+
+    def get_matched_rules(self, element):
+        """Gets the style rules that match the element.
+
+        Arguments:
+            element (Element): An element of the document.
+        Returns:
+            list[CSSStyleRule]: A list of the matching style rules in source
+                order.
+        """
+        if self._css_rules is None:
+            self._css_rules = get_css_rule_index(element)
+            root = element.getroottree().getroot()
+            self._style_sources = [
+                (source, _get_style_key(source))
+                for source in root.iter(tag=('{*}link', '{*}style'))]
+        if self._selector_first:
+            if self._matched_rules is None:
+                root = element.getroottree().getroot()
+                self._matched_rules = self._css_rules.match(root)
+            return self._matched_rules.get(element, [])
+        return get_matched_css_rules(element, self._css_rules)
+
+    def get_inherited_style(self, element):
+        """Gets the non-inherited properties of the element and the inherited
+        properties from its ancestors.
+
+        Arguments:
+            element (Element): An element of the document.
+        Returns:
+            dict: The inherited style.
+        """
+        self.validate(element)
+        return self._get_element_style(element)
+
+    def resolve(self, root):
+        """Resolves the inherited styles of the element and its descendants
+        in document order.
+
+        Arguments:
+            root (Element): The root of the subtree.
+        """
+        for element in root.iter():
+            if isinstance(element, Element):
+                self._get_inherited_style(element)
+
+    def validate(self, element):
+        """Discards the resolved styles of the element, its ancestors and
+        their descendants that may have changed since they were resolved.
+
+        Arguments:
+            element (Element): An element of the document.
+        """
+        if self._style_sources is not None:
+            for source, key in self._style_sources:
+                if _get_style_key(source) != key:
+                    # the style sheets may have changed
+                    self._css_rules = None
+                    self._style_sources = None
+                    self._discard()
+                    return
+        keys = self._keys
+        if len(keys) == 0:
+            return
+        siblings = getattr(self._css_rules, 'has_sibling_selectors', True)
+        while element is not None:
+            parent = element.getparent()
+            if siblings and parent is not None:
+                nodes = (element.getprevious(), element, element.getnext())
+                scope = parent
+            else:
+                nodes = (element,)
+                scope = element
+            for node in nodes:
+                key = keys.get(node) if node is not None else None
+                if key is not None and key != _get_style_key(node):
+                    self._discard(scope)
+                    break
+            element = parent
+
+
 class ElementCSSInlineStyle(Element):
     """Represents the [cssom] ElementCSSInlineStyle."""
 
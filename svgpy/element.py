@@ -20,13 +20,13 @@ from .base import HTMLElement, \
     SVGAnimatedPoints, SVGElement, SVGFitToViewBox, \
     SVGGeometryElement, SVGGraphicsElement, SVGGradientElement, \
     SVGPathData, SVGPathDataSettings, SVGURIReference, SVGZoomAndPan
-from .core import CSSUtils, SVGLength
+from .core import CSSUtils, LengthResolver, SVGLength
 from .dom import Attr, Comment, DOMTokenList, Element, LinkStyle, \
     ProcessingInstruction
 from .path import PathParser, SVGPathSegment
 from .text import SVGTextContentElement, SVGTextPositioningElement
 from .transform import SVGTransform, SVGTransformList
-from .utils import QualifiedName, get_element_by_id, \
+from .utils import LRUCache, QualifiedName, get_element_by_id, \
     get_elements_by_class_name, get_elements_by_tag_name, \
     get_elements_by_tag_name_ns
 
@@ -170,17 +170,19 @@ class SVGAElement(SVGGraphicsElement, SVGURIReference,
 class SVGCircleElement(SVGGeometryElement):
     """Represents the [SVG2] <circle> element."""
 
+    _geometry_attributes = ('cx', 'cy', 'r')
+
     def get_computed_geometry(self):
         geometry = dict()
+        resolver = LengthResolver(self)
 
         # 'cx' property
         # Value: <length> | <percentage>
         # Initial: 0
         # Inherited: no
         # Percentages: refer to the size of the current SVG viewport
-        cx = SVGLength(self.get('cx', '0'),
-                       context=self,
-                       direction=SVGLength.DIRECTION_HORIZONTAL).value()
+        cx = resolver.value(
+            self.get('cx', '0'), direction=SVGLength.DIRECTION_HORIZONTAL)
         geometry['cx'] = cx
 
         # 'cy' property
@@ -188,9 +190,8 @@ class SVGCircleElement(SVGGeometryElement):
         # Initial: 0
         # Inherited: no
         # Percentages: refer to the size of the current SVG viewport
-        cy = SVGLength(self.get('cy', '0'),
-                       context=self,
-                       direction=SVGLength.DIRECTION_VERTICAL).value()
+        cy = resolver.value(
+            self.get('cy', '0'), direction=SVGLength.DIRECTION_VERTICAL)
         geometry['cy'] = cy
 
         # 'r' property
@@ -198,9 +199,8 @@ class SVGCircleElement(SVGGeometryElement):
         # Initial: 0
         # Inherited: no
         # Percentages: refer to the size of the current SVG viewport
-        r = SVGLength(self.get('r', '0'),
-                      context=self,
-                      direction=SVGLength.DIRECTION_UNSPECIFIED).value()
+        r = resolver.value(
+            self.get('r', '0'), direction=SVGLength.DIRECTION_UNSPECIFIED)
         geometry['r'] = r
 
         return geometry
@@ -272,8 +272,11 @@ class SVGDescElement(SVGElement):
 class SVGEllipseElement(SVGGeometryElement):
     """Represents the [SVG2] <ellipse> element."""
 
+    _geometry_attributes = ('cx', 'cy', 'rx', 'ry')
+
     def get_computed_geometry(self):
         geometry = dict()
+        resolver = LengthResolver(self)
 
         # 'rx' property
         # Value: <length> | <percentage> | auto
@@ -298,12 +301,8 @@ class SVGEllipseElement(SVGGeometryElement):
             rx = 0
             ry = 0
         else:
-            rx = SVGLength(_rx,
-                           context=self,
-                           direction=SVGLength.DIRECTION_HORIZONTAL).value()
-            ry = SVGLength(_ry,
-                           context=self,
-                           direction=SVGLength.DIRECTION_VERTICAL).value()
+            rx = resolver.value(_rx, direction=SVGLength.DIRECTION_HORIZONTAL)
+            ry = resolver.value(_ry, direction=SVGLength.DIRECTION_VERTICAL)
         geometry['rx'] = rx
         geometry['ry'] = ry
 
@@ -312,9 +311,8 @@ class SVGEllipseElement(SVGGeometryElement):
         # Initial: 0
         # Inherited: no
         # Percentages: refer to the size of the current SVG viewport
-        cx = SVGLength(self.get('cx', '0'),
-                       context=self,
-                       direction=SVGLength.DIRECTION_HORIZONTAL).value()
+        cx = resolver.value(
+            self.get('cx', '0'), direction=SVGLength.DIRECTION_HORIZONTAL)
         geometry['cx'] = cx
 
         # 'cy' property
@@ -322,9 +320,8 @@ class SVGEllipseElement(SVGGeometryElement):
         # Initial: 0
         # Inherited: no
         # Percentages: refer to the size of the current SVG viewport
-        cy = SVGLength(self.get('cy', '0'),
-                       context=self,
-                       direction=SVGLength.DIRECTION_VERTICAL).value()
+        cy = resolver.value(
+            self.get('cy', '0'), direction=SVGLength.DIRECTION_VERTICAL)
         geometry['cy'] = cy
 
         return geometry
@@ -413,33 +410,32 @@ class SVGLinearGradientElement(SVGGradientElement):
 class SVGLineElement(SVGGeometryElement):
     """Represents the [SVG2] <line> element."""
 
+    _geometry_attributes = ('x1', 'y1', 'x2', 'y2')
+
     def get_computed_geometry(self):
         geometry = dict()
+        resolver = LengthResolver(self)
 
         # 'x1', 'y1' properties
         # Value: <length> | <percentage> | <number>
         # Initial: 0
-        x1 = SVGLength(self.get('x1', '0'),
-                       context=self,
-                       direction=SVGLength.DIRECTION_HORIZONTAL).value()
+        x1 = resolver.value(
+            self.get('x1', '0'), direction=SVGLength.DIRECTION_HORIZONTAL)
         geometry['x1'] = x1
 
-        y1 = SVGLength(self.get('y1', '0'),
-                       context=self,
-                       direction=SVGLength.DIRECTION_VERTICAL).value()
+        y1 = resolver.value(
+            self.get('y1', '0'), direction=SVGLength.DIRECTION_VERTICAL)
         geometry['y1'] = y1
 
         # 'x2', 'y2' properties
         # Value: <length> | <percentage> | <number>
         # Initial: 0
-        x2 = SVGLength(self.get('x2', '0'),
-                       context=self,
-                       direction=SVGLength.DIRECTION_HORIZONTAL).value()
+        x2 = resolver.value(
+            self.get('x2', '0'), direction=SVGLength.DIRECTION_HORIZONTAL)
         geometry['x2'] = x2
 
-        y2 = SVGLength(self.get('y2', '0'),
-                       context=self,
-                       direction=SVGLength.DIRECTION_VERTICAL).value()
+        y2 = resolver.value(
+            self.get('y2', '0'), direction=SVGLength.DIRECTION_VERTICAL)
         geometry['y2'] = y2
 
         return geometry
@@ -508,6 +504,14 @@ class SVGMetadataElement(SVGElement):
 class SVGPathElement(SVGGeometryElement, SVGPathData):
     """Represents the [SVG2] <path> element."""
 
+    path_data_cache = LRUCache(maxsize=1024)
+    """LRUCache: The cache of the parsed path data, keyed by the text of the
+    'd' property and the normalize flag.
+    """
+
+    def _get_geometry_key(self):
+        return self.get('d'),
+
     def get_computed_geometry(self):
         geometry = dict()
 
@@ -537,14 +541,20 @@ class SVGPathElement(SVGGeometryElement, SVGPathData):
         d = geometry['d']
         if d is None:
             return []
-        path_data = PathParser.parse(d)
+        normalize = False
         if settings is not None:
             if not isinstance(settings, SVGPathDataSettings):
                 raise TypeError('Expected SVGPathDataSettings, got {}'.format(
                     type(settings)))
-            if settings.normalize:
+            normalize = bool(settings.normalize)
+        key = d, normalize
+        path_data = SVGPathElement.path_data_cache.get(key)
+        if path_data is None:
+            path_data = PathParser.parse(d, compact=True)
+            if normalize:
                 path_data = PathParser.normalize(path_data)
-        return path_data
+            SVGPathElement.path_data_cache[key] = path_data
+        return path_data.tolist()
 
 
 class SVGPatternElement(SVGGraphicsElement, SVGFitToViewBox, SVGURIReference):
@@ -567,6 +577,9 @@ class SVGPatternElement(SVGGraphicsElement, SVGFitToViewBox, SVGURIReference):
 class SVGPolygonElement(SVGGeometryElement, SVGAnimatedPoints):
     """Represents the [SVG2] <polygon> element."""
 
+    def _get_geometry_key(self):
+        return self.get('points'),
+
     def get_computed_geometry(self):
         geometry = dict()
 
@@ -604,6 +617,9 @@ class SVGPolygonElement(SVGGeometryElement, SVGAnimatedPoints):
 class SVGPolylineElement(SVGGeometryElement, SVGAnimatedPoints):
     """Represents the [SVG2] <polyline> element."""
 
+    def _get_geometry_key(self):
+        return self.get('points'),
+
     def get_computed_geometry(self):
         geometry = dict()
 
@@ -645,8 +661,11 @@ class SVGRadialGradientElement(SVGGradientElement):
 class SVGRectElement(SVGGeometryElement):
     """Represents the [SVG2] <rect> element."""
 
+    _geometry_attributes = ('x', 'y', 'width', 'height', 'rx', 'ry')
+
     def get_computed_geometry(self):
         geometry = dict()
+        resolver = LengthResolver(self)
 
         # 'width' property
         # Value: <length> | <percentage> | auto | inherit
@@ -654,9 +673,8 @@ class SVGRectElement(SVGGeometryElement):
         # Inherited: no
         # Percentages: refer to width of containing block
         _width, context = CSSUtils.get_value(self, 'width', 'auto')
-        width = SVGLength(_width,
-                          context=context,
-                          direction=SVGLength.DIRECTION_HORIZONTAL).value()
+        width = resolver.with_context(context).value(
+            _width, direction=SVGLength.DIRECTION_HORIZONTAL)
         geometry['width'] = width
 
         # 'height' property
@@ -665,9 +683,8 @@ class SVGRectElement(SVGGeometryElement):
         # Inherited: no
         # Percentages: refer to height of containing block
         _height, context = CSSUtils.get_value(self, 'height', 'auto')
-        height = SVGLength(_height,
-                           context=context,
-                           direction=SVGLength.DIRECTION_VERTICAL).value()
+        height = resolver.with_context(context).value(
+            _height, direction=SVGLength.DIRECTION_VERTICAL)
         geometry['height'] = height
 
         # 'rx' property
@@ -691,18 +708,14 @@ class SVGRectElement(SVGGeometryElement):
             if _rx == 'auto':
                 rx = 0
             else:
-                rx = SVGLength(
-                    _rx,
-                    context=self,
-                    direction=SVGLength.DIRECTION_HORIZONTAL).value()
+                rx = resolver.value(
+                    _rx, direction=SVGLength.DIRECTION_HORIZONTAL)
 
             if _ry == 'auto':
                 ry = 0
             else:
-                ry = SVGLength(
-                    _ry,
-                    context=self,
-                    direction=SVGLength.DIRECTION_VERTICAL).value()
+                ry = resolver.value(
+                    _ry, direction=SVGLength.DIRECTION_VERTICAL)
 
             if _rx != 'auto' and _ry == 'auto':
                 ry = rx
@@ -722,9 +735,8 @@ class SVGRectElement(SVGGeometryElement):
         # Initial: 0
         # Inherited: no
         # Percentages: refer to the size of the current SVG viewport
-        x = SVGLength(self.get('x', '0'),
-                      context=self,
-                      direction=SVGLength.DIRECTION_HORIZONTAL).value()
+        x = resolver.value(
+            self.get('x', '0'), direction=SVGLength.DIRECTION_HORIZONTAL)
         geometry['x'] = x
 
         # 'y' property
@@ -732,9 +744,8 @@ class SVGRectElement(SVGGeometryElement):
         # Initial: 0
         # Inherited: no
         # Percentages: refer to the size of the current SVG viewport
-        y = SVGLength(self.get('y', '0'),
-                      context=self,
-                      direction=SVGLength.DIRECTION_VERTICAL).value()
+        y = resolver.value(
+            self.get('y', '0'), direction=SVGLength.DIRECTION_VERTICAL)
         geometry['y'] = y
 
         return geometry
@@ -976,6 +987,7 @@ class SVGSymbolElement(SVGGraphicsElement, SVGFitToViewBox):
 
     def get_computed_geometry(self):
         geometry = dict()
+        resolver = LengthResolver(self)
 
         vpx, vpy, vpw, vph = self.get_viewport_size()
         geometry['x'] = vpx.value()
@@ -985,16 +997,14 @@ class SVGSymbolElement(SVGGraphicsElement, SVGFitToViewBox):
 
         ref_x = self.get('refX')
         if ref_x is not None and ref_x not in ['left', 'center', 'right']:
-            ref_x = SVGLength(ref_x,
-                              context=self,
-                              direction=SVGLength.DIRECTION_HORIZONTAL).value()
+            ref_x = resolver.value(
+                ref_x, direction=SVGLength.DIRECTION_HORIZONTAL)
         geometry['refX'] = ref_x
 
         ref_y = self.get('refY')
         if ref_y is not None and ref_y not in ['top', 'center', 'bottom']:
-            ref_y = SVGLength(ref_y,
-                              context=self,
-                              direction=SVGLength.DIRECTION_VERTICAL).value()
+            ref_y = resolver.value(
+                ref_y, direction=SVGLength.DIRECTION_VERTICAL)
         geometry['refY'] = ref_y
 
         return geometry
@@ -1050,16 +1060,13 @@ class SVGUseElement(SVGGraphicsElement, SVGURIReference):
 
     def get_computed_geometry(self):
         geometry = dict()
+        resolver = LengthResolver(self)
 
-        geometry['x'] = SVGLength(
-            self.get('x', '0'),
-            context=self,
-            direction=SVGLength.DIRECTION_HORIZONTAL).value()
+        geometry['x'] = resolver.value(
+            self.get('x', '0'), direction=SVGLength.DIRECTION_HORIZONTAL)
 
-        geometry['y'] = SVGLength(
-            self.get('y', '0'),
-            context=self,
-            direction=SVGLength.DIRECTION_VERTICAL).value()
+        geometry['y'] = resolver.value(
+            self.get('y', '0'), direction=SVGLength.DIRECTION_VERTICAL)
 
         # 'width' property
         # Value: <length> | <percentage> | auto | inherit
@@ -1067,10 +1074,8 @@ class SVGUseElement(SVGGraphicsElement, SVGURIReference):
         # Inherited: no
         # Percentages: refer to width of containing block
         _width, context = CSSUtils.get_value(self, 'width', 'auto')
-        geometry['width'] = SVGLength(
-            _width,
-            context=context,
-            direction=SVGLength.DIRECTION_HORIZONTAL).value()
+        geometry['width'] = resolver.with_context(context).value(
+            _width, direction=SVGLength.DIRECTION_HORIZONTAL)
 
         # 'height' property
         # Value: <length> | <percentage> | auto | inherit
@@ -1078,10 +1083,8 @@ class SVGUseElement(SVGGraphicsElement, SVGURIReference):
         # Inherited: no
         # Percentages: refer to height of containing block
         _height, context = CSSUtils.get_value(self, 'height', 'auto')
-        geometry['height'] = SVGLength(
-            _height,
-            context=context,
-            direction=SVGLength.DIRECTION_VERTICAL).value()
+        geometry['height'] = resolver.with_context(context).value(
+            _height, direction=SVGLength.DIRECTION_VERTICAL)
 
         return geometry
 
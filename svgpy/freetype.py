@@ -703,6 +703,10 @@ class FreeType(object):
     FT_OUTLINE_HIGH_PRECISION = 0x100
     FT_OUTLINE_SINGLE_PASS = 0x200
 
+    FT_CURVE_TAG_CONIC = 0
+    FT_CURVE_TAG_ON = 1
+    FT_CURVE_TAG_CUBIC = 2
+
     # freetype/ftoutln.h
     FT_ORIENTATION_TRUETYPE = 0
     FT_ORIENTATION_POSTSCRIPT = 1
@@ -817,6 +821,36 @@ class FTOutline(object):
         if error:
             raise RuntimeError('FT_Outline_Decompose() failed: ' + hex(error))
 
+    def get_arrays(self):
+        """Returns copies of the points, the tags and the contours of the
+        outline as arrays.
+
+        Returns:
+            numpy.ndarray: An array of shape (n_points, 2) of the points in
+                26.6 fixed-point format.
+            numpy.ndarray: An array of shape (n_points,) of the tags.
+            numpy.ndarray: An array of shape (n_contours,) of the indices of
+                the end points of the contours.
+        """
+        n_points = max(self.n_points, 0)
+        n_contours = max(self.n_contours, 0)
+        if n_points == 0 or n_contours == 0:
+            return (np.empty((0, 2), dtype=np.int64),
+                    np.empty(0, dtype=np.uint8),
+                    np.empty(0, dtype=np.intp))
+        pos_size = ffi.sizeof('FT_Pos')
+        points = np.frombuffer(
+            ffi.buffer(self._outline.points, 2 * n_points * pos_size),
+            dtype=np.dtype('i{}'.format(pos_size))).reshape(n_points, 2)
+        tags = np.frombuffer(ffi.buffer(self._outline.tags, n_points),
+                             dtype=np.uint8)
+        contour_size = ffi.sizeof(ffi.typeof(self._outline.contours).item)
+        contours = np.frombuffer(
+            ffi.buffer(self._outline.contours, n_contours * contour_size),
+            dtype=np.dtype('i{}'.format(contour_size)))
+        return (points.astype(np.int64), tags.copy(),
+                contours.astype(np.intp))
+
     def get_bbox(self):
         bbox = ffi.new('FT_BBox *')
         error = lib.FT_Outline_Get_BBox(ffi.addressof(self._outline), bbox)
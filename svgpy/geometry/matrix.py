@@ -81,8 +81,36 @@ def matrix3d(m11, m12, m13, m14,
                      [float(m14), float(m24), float(m34), float(m44)]])
 
 
+def _multiply2d(m, n):
+    """Returns the product of two 2d matrices.
+
+    Arguments:
+        m (tuple[float, ...]): The a, b, c, d, e and f components of the
+            left-hand matrix.
+        n (tuple[float, ...]): The a, b, c, d, e and f components of the
+            right-hand matrix.
+    Returns:
+        tuple[float, ...]: The a, b, c, d, e and f components of the
+            resulting matrix.
+    """
+    a, b, c, d, e, f = m
+    a2, b2, c2, d2, e2, f2 = n
+    return (a * a2 + c * b2,
+            b * a2 + d * b2,
+            a * c2 + c * d2,
+            b * c2 + d * d2,
+            a * e2 + c * f2 + e,
+            b * e2 + d * f2 + f)
+
+
 class DOMMatrixReadOnly(object):
-    """Represents the [geometry] DOMMatrixReadOnly."""
+    """Represents the [geometry] DOMMatrixReadOnly.
+
+    A matrix that has only 2d components is held as six floats, and is
+    promoted to a 4x4 matrix when a 3d component is set.
+    """
+
+    __slots__ = ('_a', '_b', '_c', '_d', '_e', '_f', '_matrix', '_is2d')
 
     def __init__(self, values=None, **init):
         """Constructs a DOMMatrixReadOnly object.
@@ -125,7 +153,9 @@ class DOMMatrixReadOnly(object):
             >>> m.tolist()
             [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 100.0, -200.0, 0.0, 1.0]
         """
-        self._matrix = None
+        self._a = self._d = 1.0
+        self._b = self._c = self._e = self._f = 0.0
+        self._matrix = None  # a 4x4 matrix if it has 3d components
         self._is2d = None
         if values is not None:
             self._init_from_array(values)
@@ -135,7 +165,9 @@ class DOMMatrixReadOnly(object):
     def __eq__(self, other):
         if not isinstance(other, DOMMatrixReadOnly):
             return NotImplemented
-        return (self._matrix == other.matrix).all()
+        if self._matrix is None and other._matrix is None:
+            return self._get_2d() == other._get_2d()
+        return (self.matrix == other.matrix).all()
 
     def __imul__(self, other):
         return None
@@ -143,43 +175,55 @@ class DOMMatrixReadOnly(object):
     def __mul__(self, other):
         if not isinstance(other, DOMMatrixReadOnly):
             return NotImplemented
-        m = DOMMatrix(self.tolist())
+        m = self._copy()
         m.multiply_self(other)
         return m
 
     def __repr__(self):
         return '<{}.{} object at {} {}>'.format(
             type(self).__module__, type(self).__name__, hex(id(self)),
-            self._matrix.tolist())
+            self.matrix.tolist())
 
     @property
     def a(self):
         """float: The a component of the matrix."""
+        if self._matrix is None:
+            return self._a
         return self._matrix[0, 0]
 
     @property
     def b(self):
         """float: The b component of the matrix."""
+        if self._matrix is None:
+            return self._b
         return self._matrix[1, 0]
 
     @property
     def c(self):
         """float: The c component of the matrix."""
+        if self._matrix is None:
+            return self._c
         return self._matrix[0, 1]
 
     @property
     def d(self):
         """float: The d component of the matrix."""
+        if self._matrix is None:
+            return self._d
         return self._matrix[1, 1]
 
     @property
     def e(self):
         """float: The e component of the matrix."""
+        if self._matrix is None:
+            return self._e
         return self._matrix[0, 3]
 
     @property
     def f(self):
         """float: The f component of the matrix."""
+        if self._matrix is None:
+            return self._f
         return self._matrix[1, 3]
 
     @property
@@ -209,93 +253,173 @@ class DOMMatrixReadOnly(object):
     @property
     def m11(self):
         """float: The m11 component of the matrix."""
+        if self._matrix is None:
+            return self._a
         return self._matrix[0, 0]
 
     @property
     def m12(self):
         """float: The m12 component of the matrix."""
+        if self._matrix is None:
+            return self._b
         return self._matrix[1, 0]
 
     @property
     def m13(self):
         """float: The m13 component of the matrix."""
+        if self._matrix is None:
+            return 0.0
         return self._matrix[2, 0]
 
     @property
     def m14(self):
         """float: The m14 component of the matrix."""
+        if self._matrix is None:
+            return 0.0
         return self._matrix[3, 0]
 
     @property
     def m21(self):
         """float: The m21 component of the matrix."""
+        if self._matrix is None:
+            return self._c
         return self._matrix[0, 1]
 
     @property
     def m22(self):
         """float: The m22 component of the matrix."""
+        if self._matrix is None:
+            return self._d
         return self._matrix[1, 1]
 
     @property
     def m23(self):
         """float: The m23 component of the matrix."""
+        if self._matrix is None:
+            return 0.0
         return self._matrix[2, 1]
 
     @property
     def m24(self):
         """float: The m24 component of the matrix."""
+        if self._matrix is None:
+            return 0.0
         return self._matrix[3, 1]
 
     @property
     def m31(self):
         """float: The m31 component of the matrix."""
+        if self._matrix is None:
+            return 0.0
         return self._matrix[0, 2]
 
     @property
     def m32(self):
         """float: The m32 component of the matrix."""
+        if self._matrix is None:
+            return 0.0
         return self._matrix[1, 2]
 
     @property
     def m33(self):
         """float: The m33 component of the matrix."""
+        if self._matrix is None:
+            return 1.0
         return self._matrix[2, 2]
 
     @property
     def m34(self):
         """float: The m34 component of the matrix."""
+        if self._matrix is None:
+            return 0.0
         return self._matrix[3, 2]
 
     @property
     def m41(self):
         """float: The m41 component of the matrix."""
+        if self._matrix is None:
+            return self._e
         return self._matrix[0, 3]
 
     @property
     def m42(self):
         """float: The m42 component of the matrix."""
+        if self._matrix is None:
+            return self._f
         return self._matrix[1, 3]
 
     @property
     def m43(self):
         """float: The m43 component of the matrix."""
+        if self._matrix is None:
+            return 0.0
         return self._matrix[2, 3]
 
     @property
     def m44(self):
+        if self._matrix is None:
+            return 1.0
         return self._matrix[3, 3]
 
     @property
     def matrix(self):
-        """numpy.array: The current matrix."""
+        """numpy.array: The current matrix.
+        For a matrix that is held as six floats, a new 4x4 matrix is
+        returned.
+        """
+        if self._matrix is None:
+            return matrix2d(self._a, self._b, self._c, self._d,
+                            self._e, self._f)
+        return self._matrix
+
+    def _copy(self):
+        m = DOMMatrix.__new__(DOMMatrix)
+        m._a, m._b, m._c, m._d, m._e, m._f = self._get_2d()
+        m._matrix = None if self._matrix is None else self._matrix.copy()
+        m._is2d = self._is2d
+        return m
+
+    def _get_2d(self):
+        if self._matrix is None:
+            return self._a, self._b, self._c, self._d, self._e, self._f
+        m = self._matrix
+        return m[0, 0], m[1, 0], m[0, 1], m[1, 1], m[0, 3], m[1, 3]
+
+    def _set_2d(self, a, b, c, d, e, f):
+        self._a = float(a)
+        self._b = float(b)
+        self._c = float(c)
+        self._d = float(d)
+        self._e = float(e)
+        self._f = float(f)
+        self._matrix = None
+
+    def _set_3d(self, m11, m12, m13, m14,
+                m21, m22, m23, m24,
+                m31, m32, m33, m34,
+                m41, m42, m43, m44):
+        if (m13 == 0 and m14 == 0 and m23 == 0 and m24 == 0
+                and m31 == 0 and m32 == 0 and m33 == 1 and m34 == 0
+                and m43 == 0 and m44 == 1):
+            self._set_2d(m11, m12, m21, m22, m41, m42)
+        else:
+            self._matrix = matrix3d(m11, m12, m13, m14,
+                                    m21, m22, m23, m24,
+                                    m31, m32, m33, m34,
+                                    m41, m42, m43, m44)
+
+    def _to_3d(self):
+        if self._matrix is None:
+            self._matrix = matrix2d(self._a, self._b, self._c, self._d,
+                                    self._e, self._f)
         return self._matrix
 
     def _init_from_array(self, values):
         if len(values) == 6:
-            self._matrix = matrix2d(*values)
+            self._set_2d(*values)
             self._is2d = True
         elif len(values) == 16:
-            self._matrix = matrix3d(*values)
+            self._set_3d(*values)
             self._is2d = False
         else:
             raise TypeError("'values' required 6 elements for a 2d matrix"
@@ -303,7 +427,7 @@ class DOMMatrixReadOnly(object):
 
     def _init_from_matrix(self, **init):
         if len(init) == 0:
-            self._matrix = matrix2d(1, 0, 0, 1, 0, 0)
+            self._set_2d(1, 0, 0, 1, 0, 0)
             self._is2d = True
             return
         a = init.pop('a', None)
@@ -387,7 +511,7 @@ class DOMMatrixReadOnly(object):
                     or (m44 is not None and m44 != 1)):
                 raise ValueError('Invalid keyword argument(s) for a 2d matrix')
         if is2d is None or is2d:
-            self._matrix = matrix2d(m11, m12, m21, m22, m41, m42)
+            self._set_2d(m11, m12, m21, m22, m41, m42)
             self._is2d = True
         else:
             if m13 is None:
@@ -410,10 +534,10 @@ class DOMMatrixReadOnly(object):
                 m43 = 0
             if m44 is None:
                 m44 = 1
-            self._matrix = matrix3d(m11, m12, m13, m14,
-                                    m21, m22, m23, m24,
-                                    m31, m32, m33, m34,
-                                    m41, m42, m43, m44)
+            self._set_3d(m11, m12, m13, m14,
+                         m21, m22, m23, m24,
+                         m31, m32, m33, m34,
+                         m41, m42, m43, m44)
             self._is2d = False
 
     def flip_x(self):
@@ -529,7 +653,7 @@ class DOMMatrixReadOnly(object):
         Returns:
             DOMMatrix: The resulting matrix.
         """
-        m = DOMMatrix(self.tolist())
+        m = self._copy()
         m.invert_self()
         return m
 
@@ -558,17 +682,17 @@ class DOMMatrixReadOnly(object):
         Returns:
             DOMMatrix: The resulting matrix.
         """
-        m = DOMMatrix(self.tolist())
+        m = self._copy()
         m.rotate_self(rot_x, rot_y, rot_z)
         return m
 
     def rotate_axis_angle(self, x=0, y=0, z=0, angle=0):
-        m = DOMMatrix(self.tolist())
+        m = self._copy()
         m.rotate_axis_angle_self(x, y, z, angle)
         return m
 
     def rotate_from_vector(self, x=0, y=0):
-        m = DOMMatrix(self.tolist())
+        m = self._copy()
         m.rotate_from_vector_self(x, y)
         return m
 
@@ -588,12 +712,12 @@ class DOMMatrixReadOnly(object):
         Returns:
             DOMMatrix: The resulting matrix.
         """
-        m = DOMMatrix(self.tolist())
+        m = self._copy()
         m.scale_self(scale_x, scale_y, scale_z, origin_x, origin_y, origin_z)
         return m
 
     def scale3d(self, scale=1, origin_x=0, origin_y=0, origin_z=0):
-        m = DOMMatrix(self.tolist())
+        m = self._copy()
         m.scale3d_self(scale, origin_x, origin_y, origin_z)
         return m
 
@@ -607,7 +731,7 @@ class DOMMatrixReadOnly(object):
         Returns:
             DOMMatrix: The resulting matrix.
         """
-        m = DOMMatrix(self.tolist())
+        m = self._copy()
         m.skew_x_self(angle)
         return m
 
@@ -621,7 +745,7 @@ class DOMMatrixReadOnly(object):
         Returns:
             DOMMatrix: The resulting matrix.
         """
-        m = DOMMatrix(self.tolist())
+        m = self._copy()
         m.skew_y_self(angle)
         return m
 
@@ -693,6 +817,15 @@ class DOMMatrixReadOnly(object):
         Returns:
              tuple[float, ...]: The resulting coordinates.
         """
+        if self._matrix is None:
+            x = float(x)
+            y = float(y)
+            w = float(w)
+            x, y = (self._a * x + self._c * y + self._e * w,
+                    self._b * x + self._d * y + self._f * w)
+            if self._is2d and z == 0 and w == 1:
+                return x, y
+            return x, y, float(z), w
         pt = np.array([[float(x)], [float(y)], [float(z)], [float(w)]])
         pt = np.dot(self._matrix, pt)
         if self._is2d and z == 0 and w == 1:
@@ -711,7 +844,7 @@ class DOMMatrixReadOnly(object):
         Returns:
             DOMMatrix: The resulting matrix.
         """
-        m = DOMMatrix(self.tolist())
+        m = self._copy()
         m.translate_self(tx, ty, tz)
         return m
 
@@ -720,6 +853,8 @@ class DOMMatrix(DOMMatrixReadOnly):
     # TODO: implement DOMMatrix.setMatrixValue().
     """Represents the [geometry] DOMMatrix."""
 
+    __slots__ = ()
+
     def __init__(self, values=None, **init):
         """Constructs a DOMMatrix object.
 
@@ -762,115 +897,171 @@ class DOMMatrix(DOMMatrixReadOnly):
     def __repr__(self):
         return '<{}.{} object at {} {}>'.format(
             type(self).__module__, type(self).__name__, hex(id(self)),
-            self._matrix.tolist())
+            self.matrix.tolist())
 
     @DOMMatrixReadOnly.a.setter
     def a(self, value):
-        self._matrix[0, 0] = float(value)
+        if self._matrix is None:
+            self._a = float(value)
+        else:
+            self._matrix[0, 0] = float(value)
 
     @DOMMatrixReadOnly.b.setter
     def b(self, value):
-        self._matrix[1, 0] = float(value)
+        if self._matrix is None:
+            self._b = float(value)
+        else:
+            self._matrix[1, 0] = float(value)
 
     @DOMMatrixReadOnly.c.setter
     def c(self, value):
-        self._matrix[0, 1] = float(value)
+        if self._matrix is None:
+            self._c = float(value)
+        else:
+            self._matrix[0, 1] = float(value)
 
     @DOMMatrixReadOnly.d.setter
     def d(self, value):
-        self._matrix[1, 1] = float(value)
+        if self._matrix is None:
+            self._d = float(value)
+        else:
+            self._matrix[1, 1] = float(value)
 
     @DOMMatrixReadOnly.e.setter
     def e(self, value):
-        self._matrix[0, 3] = float(value)
+        if self._matrix is None:
+            self._e = float(value)
+        else:
+            self._matrix[0, 3] = float(value)
 
     @DOMMatrixReadOnly.f.setter
     def f(self, value):
-        self._matrix[1, 3] = float(value)
+        if self._matrix is None:
+            self._f = float(value)
+        else:
+            self._matrix[1, 3] = float(value)
 
     @DOMMatrixReadOnly.m11.setter
     def m11(self, value):
-        self._matrix[0, 0] = float(value)
+        if self._matrix is None:
+            self._a = float(value)
+        else:
+            self._matrix[0, 0] = float(value)
 
     @DOMMatrixReadOnly.m12.setter
     def m12(self, value):
-        self._matrix[1, 0] = float(value)
+        if self._matrix is None:
+            self._b = float(value)
+        else:
+            self._matrix[1, 0] = float(value)
 
     @DOMMatrixReadOnly.m13.setter
     def m13(self, value):
-        self._matrix[2, 0] = float(value)
         if value:
+            self._to_3d()[2, 0] = float(value)
             self._is2d = False
+        elif self._matrix is not None:
+            self._matrix[2, 0] = float(value)
 
     @DOMMatrixReadOnly.m14.setter
     def m14(self, value):
-        self._matrix[3, 0] = float(value)
         if value:
+            self._to_3d()[3, 0] = float(value)
             self._is2d = False
+        elif self._matrix is not None:
+            self._matrix[3, 0] = float(value)
 
     @DOMMatrixReadOnly.m21.setter
     def m21(self, value):
-        self._matrix[0, 1] = float(value)
+        if self._matrix is None:
+            self._c = float(value)
+        else:
+            self._matrix[0, 1] = float(value)
 
     @DOMMatrixReadOnly.m22.setter
     def m22(self, value):
-        self._matrix[1, 1] = float(value)
+        if self._matrix is None:
+            self._d = float(value)
+        else:
+            self._matrix[1, 1] = float(value)
 
     @DOMMatrixReadOnly.m23.setter
     def m23(self, value):
-        self._matrix[2, 1] = float(value)
         if value:
+            self._to_3d()[2, 1] = float(value)
             self._is2d = False
+        elif self._matrix is not None:
+            self._matrix[2, 1] = float(value)
 
     @DOMMatrixReadOnly.m24.setter
     def m24(self, value):
-        self._matrix[3, 1] = float(value)
         if value:
+            self._to_3d()[3, 1] = float(value)
             self._is2d = False
+        elif self._matrix is not None:
+            self._matrix[3, 1] = float(value)
 
     @DOMMatrixReadOnly.m31.setter
     def m31(self, value):
-        self._matrix[0, 2] = float(value)
         if value:
+            self._to_3d()[0, 2] = float(value)
             self._is2d = False
+        elif self._matrix is not None:
+            self._matrix[0, 2] = float(value)
 
     @DOMMatrixReadOnly.m32.setter
     def m32(self, value):
-        self._matrix[1, 2] = float(value)
         if value:
+            self._to_3d()[1, 2] = float(value)
             self._is2d = False
+        elif self._matrix is not None:
+            self._matrix[1, 2] = float(value)
 
     @DOMMatrixReadOnly.m33.setter
     def m33(self, value):
-        self._matrix[2, 2] = float(value)
         if value != 1:
+            self._to_3d()[2, 2] = float(value)
             self._is2d = False
+        elif self._matrix is not None:
+            self._matrix[2, 2] = float(value)
 
     @DOMMatrixReadOnly.m34.setter
     def m34(self, value):
-        self._matrix[3, 2] = float(value)
         if value:
+            self._to_3d()[3, 2] = float(value)
             self._is2d = False
+        elif self._matrix is not None:
+            self._matrix[3, 2] = float(value)
 
     @DOMMatrixReadOnly.m41.setter
     def m41(self, value):
-        self._matrix[0, 3] = float(value)
+        if self._matrix is None:
+            self._e = float(value)
+        else:
+            self._matrix[0, 3] = float(value)
 
     @DOMMatrixReadOnly.m42.setter
     def m42(self, value):
-        self._matrix[1, 3] = float(value)
+        if self._matrix is None:
+            self._f = float(value)
+        else:
+            self._matrix[1, 3] = float(value)
 
     @DOMMatrixReadOnly.m43.setter
     def m43(self, value):
-        self._matrix[2, 3] = float(value)
         if value:
+            self._to_3d()[2, 3] = float(value)
             self._is2d = False
+        elif self._matrix is not None:
+            self._matrix[2, 3] = float(value)
 
     @DOMMatrixReadOnly.m44.setter
     def m44(self, value):
-        self._matrix[3, 3] = float(value)
         if value != 1:
+            self._to_3d()[3, 3] = float(value)
             self._is2d = False
+        elif self._matrix is not None:
+            self._matrix[3, 3] = float(value)
 
     def clear(self, is2d=None):
         """Sets the matrix [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1].
@@ -880,12 +1071,9 @@ class DOMMatrix(DOMMatrixReadOnly):
         Returns:
             DOMMatrix: Returns itself.
         """
-        _is2d = self._is2d if is2d is None else is2d
-        self._init_from_array([1, 0, 0, 0,
-                               0, 1, 0, 0,
-                               0, 0, 1, 0,
-                               0, 0, 0, 1])
-        self._is2d = _is2d
+        if is2d is not None:
+            self._is2d = is2d
+        self._set_2d(1, 0, 0, 1, 0, 0)
         return self
 
     @staticmethod
@@ -920,7 +1108,15 @@ class DOMMatrix(DOMMatrixReadOnly):
         Returns:
             DOMMatrix: Returns itself.
         """
-        self._matrix = np.linalg.inv(self._matrix)
+        if self._matrix is not None:
+            self._matrix = np.linalg.inv(self._matrix)
+            return self
+        a, b, c, d, e, f = self._get_2d()
+        det = a * d - b * c
+        if det == 0:
+            raise np.linalg.LinAlgError('Singular matrix')
+        self._set_2d(d / det, -b / det, -c / det, a / det,
+                     (c * f - d * e) / det, (b * e - a * f) / det)
         return self
 
     def multiply_self(self, other):
@@ -931,7 +1127,10 @@ class DOMMatrix(DOMMatrixReadOnly):
         Returns:
             DOMMatrix: Returns itself.
         """
-        self._matrix = np.dot(self._matrix, other._matrix)
+        if self._matrix is None and other._matrix is None:
+            self._set_2d(*_multiply2d(self._get_2d(), other._get_2d()))
+        else:
+            self._matrix = np.dot(self._to_3d(), other.matrix)
         if not other._is2d:
             self._is2d = False
         return self
@@ -948,7 +1147,12 @@ class DOMMatrix(DOMMatrixReadOnly):
         t = math.radians(angle)
         sin = math.sin(t)
         cos = math.cos(t)
-        if x == 0 and y == 0 and z == 1:
+        if x == 0 and y == 0 and z == 1 and self._matrix is None:
+            # [0, 0, 1, rot_z]
+            self._set_2d(*_multiply2d(self._get_2d(),
+                                      (cos, sin, -sin, cos, 0, 0)))
+            return self
+        elif x == 0 and y == 0 and z == 1:
             # [0, 0, 1, rot_z]
             r = matrix3d(cos, sin, 0, 0,
                          -sin, cos, 0, 0,
@@ -987,7 +1191,7 @@ class DOMMatrix(DOMMatrixReadOnly):
                          m21, m22, m23, m24,
                          m31, m32, m33, m34,
                          m41, m42, m43, m44)
-        self._matrix = np.dot(self._matrix, r)
+        self._matrix = np.dot(self._to_3d(), r)
         if x != 0 or y != 0:
             self._is2d = False
         return self
@@ -1040,11 +1244,15 @@ class DOMMatrix(DOMMatrixReadOnly):
             return self
         if origin_x != 0 or origin_y != 0 or origin_z != 0:
             self.translate_self(origin_x, origin_y, origin_z)
-        m = matrix3d(scale_x, 0, 0, 0,
-                     0, scale_y, 0, 0,
-                     0, 0, scale_z, 0,
-                     0, 0, 0, 1)
-        self._matrix = np.dot(self._matrix, m)
+        if self._matrix is None and scale_z == 1:
+            self._set_2d(*_multiply2d(self._get_2d(),
+                                      (scale_x, 0, 0, scale_y, 0, 0)))
+        else:
+            m = matrix3d(scale_x, 0, 0, 0,
+                         0, scale_y, 0, 0,
+                         0, 0, scale_z, 0,
+                         0, 0, 0, 1)
+            self._matrix = np.dot(self._to_3d(), m)
         if scale_z != 1 or origin_z != 0:
             self._is2d = False
         if origin_x != 0 or origin_y != 0 or origin_z != 0:
@@ -1063,8 +1271,11 @@ class DOMMatrix(DOMMatrixReadOnly):
         Returns:
             DOMMatrix: Returns itself.
         """
-        m = matrix2d(1, 0, math.tan(math.radians(angle)), 1, 0, 0)
-        self._matrix = np.dot(self._matrix, m)
+        m = 1, 0, math.tan(math.radians(angle)), 1, 0, 0
+        if self._matrix is None:
+            self._set_2d(*_multiply2d(self._get_2d(), m))
+        else:
+            self._matrix = np.dot(self._matrix, matrix2d(*m))
         return self
 
     def skew_y_self(self, angle):
@@ -1075,8 +1286,11 @@ class DOMMatrix(DOMMatrixReadOnly):
         Returns:
             DOMMatrix: Returns itself.
         """
-        m = matrix2d(1, math.tan(math.radians(angle)), 0, 1, 0, 0)
-        self._matrix = np.dot(self._matrix, m)
+        m = 1, math.tan(math.radians(angle)), 0, 1, 0, 0
+        if self._matrix is None:
+            self._set_2d(*_multiply2d(self._get_2d(), m))
+        else:
+            self._matrix = np.dot(self._matrix, matrix2d(*m))
         return self
 
     def translate_self(self, tx=0, ty=0, tz=0):
@@ -1092,11 +1306,15 @@ class DOMMatrix(DOMMatrixReadOnly):
         """
         if tx == 0 and ty == 0 and tz == 0:
             return self
+        if self._matrix is None and tz == 0:
+            self._e += self._a * tx + self._c * ty
+            self._f += self._b * tx + self._d * ty
+            return self
         m = matrix3d(1, 0, 0, 0,
                      0, 1, 0, 0,
                      0, 0, 1, 0,
                      tx, ty, tz, 1)
-        self._matrix = np.dot(self._matrix, m)
+        self._matrix = np.dot(self._to_3d(), m)
         if tz != 0:
             self._is2d = False
         return self
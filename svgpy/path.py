@@ -18,12 +18,12 @@ import math
 import re
 
 import numpy as np
-from scipy.integrate import quad
+from numpy.polynomial.legendre import leggauss
 from scipy.special import ellipeinc
 
 from .core import SVGLength
 from .formatter import format_number_sequence, to_coordinate_pair_sequence
-from .freetype import FTMatrix
+from .freetype import FreeType
 from .geometry.matrix import DOMMatrix
 from .geometry.rect import DOMRect
 
@@ -38,7 +38,233 @@ def get_angle(y, x):
     return d
 
 
+# nodes and weights of 16-point Gauss-Legendre quadrature
+_GAUSS_LEGENDRE = leggauss(16)
+
+
+def _integrate(speed, index, t0, t1):
+    """Returns the integrals of the speed functions over [t0, t1] by 16-point
+    Gauss-Legendre quadrature.
+    """
+    nodes, weights = _GAUSS_LEGENDRE
+    half = (t1 - t0) / 2
+    t = (t0 + half)[:, np.newaxis] + half[:, np.newaxis] * nodes
+    return half * speed(index, t).dot(weights)
+
+
+def _integrate_adaptive(speed, count, tolerance, max_depth):
+    """Integrates the speed functions over [0, 1] by adaptive Gauss-Legendre
+    quadrature, and returns the accepted subintervals.
+    The error of an interval is estimated as the difference between the
+    estimate of the whole interval and the sum of the estimates of its two
+    halves, and an interval whose error exceeds its share of the tolerance is
+    bisected.
+
+    Arguments:
+        speed (callable): A function that takes the indices of the functions
+            of shape (k,) and the parameters of shape (k, m), and returns the
+            speeds of shape (k, m).
+        count (int): The number of the functions.
+        tolerance (float): The maximum absolute error of each integral.
+        max_depth (int): The maximum number of subdivisions.
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray,
+            numpy.ndarray]: The indices of the functions, the starting and
+            the end parameters, the integrals and the estimated absolute
+            errors of the accepted subintervals.
+    """
+    accepted = list()
+    index = np.arange(count)
+    t0 = np.zeros(count)
+    t1 = np.ones(count)
+    whole = _integrate(speed, index, t0, t1)
+    for depth in range(max_depth + 1):
+        middle = (t0 + t1) / 2
+        left = _integrate(speed, index, t0, middle)
+        right = _integrate(speed, index, middle, t1)
+        refined = left + right
+        error = np.abs(refined - whole)
+        # distribute the tolerance over the subintervals
+        done = error <= tolerance * (t1 - t0)
+        if depth == max_depth:
+            done[:] = True
+        accepted.append((index[done], t0[done], t1[done], refined[done],
+                         error[done]))
+        if done.all():
+            break
+        rest = ~done
+        index = np.concatenate((index[rest], index[rest]))
+        t0, t1 = (np.concatenate((t0[rest], middle[rest])),
+                  np.concatenate((middle[rest], t1[rest])))
+        whole = np.concatenate((left[rest], right[rest]))
+    return tuple(np.concatenate(arrays) for arrays in zip(*accepted))
+
+
+def _get_arc_parameters(x1, y1, rx, ry, x_axis_rotation, large_arc_flag,
+                        sweep_flag, x2, y2):
+    """Returns the center parameterization of the elliptical arc:
+    [cx, cy, rx, ry, cos(x-axis-rotation), sin(x-axis-rotation), start
+    angle, sweep angle] in radians, or None if the arc is treated as a
+    straight line.
+    """
+    # See https://www.w3.org/TR/SVG2/implnote.html#ArcImplementationNotes
+    rx = abs(rx)
+    ry = abs(ry)
+    if (math.isclose(rx, 0,
+                     rel_tol=SVGLength.rel_tol,
+                     abs_tol=SVGLength.abs_tol)
+            or math.isclose(ry, 0,
+                            rel_tol=SVGLength.rel_tol,
+                            abs_tol=SVGLength.abs_tol)
+            or (x1 == x2 and y1 == y2)):
+        return None
+    r = math.radians(x_axis_rotation)
+    cos_r = math.cos(r)
+    sin_r = math.sin(r)
+    dx = (x1 - x2) / 2
+    dy = (y1 - y2) / 2
+    x1p = cos_r * dx + sin_r * dy
+    y1p = -sin_r * dx + cos_r * dy
+    k = (x1p / rx) ** 2 + (y1p / ry) ** 2
+    if k > 1:
+        rx *= math.sqrt(k)
+        ry *= math.sqrt(k)
+    f = math.sqrt(max(((rx * ry) ** 2 - (rx * y1p) ** 2 - (ry * x1p) ** 2)
+                      / ((rx * y1p) ** 2 + (ry * x1p) ** 2), 0))
+    if (large_arc_flag != 0) == (sweep_flag != 0):
+        f = -f
+    cxp = f * rx * y1p / ry
+    cyp = -f * ry * x1p / rx
+    cx = cos_r * cxp - sin_r * cyp + (x1 + x2) / 2
+    cy = sin_r * cxp + cos_r * cyp + (y1 + y2) / 2
+    theta1 = math.atan2((y1p - cyp) / ry, (x1p - cxp) / rx)
+    theta2 = math.atan2((-y1p - cyp) / ry, (-x1p - cxp) / rx)
+    delta = theta2 - theta1
+    if sweep_flag == 0 and delta > 0:
+        delta -= 2 * math.pi
+    elif sweep_flag != 0 and delta < 0:
+        delta += 2 * math.pi
+    return [cx, cy, rx, ry, cos_r, sin_r, theta1, delta]
+
+
+def _get_parameters(path_type, values):
+    """Returns the parameters of the part of the path yielded by
+    PathParser._iter_primitives(), and whether it is an elliptical arc.
+    A straight line, a cubic bezier curve and a point are represented by the
+    coefficients of the cubic polynomial [ax, ay, bx, by, cx, cy, dx, dy],
+    and an elliptical arc is represented by its center parameterization.
+    """
+    if path_type == 'M':
+        return [0, 0, 0, 0, 0, 0] + values, False
+    x0, y0 = values[:2]
+    if path_type == 'A':
+        arc = _get_arc_parameters(x0, y0, *values[2:])
+        if arc is not None:
+            return arc, True
+        # treat as a straight line from start point to end point
+        values = [x0, y0] + values[-2:]
+    if path_type == 'C':
+        p0, p1, p2, p3 = np.array(values).reshape(4, 2)
+        a = -p0 + 3 * p1 - 3 * p2 + p3
+        b = 3 * p0 - 6 * p1 + 3 * p2
+        c = 3 * (p1 - p0)
+        return [a[0], a[1], b[0], b[1], c[0], c[1], x0, y0], False
+    return [0, 0, 0, 0, values[2] - x0, values[3] - y0, x0, y0], False
+
+
+def _get_points(parameters, arcs, t):
+    """Returns the points of the parts of the path at the parameters t.
+
+    Arguments:
+        parameters (numpy.ndarray): An array of shape (n, 8) of the
+            parameters of the parts of the path.
+        arcs (numpy.ndarray): An array of shape (n,) whether each part is an
+            elliptical arc.
+        t (numpy.ndarray): An array of shape (n,) of the parameters.
+    Returns:
+        numpy.ndarray: An array of shape (n, 2) of the points.
+    """
+    p = parameters
+    # cubic bezier curves, straight lines and points
+    x = ((p[:, 0] * t + p[:, 2]) * t + p[:, 4]) * t + p[:, 6]
+    y = ((p[:, 1] * t + p[:, 3]) * t + p[:, 5]) * t + p[:, 7]
+    if arcs.any():
+        # elliptical arcs
+        theta = p[:, 6] + p[:, 7] * t
+        ex = p[:, 2] * np.cos(theta)
+        ey = p[:, 3] * np.sin(theta)
+        x = np.where(arcs, p[:, 4] * ex - p[:, 5] * ey + p[:, 0], x)
+        y = np.where(arcs, p[:, 5] * ex + p[:, 4] * ey + p[:, 1], y)
+    return np.stack((x, y), axis=1)
+
+
+def _transform_elliptical_arcs(matrix, rx, ry, x_axis_rotation, sweep_flag):
+    """Returns the parameters of the elliptical arcs transformed by the
+    transformation matrix.
+
+    Arguments:
+        matrix (DOMMatrixReadOnly): The transformation matrix.
+        rx (numpy.ndarray): The x-axis radii of the ellipses.
+        ry (numpy.ndarray): The y-axis radii of the ellipses.
+        x_axis_rotation (numpy.ndarray): The angles from the x-axis of the
+            ellipses in degrees.
+        sweep_flag (numpy.ndarray): The sweep flags of the elliptical arcs.
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+            The new radii, x-axis rotations and sweep flags.
+    """
+    a, b, c, d = matrix.a, matrix.b, matrix.c, matrix.d
+    rx = np.abs(rx)
+    ry = np.abs(ry)
+    r = np.radians(x_axis_rotation)
+    cos_r = np.cos(r)
+    sin_r = np.sin(r)
+
+    # the conjugate diameters of the transformed ellipse: (ux,uy) and (vx,vy)
+    ux = (a * cos_r + c * sin_r) * rx
+    uy = (b * cos_r + d * sin_r) * rx
+    vx = (c * cos_r - a * sin_r) * ry
+    vy = (d * cos_r - b * sin_r) * ry
+
+    # the semi-axes are the square roots of the eigenvalues of
+    # [[s00, s01], [s01, s11]]
+    s00 = ux ** 2 + vx ** 2
+    s11 = uy ** 2 + vy ** 2
+    s01 = ux * uy + vx * vy
+    mean = (s00 + s11) / 2
+    diff = np.hypot((s00 - s11) / 2, s01)
+    major = np.sqrt(mean + diff)
+    minor = np.sqrt(np.maximum(mean - diff, 0))
+    angle = np.degrees(np.arctan2(2 * s01, s00 - s11)) / 2
+
+    # keep the x-axis radius on the transformed x-axis of the ellipse
+    swap = rx < ry
+    new_rx = np.where(swap, minor, major)
+    new_ry = np.where(swap, major, minor)
+    angle = np.where(swap, angle + 90, angle)
+    reference = np.degrees(np.arctan2(uy, ux))
+    angle += 180 * np.round((reference - angle) / 180)
+
+    # a circle keeps its x-axis rotation
+    circle = np.isclose(major, minor,
+                        rtol=SVGLength.rel_tol, atol=SVGLength.abs_tol)
+    angle = np.where(circle, x_axis_rotation, angle)
+
+    # a reflection reverses the direction of the arc
+    if a * d - b * c < 0:
+        sweep_flag = np.where(sweep_flag == 0, 1, 0)
+    return new_rx, new_ry, angle, sweep_flag
+
+
 class CubicBezierCurve(object):
+    length_tol = 1e-9
+    """float: The default maximum absolute error of the length of a curve."""
+
+    max_depth = 24
+    """int: The default maximum number of subdivisions of a curve to compute
+    its length.
+    """
+
     def __init__(self, p0, p1, p2, p3):
         """Constructs a CubicBezierCurve object.
 
@@ -57,12 +283,6 @@ class CubicBezierCurve(object):
         self._p2 = p2
         self._p3 = p3
 
-    @staticmethod
-    def _get_length_integrand(t, c0, c1, c2, c3, c4):
-        # use Hartmut Henkel method
-        # See http://www.circuitwizard.de/metapost/arclength.pdf
-        return math.sqrt(c4 * t ** 4 + c3 * t ** 3 + c2 * t ** 2 + c1 * t + c0)
-
     def get_bbox(self, options=None, **extra):
         """Returns the bounding box of the cubic bezier curve.
 
@@ -93,6 +313,47 @@ class CubicBezierCurve(object):
         height = max(y_sequence) - y
         return DOMRect(x, y, width, height)
 
+    @staticmethod
+    def get_extrema(curves):
+        """Returns the points of the cubic bezier curves where the tangent is
+        horizontal or vertical.
+
+        Arguments:
+            curves (numpy.ndarray): An array of shape (n, 4, 2) of the
+                absolute coordinates of the starting point, the two control
+                points and the end point of n cubic bezier curves.
+        Returns:
+            numpy.ndarray: An array of shape (4 * n, 2) of the points. If a
+                curve has less than four extrema, the starting point of the
+                curve is used instead.
+        """
+        p0 = curves[:, 0]
+        p1 = curves[:, 1]
+        p2 = curves[:, 2]
+        p3 = curves[:, 3]
+        a = -p0 + 3 * p1 - 3 * p2 + p3
+        b = 3 * p0 - 6 * p1 + 3 * p2
+        c = -3 * p0 + 3 * p1
+
+        # solve 3at^2 + 2bt + c = 0 for x and y at once
+        # See https://en.wikipedia.org/wiki/Loss_of_significance
+        qa = 3 * a
+        qb = 2 * b
+        qc = c
+        with np.errstate(divide='ignore', invalid='ignore'):
+            discriminant = qb ** 2 - 4 * qa * qc
+            q = -0.5 * (qb + np.where(qb < 0, -1, 1)
+                        * np.sqrt(np.maximum(discriminant, 0)))
+            roots = np.concatenate((q / qa, qc / q), axis=1)  # (n, 4)
+            valid = np.concatenate((discriminant >= 0,) * 2, axis=1)
+            valid &= (roots >= 0) & (roots <= 1)
+        roots[~valid] = 0
+
+        t = roots[:, :, np.newaxis]
+        points = (((a[:, np.newaxis] * t + b[:, np.newaxis]) * t
+                   + c[:, np.newaxis]) * t + p0[:, np.newaxis])
+        return points.reshape(-1, 2)
+
     def get_coefficients(self):
         """Calculates the coefficients for a cubic polynomial equation."""
         a = -self._p0 + 3 * self._p1 - 3 * self._p2 + self._p3
@@ -101,30 +362,80 @@ class CubicBezierCurve(object):
         d = self._p0
         return a, b, c, d
 
-    def get_length(self):
+    def get_length(self, tolerance=None):
         """Returns the length of the bezier curve.
 
+        Arguments:
+            tolerance (float, optional): The maximum absolute error of the
+                length. Defaults to CubicBezierCurve.length_tol.
         Returns:
             float: The length of the bezier curve.
         """
+        curves = np.array([self._p0, self._p1, self._p2, self._p3],
+                          dtype=np.float64).reshape(1, 4, 2)
+        lengths, _ = CubicBezierCurve.get_lengths(curves, tolerance)
+        return lengths.item(0)
+
+    @staticmethod
+    def get_lengths(curves, tolerance=None, max_depth=None):
+        """Returns the lengths of the cubic bezier curves and their error
+        bounds.
+        The lengths are computed by fixed-order Gauss-Legendre quadrature
+        over all curves at once. The error of a curve is estimated as the
+        difference between the estimate of the whole curve and the sum of
+        the estimates of its two halves, and a curve whose error exceeds the
+        tolerance is subdivided until it meets the tolerance.
+
+        Arguments:
+            curves (numpy.ndarray): An array of shape (n, 4, 2) of the
+                absolute coordinates of the starting point, the two control
+                points and the end point of n cubic bezier curves.
+            tolerance (float, optional): The maximum absolute error of the
+                length of each curve. Defaults to CubicBezierCurve.length_tol.
+            max_depth (int, optional): The maximum number of subdivisions.
+                Defaults to CubicBezierCurve.max_depth.
+        Returns:
+            numpy.ndarray: The lengths of the curves.
+            numpy.ndarray: The estimated absolute errors of the lengths.
+        """
+        if tolerance is None:
+            tolerance = CubicBezierCurve.length_tol
+        if max_depth is None:
+            max_depth = CubicBezierCurve.max_depth
+        curves = np.asarray(curves, dtype=np.float64).reshape(-1, 4, 2)
+        count = len(curves)
+        if count == 0:
+            return np.zeros(0), np.zeros(0)
+
+        # |B'(t)|^2 = c4t^4 + c3t^3 + c2t^2 + c1t + c0
         # use Hartmut Henkel method
         # See http://www.circuitwizard.de/metapost/arclength.pdf
-        v3, v2, v1, _ = self.get_coefficients()
-        # v3 = -p0 + 3 * p1 - 3 * p2 + p3
-        # v2 = 3 * (p0 - 2 * p1 + p2)
-        # v1 = 3 * (p1 - p0)
-        a1, b1 = v1
-        a2, b2 = v2
-        a3, b3 = v3
-        c4 = 9 * (a3 ** 2 + b3 ** 2)
-        c3 = 12 * (a3 * a2 + b3 * b2)
-        c2 = 6 * (a3 * a1 + b3 * b1) + 4 * (a2 ** 2 + b2 ** 2)
-        c1 = 4 * (a2 * a1 + b2 * b1)
-        c0 = a1 ** 2 + b1 ** 2
-        result = quad(CubicBezierCurve._get_length_integrand,
-                      0, 1,
-                      args=(c0, c1, c2, c3, c4))
-        return result[0]
+        p0 = curves[:, 0]
+        p1 = curves[:, 1]
+        p2 = curves[:, 2]
+        p3 = curves[:, 3]
+        v3 = -p0 + 3 * p1 - 3 * p2 + p3
+        v2 = 3 * (p0 - 2 * p1 + p2)
+        v1 = 3 * (p1 - p0)
+        polynomials = np.stack(
+            (9 * (v3 ** 2).sum(axis=1),
+             12 * (v3 * v2).sum(axis=1),
+             6 * (v3 * v1).sum(axis=1) + 4 * (v2 ** 2).sum(axis=1),
+             4 * (v2 * v1).sum(axis=1),
+             (v1 ** 2).sum(axis=1)), axis=1)
+
+        def _speed(_index, _t):
+            _c = polynomials[_index]
+            _squared = _c[:, 0, np.newaxis]
+            for _k in range(1, 5):
+                _squared = _squared * _t + _c[:, _k, np.newaxis]
+            return np.sqrt(np.maximum(_squared, 0))
+
+        index, _, _, refined, error = _integrate_adaptive(
+            _speed, count, tolerance, max_depth)
+        lengths = np.bincount(index, weights=refined, minlength=count)
+        errors = np.bincount(index, weights=error, minlength=count)
+        return lengths, errors
 
     def get_roots(self):
         # See http://floris.briolas.nl/floris/2009/10/bounding-box-of-cubic-bezier/
@@ -1130,8 +1441,10 @@ class PathSegment(object):
             # 'A'|'a' (rx,ry x-axis-rotation large-arc-flag sweep-flag x,y)+
             rx, ry, x_axis_rotation, fa, fs, x, y = abs_path_segment.values
             x, y = matrix.transform_point(x, y)
-            # x_axis_rotation += matrix.get_angle()
-            return SVGPathSegment('A', rx, ry, x_axis_rotation, fa, fs, x, y)
+            rx, ry, x_axis_rotation, fs = _transform_elliptical_arcs(
+                matrix, rx, ry, x_axis_rotation, fs)
+            return SVGPathSegment('A', float(rx), float(ry),
+                                  float(x_axis_rotation), fa, int(fs), x, y)
         elif path_type == 'C':
             # 'C'|'c' (x1,y1 x2,y2 x,y)+
             x1, y1, x2, y2, x, y = abs_path_segment.values
@@ -1166,6 +1479,401 @@ class PathSegment(object):
         raise NotImplementedError('Unsupported path type: ' + repr(path_type))
 
 
+class PathData(object):
+    """Represents a compact sequence of path segments.
+
+    The commands of the path segments are stored as character codes in a
+    contiguous array of unsigned bytes, and their values are stored in a
+    single contiguous array of floats. Indexing and iteration yield
+    SVGPathSegment objects, so that a PathData object can be used in place of
+    a list of path segments.
+    """
+
+    # number of values for each command (-1: unsupported command)
+    _ARGC = np.full(256, -1, dtype=np.intp)
+    for _path_type, _argc in {'A': 7, 'B': 1, 'C': 6, 'H': 1, 'L': 2, 'M': 2,
+                              'Q': 4, 'S': 4, 'T': 2, 'V': 1, 'Z': 0}.items():
+        _ARGC[ord(_path_type)] = _argc
+        _ARGC[ord(_path_type.lower())] = _argc
+    del _path_type, _argc
+
+    def __init__(self, commands=None, values=None):
+        """Constructs a PathData object.
+
+        Arguments:
+            commands (str | bytes | numpy.ndarray, optional): The commands of
+                the path segments (e.g. 'MLLZ').
+            values (list[float] | numpy.ndarray, optional): The values of the
+                path segments in order.
+        """
+        if commands is None:
+            commands = np.empty(0, dtype=np.uint8)
+        elif isinstance(commands, str):
+            commands = np.frombuffer(commands.encode('ascii'), dtype=np.uint8)
+        elif isinstance(commands, (bytes, bytearray)):
+            commands = np.frombuffer(bytes(commands), dtype=np.uint8)
+        else:
+            commands = np.ascontiguousarray(commands, dtype=np.uint8)
+        if values is None:
+            values = np.empty(0, dtype=np.float64)
+        else:
+            values = np.ascontiguousarray(values, dtype=np.float64).ravel()
+        argc = PathData._ARGC[commands]
+        if len(argc) > 0 and argc.min() < 0:
+            code = commands[np.argmin(argc)]
+            raise ValueError('Unsupported path type: ' + repr(chr(code)))
+        offsets = np.zeros(len(commands) + 1, dtype=np.intp)
+        np.cumsum(argc, out=offsets[1:])
+        if offsets[-1] != len(values):
+            raise ValueError(
+                'Expected {} values, got {}'.format(offsets[-1], len(values)))
+        self._commands = commands
+        self._values = values
+        self._offsets = offsets
+
+    def __add__(self, other):
+        if not isinstance(other, PathData):
+            try:
+                other = PathData.from_segments(other)
+            except TypeError:
+                return NotImplemented
+        return PathData(np.concatenate((self._commands, other._commands)),
+                        np.concatenate((self._values, other._values)))
+
+    def __eq__(self, other):
+        if isinstance(other, PathData):
+            return (np.array_equal(self._commands, other._commands)
+                    and np.array_equal(self._values, other._values))
+        elif isinstance(other, (list, tuple)):
+            return (len(self) == len(other)
+                    and all(a == b for a, b in zip(self, other)))
+        return NotImplemented
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return PathData.from_segments(
+                    self._get_segment(i) for i in range(start, stop, step))
+            stop = max(start, stop)
+            return PathData(
+                self._commands[start:stop],
+                self._values[self._offsets[start]:self._offsets[stop]])
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError('PathData index out of range')
+        return self._get_segment(index)
+
+    def __iter__(self):
+        commands = self._commands.tobytes().decode('ascii')
+        values = self._values.tolist()
+        offsets = self._offsets.tolist()
+        for index, path_type in enumerate(commands):
+            yield PathData._new_segment(
+                path_type, values[offsets[index]:offsets[index + 1]])
+
+    def __len__(self):
+        return len(self._commands)
+
+    def __repr__(self):
+        return '<{} object at {} ({} segments)>'.format(
+            type(self).__name__, hex(id(self)), len(self))
+
+    def _get_segment(self, index):
+        start, end = self._offsets[index:index + 2]
+        return PathData._new_segment(chr(self._commands[index]),
+                                     self._values[start:end].tolist())
+
+    @staticmethod
+    def _new_segment(path_type, args):
+        if path_type in 'Aa':
+            # large-arc-flag and sweep-flag
+            args[3] = int(args[3])
+            args[4] = int(args[4])
+        return SVGPathSegment(path_type, *args)
+
+    @property
+    def commands(self):
+        """numpy.ndarray: The character codes of the commands of the path
+        segments.
+        """
+        return self._commands
+
+    @property
+    def nbytes(self):
+        """int: The number of bytes consumed by the arrays."""
+        return (self._commands.nbytes
+                + self._values.nbytes
+                + self._offsets.nbytes)
+
+    @property
+    def offsets(self):
+        """numpy.ndarray: The start index of the values of each path segment
+        in values. The last element is the total number of values.
+        """
+        return self._offsets
+
+    @property
+    def values(self):
+        """numpy.ndarray: The values of all path segments in order."""
+        return self._values
+
+    @staticmethod
+    def from_segments(path_data):
+        """Creates a PathData object from a list of path segments.
+
+        Arguments:
+            path_data (list[SVGPathSegment]): A list of path segments. Invalid
+                path segments are skipped.
+        Returns:
+            PathData: A new PathData object.
+        """
+        if isinstance(path_data, PathData):
+            return path_data
+        commands = list()
+        values = list()
+        for path_segment in iter(path_data):
+            if not isinstance(path_segment, SVGPathSegment):
+                raise TypeError('Expected SVGPathSegment, got {}'.format(
+                    type(path_segment)))
+            if not path_segment.isvalid():
+                continue
+            commands.append(path_segment.type)
+            values.extend(path_segment.values)
+        return PathData(''.join(commands), values)
+
+    def tolist(self):
+        """Returns a list of path segments.
+
+        Returns:
+            list[SVGPathSegment]: A list of path segments.
+        """
+        return list(self)
+
+    def tostring(self):
+        return PathParser.tostring(self)
+
+
+class PathLengthIndex(object):
+    """Represents a cumulative arc-length table of a path.
+
+    The drawn parts of the path are split into the subintervals of the
+    adaptive quadrature used to measure them, and the queries by distance
+    along the path are answered by a binary search over the cumulative
+    lengths of the subintervals followed by a few Newton iterations within
+    a subinterval. The elliptical arcs are measured exactly, without
+    converting them to bezier curves.
+    """
+
+    def __init__(self, path_data, tolerance=None):
+        """Constructs a PathLengthIndex object.
+
+        Arguments:
+            path_data (list[SVGPathSegment] | PathData): A list of path
+                segments.
+            tolerance (float, optional): The maximum absolute error of the
+                length of each part of the path. Defaults to
+                CubicBezierCurve.length_tol.
+        """
+        if tolerance is None:
+            tolerance = CubicBezierCurve.length_tol
+        self._tolerance = tolerance
+        start = None
+        parameters = list()
+        arcs = list()
+        segments = list()
+        for index, path_type, values in PathParser._iter_primitives(
+                path_data):
+            if path_type == 'M':
+                if start is None:
+                    start = tuple(values), index
+                continue
+            row, arc = _get_parameters(path_type, values)
+            parameters.append(row)
+            arcs.append(arc)
+            segments.append(index)
+
+        self._parameters = np.array(parameters, dtype=np.float64).reshape(
+            -1, 8)
+        self._arcs = np.array(arcs, dtype=bool)
+        self._segments = np.array(segments, dtype=np.intp)
+        count = len(segments)
+        if count == 0:
+            # the path has no drawn parts
+            self._start, self._start_segment = \
+                start if start is not None else ((0, 0), 0)
+            self._index = np.empty(0, dtype=np.intp)
+            self._t0 = np.empty(0)
+            self._t1 = np.empty(0)
+            self._lengths = np.empty(0)
+            self._cumulative = np.zeros(1)
+            return
+
+        index, t0, t1, lengths, _ = _integrate_adaptive(
+            self._speed, count, tolerance, CubicBezierCurve.max_depth)
+        order = np.lexsort((t0, index))
+        self._index = index[order]
+        self._t0 = t0[order]
+        self._t1 = t1[order]
+        self._lengths = lengths[order]
+        self._cumulative = np.concatenate(([0], np.cumsum(self._lengths)))
+
+    def _derivative(self, index, t):
+        p = self._parameters[index][:, :, np.newaxis]
+        # cubic bezier curves and straight lines
+        dx = (3 * p[:, 0] * t + 2 * p[:, 2]) * t + p[:, 4]
+        dy = (3 * p[:, 1] * t + 2 * p[:, 3]) * t + p[:, 5]
+        arcs = self._arcs[index]
+        if arcs.any():
+            # elliptical arcs
+            theta = p[:, 6] + p[:, 7] * t
+            ex = -p[:, 2] * np.sin(theta) * p[:, 7]
+            ey = p[:, 3] * np.cos(theta) * p[:, 7]
+            arcs = arcs[:, np.newaxis]
+            dx = np.where(arcs, p[:, 4] * ex - p[:, 5] * ey, dx)
+            dy = np.where(arcs, p[:, 5] * ex + p[:, 4] * ey, dy)
+        return dx, dy
+
+    def _locate(self, distances):
+        """Returns the indices of the parts of the path and their parameters
+        at the distances along the path.
+        """
+        distances = np.clip(np.asarray(distances, dtype=np.float64).ravel(),
+                            0, self.total_length)
+        j = np.searchsorted(self._cumulative, distances, side='right') - 1
+        j = np.clip(j, 0, len(self._lengths) - 1)
+        index = self._index[j]
+        start = self._t0[j]
+        lower = start.copy()
+        upper = self._t1[j].copy()
+        s = distances - self._cumulative[j]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = np.where(self._lengths[j] > 0,
+                         start + (upper - start) * s / self._lengths[j],
+                         start)
+            t = np.clip(t, lower, upper)
+            for _ in range(CubicBezierCurve.max_depth):
+                f = _integrate(self._speed, index, start, t) - s
+                active = np.abs(f) > self._tolerance
+                if not active.any():
+                    break
+                upper = np.where(f > 0, t, upper)
+                lower = np.where(f < 0, t, lower)
+                speed = self._speed(index, t[:, np.newaxis])[:, 0]
+                newton = t - f / speed
+                newton = np.where((speed > 0) & (newton > lower)
+                                  & (newton < upper),
+                                  newton, (lower + upper) / 2)
+                t = np.where(active, newton, t)
+        return index, t
+
+    def _speed(self, index, t):
+        dx, dy = self._derivative(index, t)
+        return np.hypot(dx, dy)
+
+    def get_point_at_length(self, distance):
+        """Returns the point at the distance along the path.
+
+        Arguments:
+            distance (float): The distance along the path.
+        Returns:
+            tuple[float, float]: The absolute coordinates of the point.
+        """
+        x, y = self.get_points_at_lengths([distance])[0].tolist()
+        return x, y
+
+    def get_points_at_lengths(self, distances):
+        """Returns the points at the distances along the path.
+
+        Arguments:
+            distances (list[float] | numpy.ndarray): The distances along the
+                path.
+        Returns:
+            numpy.ndarray: An array of shape (n, 2) of the absolute
+                coordinates of the points.
+        """
+        distances = np.asarray(distances, dtype=np.float64).ravel()
+        if len(self._lengths) == 0:
+            return np.tile(np.array(self._start, dtype=np.float64),
+                           (len(distances), 1))
+        index, t = self._locate(distances)
+        return _get_points(self._parameters[index], self._arcs[index], t)
+
+    def get_segment_at_length(self, distance):
+        """Returns the index of the path segment at the distance along the
+        path.
+
+        Arguments:
+            distance (float): The distance along the path.
+        Returns:
+            int: The index of the path segment in the path data.
+        """
+        return self.get_segments_at_lengths([distance]).item(0)
+
+    def get_segments_at_lengths(self, distances):
+        """Returns the indices of the path segments at the distances along the
+        path.
+
+        Arguments:
+            distances (list[float] | numpy.ndarray): The distances along the
+                path.
+        Returns:
+            numpy.ndarray: The indices of the path segments in the path data.
+        """
+        distances = np.asarray(distances, dtype=np.float64).ravel()
+        if len(self._lengths) == 0:
+            return np.full(len(distances), self._start_segment, dtype=np.intp)
+        distances = np.clip(distances, 0, self.total_length)
+        j = np.searchsorted(self._cumulative, distances, side='right') - 1
+        j = np.clip(j, 0, len(self._lengths) - 1)
+        return self._segments[self._index[j]]
+
+    def get_tangent_at_length(self, distance):
+        """Returns the direction of the path at the distance along the path.
+
+        Arguments:
+            distance (float): The distance along the path.
+        Returns:
+            float: The angle of the tangent from the x-axis in degrees.
+        """
+        return self.get_tangents_at_lengths([distance]).item(0)
+
+    def get_tangents_at_lengths(self, distances):
+        """Returns the directions of the path at the distances along the path.
+
+        Arguments:
+            distances (list[float] | numpy.ndarray): The distances along the
+                path.
+        Returns:
+            numpy.ndarray: The angles of the tangents from the x-axis in
+                degrees.
+        """
+        distances = np.asarray(distances, dtype=np.float64).ravel()
+        if len(self._lengths) == 0:
+            return np.zeros(len(distances))
+        index, t = self._locate(distances)
+        dx, dy = self._derivative(index, t[:, np.newaxis])
+        dx = dx[:, 0]
+        dy = dy[:, 0]
+        # the first derivative of a cubic bezier curve vanishes at a
+        # coincident control point: use the higher derivatives instead
+        p = self._parameters[index]
+        for ddx, ddy in ((6 * p[:, 0] * t + 2 * p[:, 2],
+                          6 * p[:, 1] * t + 2 * p[:, 3]),
+                         (p[:, 0], p[:, 1])):
+            vanished = (dx == 0) & (dy == 0) & ~self._arcs[index]
+            dx = np.where(vanished, ddx, dx)
+            dy = np.where(vanished, ddy, dy)
+        return np.degrees(np.arctan2(dy, dx))
+
+    @property
+    def total_length(self):
+        """float: The total length of the path."""
+        return self._cumulative[-1].item()
+
+
 class PathParser(object):
     """Utility class for SVG path data."""
 
@@ -1182,6 +1890,15 @@ class PathParser(object):
 
     PATH_SEGMENT_TYPES = 'AaBbCcHhLlMmQqSsTtVvZz'
 
+    _RE_PATH_COMMAND = re.compile(r"[AaBbCcHhLlMmQqSsTtVvZz]")
+
+    _RE_PATH_NUMBER = re.compile(
+        r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[Ee][+-]?\d+)?")
+
+    _RE_PATH_WSP = re.compile(r"[ \t\n\f\r]*")
+
+    _RE_PATH_COMMA_WSP = re.compile(r"[ \t\n\f\r]*,?[ \t\n\f\r]*")
+
     _PATH_SEGMENT_VALUES_LENGTH = {
         'A': 7,
         'B': 1,
@@ -1195,205 +1912,333 @@ class PathParser(object):
         'V': 1,
     }
 
+    # the values of a path segment, preceded by an optional comma-wsp
+    # (a number is matched in a lookahead and then consumed by a
+    # backreference, so that it is never split by backtracking)
+    _RE_PATH_VALUES = dict()
+    for _path_type, _argc in _PATH_SEGMENT_VALUES_LENGTH.items():
+        _patterns = list()
+        for _index in range(1, _argc + 1):
+            if _path_type == 'A' and _index in (4, 5):
+                # flag: "0" | "1"
+                _patterns.append('([01])')
+            else:
+                _patterns.append('(?=({}))\\{}'.format(
+                    _RE_PATH_NUMBER.pattern, _index))
+        _RE_PATH_VALUES[_path_type] = re.compile(
+            _RE_PATH_COMMA_WSP.pattern.join([''] + _patterns))
+    del _path_type, _argc, _patterns, _index
+
+    @staticmethod
+    def flatten(path_data, tolerance=0.1):
+        """Converts the path to polylines.
+        Each bezier curve and elliptical arc is divided into the number of
+        straight lines that keeps the distance between the curve and the
+        polyline within the tolerance, and all curves are evaluated at once.
+
+        Arguments:
+            path_data (list[SVGPathSegment] | PathData): A list of path
+                segments.
+            tolerance (float, optional): The maximum distance between the
+                path and the polylines.
+        Returns:
+            numpy.ndarray: An array of shape (n, 2) of the absolute
+                coordinates of the vertices of the polylines.
+            numpy.ndarray: The offsets of the subpaths in the vertices. The
+                vertices of the i-th subpath are
+                vertices[offsets[i]:offsets[i + 1]].
+        """
+        parameters = list()
+        arcs = list()
+        starts = list()
+        subpath = False
+        for _, path_type, values in PathParser._iter_primitives(path_data):
+            if path_type == 'M' or not subpath:
+                # start a new subpath
+                starts.append(len(parameters))
+                row, _ = _get_parameters('M', values[:2])
+                parameters.append(row)
+                arcs.append(False)
+                subpath = True
+                if path_type == 'M':
+                    continue
+            row, arc = _get_parameters(path_type, values)
+            parameters.append(row)
+            arcs.append(arc)
+            if path_type == 'Z':
+                subpath = False
+        parameters = np.array(parameters, dtype=np.float64).reshape(-1, 8)
+        arcs = np.array(arcs, dtype=bool)
+
+        # the number of straight lines for each part of the path
+        # See https://doi.org/10.1016/0167-8396(85)90004-3 (Wang's formula)
+        # and the chordal deviation of a curve |p''| * h^2 / 8
+        p = parameters
+        second_differences = np.maximum(
+            np.hypot(p[:, 2], p[:, 3]) / 3,
+            np.hypot(p[:, 0] + p[:, 2] / 3, p[:, 1] + p[:, 3] / 3))
+        counts = np.sqrt(0.75 * second_differences / tolerance)
+        if arcs.any():
+            radii = np.maximum(p[:, 2], p[:, 3])
+            counts = np.where(arcs,
+                              np.abs(p[:, 7]) * np.sqrt(radii
+                                                        / (8 * tolerance)),
+                              counts)
+        counts = np.maximum(np.ceil(counts), 1).astype(np.intp)
+
+        ends = np.cumsum(counts)
+        index = np.repeat(np.arange(len(counts)), counts)
+        t = (np.arange(len(index)) - np.repeat(ends - counts, counts) + 1) \
+            / counts[index]
+        vertices = _get_points(parameters[index], arcs[index], t)
+        offsets = np.append((ends - counts)[starts], len(index))
+        return vertices, offsets
+
     @staticmethod
-    def from_glyph(face, matrix=None):
+    def from_glyph(face, matrix=None, compact=False):
         """Creates a list of path segments from specified glyph outlines
         and returns it.
+        The points of the outline are read into arrays at once, and the
+        transformation matrix is applied to all of them in a single pass.
 
         Arguments:
             face (FTFace): The FTFace object.
             matrix (DOMMatrixReadOnly, optional): The transformation matrix.
+            compact (bool, optional): If True, returns a PathData object
+                instead of a list of path segments.
         Returns:
-            list[SVGPathSegment]: A list of path segments.
+            list[SVGPathSegment] | PathData: A list of path segments.
         """
-
-        def _move_to(x, y, user):
-            x /= 64
-            y /= 64
-            user.append(SVGPathSegment('M', x, y))
-
-        def _line_to(x, y, user):
-            x /= 64
-            y /= 64
-            user.append(SVGPathSegment('L', x, y))
-
-        def _conic_to(x1, y1, x, y, user):
-            x1 /= 64
-            y1 /= 64
-            x /= 64
-            y /= 64
-            user.append(SVGPathSegment('Q', x1, y1, x, y))
-
-        def _cubic_to(x1, y1, x2, y2, x, y, user):
-            x1 /= 64
-            y1 /= 64
-            x2 /= 64
-            y2 /= 64
-            x /= 64
-            y /= 64
-            user.append(SVGPathSegment('C', x1, y1, x2, y2, x, y))
-
-        path_data = list()
         outline = face.glyph.outline
-        transform = FTMatrix()
-        transform = transform.flip_y()
+        points, tags, contours = outline.get_arrays()
+
+        # y-axis points up in the glyph outlines
+        transform = np.array([[1.0, 0], [0, -1.0]])
         if matrix is not None:
-            # convert from DOMMatrixReadOnly to FTMatrix
-            other = FTMatrix()
-            other.a = matrix.a
-            other.b = matrix.b
-            other.c = matrix.c
-            other.d = matrix.d
-            transform *= other
-            tx, ty = matrix.get_translate()
-            outline.translate(int(tx * 64), int(ty * 64))
-        outline.transform(transform)
-        outline.decompose(_move_to,
-                          _line_to,
-                          _conic_to,
-                          _cubic_to,
-                          user=path_data)
-        return path_data
+            transform = transform.dot([[matrix.a, matrix.b],
+                                       [matrix.c, matrix.d]])
+            tx, ty = matrix.get_translate()[:2]
+            points += (int(tx * 64), int(ty * 64))
+        # the same 16.16 fixed-point arithmetic as FT_Outline_Transform()
+        transform = (transform * 0x10000).astype(np.int64)
+        products = points[:, np.newaxis, :] * transform
+        products += 0x8000 - (products < 0)
+        points = (products >> 16).sum(axis=2)
+
+        commands, values = PathParser._decompose_outline(points, tags,
+                                                         contours)
+        values = np.array(values, dtype=np.float64) / 64
+        path_data = PathData(commands, values.ravel())
+        if compact:
+            return path_data
+        return path_data.tolist()
+
+    @staticmethod
+    def _decompose_outline(points, tags, contours):
+        """Decomposes the glyph outline in the same way as
+        FT_Outline_Decompose(), and returns the commands of the path segments
+        and the values of them.
+        As with FT_Outline_Decompose(), the middle points are truncated to
+        integers.
+
+        Arguments:
+            points (numpy.ndarray): An array of shape (n, 2) of the points of
+                the outline in 26.6 fixed-point format.
+            tags (numpy.ndarray): An array of shape (n,) of the tags of the
+                points.
+            contours (numpy.ndarray): An array of shape (k,) of the indices of
+                the end points of the contours.
+        Returns:
+            str: The commands of the path segments ('M', 'L', 'Q' and 'C').
+            list[int]: The absolute coordinates of the points of the path
+                segments in order, in 26.6 fixed-point format.
+        """
+        on = FreeType.FT_CURVE_TAG_ON
+        conic = FreeType.FT_CURVE_TAG_CONIC
+        cubic = FreeType.FT_CURVE_TAG_CUBIC
+        points = points.tolist()
+        tags = (tags & 3).tolist()  # FT_CURVE_TAG()
+        commands = list()
+        values = list()
+        first = 0
+        for contour in contours.tolist():
+            last = contour
+            start = points[first]
+            tag = tags[first]
+            if tag == cubic:
+                raise ValueError('Invalid glyph outline')
+            index = first + 1
+            if tag == conic:
+                # start at the last point if it is on the curve,
+                # otherwise start at the middle of the first and the last
+                # points
+                if tags[last] == on:
+                    start = points[last]
+                    last -= 1
+                else:
+                    end = points[last]
+                    start = [int((start[0] + end[0]) / 2),
+                             int((start[1] + end[1]) / 2)]
+                index = first
+            commands.append('M')
+            values.extend(start)
+            closed = False
+            while index <= last:
+                tag = tags[index]
+                if tag == on:
+                    commands.append('L')
+                    values.extend(points[index])
+                    index += 1
+                elif tag == conic:
+                    control = points[index]
+                    while True:
+                        if index >= last:
+                            commands.append('Q')
+                            values.extend(control)
+                            values.extend(start)
+                            closed = True
+                            break
+                        index += 1
+                        point = points[index]
+                        tag = tags[index]
+                        if tag == on:
+                            commands.append('Q')
+                            values.extend(control)
+                            values.extend(point)
+                            index += 1
+                            break
+                        elif tag != conic:
+                            raise ValueError('Invalid glyph outline')
+                        commands.append('Q')
+                        values.extend(control)
+                        values.append(int((control[0] + point[0]) / 2))
+                        values.append(int((control[1] + point[1]) / 2))
+                        control = point
+                    if closed:
+                        break
+                else:
+                    if index + 1 > last or tags[index + 1] != cubic:
+                        raise ValueError('Invalid glyph outline')
+                    commands.append('C')
+                    values.extend(points[index])
+                    values.extend(points[index + 1])
+                    index += 2
+                    if index > last:
+                        values.extend(start)
+                        closed = True
+                        break
+                    values.extend(points[index])
+                    index += 1
+            if not closed:
+                commands.append('L')
+                values.extend(start)
+            first = contour + 1
+        return ''.join(commands), values
 
     @staticmethod
     def get_bbox(path_data, options=None, **extra):
         """Returns the bounding box of the path.
+        The extrema of all cubic bezier curves are computed at once.
 
         Arguments:
-            path_data (list[SVGPathSegment]): A list of path segments. The path
-                segments must be normalized.
+            path_data (list[SVGPathSegment] | PathData): A list of path
+                segments. The path segments must be normalized.
             options (SVGBoundingBoxOptions, optional): Reserved.
             **extra: Reserved.
         Returns:
             DOMRect: The bounding box of the path.
         """
-        bbox = DOMRect()
+        # TODO: implement the SVGBoundingBoxOptions option.
+        points = list()  # [x0, y0, x1, y1, ...]
+        curves = list()  # [p0x, p0y, p1x, p1y, p2x, p2y, p3x, p3y, ...]
         start_x = None
         start_y = None
         cpx = None
         cpy = None
-        bearing = 0  # current bearing
         last_command = None
-        for path_segment in iter(path_data):
-            if not isinstance(path_segment, SVGPathSegment):
-                raise TypeError('Expected SVGPathSegment, got {}'.format(
-                    type(path_segment)))
-            if not path_segment.isvalid():
-                continue
-            command = path_segment.type
-            if command in 'CLM':
+        for _, command, args in PathParser._iter_values(path_data):
+            if command in 'CL':
                 # cubic bezier curveto: 'C'|'c' (x1,y1 x2,y2 x,y)+
                 # lineto: 'L'|'l' (x,y)+
-                # moveto: 'M'|'m' (x,y)+
-                rect = PathSegment.get_bbox(path_segment,
-                                            cpx, cpy, bearing,
-                                            options=options, **extra)
-                cpx, cpy = path_segment.end
-                if command == 'M':
-                    if last_command is None:
-                        bbox = rect
-                    if last_command is not None and last_command == 'M':
-                        # implicit "lineto" command
-                        bbox |= rect
-                    else:
-                        start_x = cpx
-                        start_y = cpy
+                if cpx is None or cpy is None:
+                    cpx, cpy = 0, 0
+                if command == 'C':
+                    curves.extend([cpx, cpy])
+                    curves.extend(args)
                 else:
-                    bbox |= rect
-                    if start_x is None or start_y is None:
-                        start_x = cpx
-                        start_y = cpy
+                    points.extend([cpx, cpy])
+                    points.extend(args)
+                cpx, cpy = args[-2:]
+                if start_x is None or start_y is None:
+                    start_x = cpx
+                    start_y = cpy
+            elif command == 'M':
+                # moveto: 'M'|'m' (x,y)+
+                if last_command is None:
+                    points.extend(args)
+                elif last_command == 'M':
+                    # implicit "lineto" command
+                    points.extend([cpx, cpy])
+                    points.extend(args)
+                cpx, cpy = args
+                if last_command is None or last_command != 'M':
+                    start_x = cpx
+                    start_y = cpy
             elif command == 'Z':
                 # pathclose: 'Z'|'z'
                 if (start_x is not None and start_y is not None
                         and cpx is not None and cpy is not None):
                     # line to the start point
-                    line = SVGPathSegment('L', start_x, start_y)
-                    rect = PathSegment.get_bbox(line,
-                                                cpx, cpy, bearing,
-                                                options=options, **extra)
-                    bbox |= rect
+                    points.extend([cpx, cpy, start_x, start_y])
                     cpx = start_x
                     cpy = start_y
             else:
                 raise ValueError('Unexpected path type: ' + repr(command))
             last_command = command
-        return bbox
+        if len(curves) > 0:
+            curves = np.array(curves, dtype=np.float64).reshape(-1, 4, 2)
+            points = np.concatenate(
+                (np.array(points, dtype=np.float64).reshape(-1, 2),
+                 curves[:, 0], curves[:, 3],
+                 CubicBezierCurve.get_extrema(curves)))
+        elif len(points) > 0:
+            points = np.array(points, dtype=np.float64).reshape(-1, 2)
+        else:
+            return DOMRect()
+        x, y = points.min(axis=0).tolist()
+        right, bottom = points.max(axis=0).tolist()
+        return DOMRect(x, y, right - x, bottom - y)
 
     @staticmethod
-    def get_total_length(path_data):
+    def get_total_length(path_data, tolerance=None):
         """Returns the total length of the path.
+        The lengths of all bezier curves are computed at once.
 
         Arguments:
-            path_data (list[SVGPathSegment]): A list of path segments.
+            path_data (list[SVGPathSegment] | PathData): A list of path
+                segments.
+            tolerance (float, optional): The maximum absolute error of the
+                length of each bezier curve. Defaults to
+                CubicBezierCurve.length_tol.
         Returns:
             float: The total length of the path.
         """
         total_length = 0
-        start_x = None
-        start_y = None
-        cpx = None
-        cpy = None
-        x1 = None
-        y1 = None
-        bearing = 0  # current bearing
-        last_command = None
-        for path_segment in iter(path_data):
-            if not isinstance(path_segment, SVGPathSegment):
-                raise TypeError('Expected SVGPathSegment, got {}'.format(
-                    type(path_segment)))
-            if not path_segment.isvalid():
-                continue
-            command = path_segment.type
-            if command in 'AaCcHhLlMmQqSsTtVv':
-                # elliptical arc: 'A'|'a' (rx ry r fa fs x,y)+
-                # cubic bezier curveto: 'C'|'c' (x1,y1 x2,y2 x,y)+
-                # horizontal lineto: 'H'|'h' x+
-                # lineto: 'L'|'l' (x,y)+
-                # moveto: 'M'|'m' (x,y)+
-                # quadratic bezier curveto: 'Q'|'q' (x1,y1 x,y)+
-                # vertical lineto: 'V'|'v' y+
-                old_cpx, old_cpy = cpx, cpy
-                length, (cpx, cpy) = PathSegment.get_length(path_segment,
-                                                            cpx, cpy, bearing,
-                                                            x1=x1, y1=y1)
-
-                # control point for next shorthand/smooth curve
-                if command in 'CcQqSsTt':
-                    x1, y1 = PathSegment.get_next_control_point(
-                        path_segment, old_cpx, old_cpy, bearing, last_command,
-                        x1=x1, y1=y1)
-                else:
-                    x1, y1 = cpx, cpy
-
-                if command in 'Mm':
-                    if last_command is not None and last_command in 'Mm':
-                        # implicit "lineto" command
-                        total_length += length
-                    else:
-                        start_x = cpx
-                        start_y = cpy
-                else:
-                    total_length += length
-                    if start_x is None or start_y is None:
-                        start_x = cpx
-                        start_y = cpy
-            elif command in 'Bb':
-                # bearing: 'B'|'b' angle+
-                bearing = path_segment.get_bearing(bearing)
-            elif command in 'Zz':
-                # pathclose: 'Z'|'z'
-                if (start_x is not None and start_y is not None
-                        and cpx is not None and cpy is not None):
-                    # line to the start point
-                    line = SVGPathSegment('L', start_x, start_y)
-                    length, (cpx, cpy) = PathSegment.get_length(line,
-                                                                cpx, cpy,
-                                                                bearing)
-                    total_length += length
-                    cpx = start_x
-                    cpy = start_y
-            last_command = command
+        curves = list()  # [p0x, p0y, p1x, p1y, p2x, p2y, p3x, p3y, ...]
+        for _, path_type, values in PathParser._iter_primitives(path_data):
+            if path_type == 'A':
+                length, _ = PathSegment.get_length(
+                    SVGPathSegment('A', *values[2:]), values[0], values[1], 0)
+                total_length += length
+            elif path_type == 'C':
+                curves.extend(values)
+            elif path_type in 'LZ':
+                x0, y0, x, y = values
+                total_length += math.hypot(x - x0, y - y0)
+        if len(curves) > 0:
+            lengths, _ = CubicBezierCurve.get_lengths(np.array(curves),
+                                                      tolerance)
+            total_length += lengths.sum().item()
         return total_length
 
     @staticmethod
@@ -1402,9 +2247,11 @@ class PathParser(object):
         and 'Z') and returns it.
 
         Arguments:
-            path_data (list[SVGPathSegment]): A list of path segments.
+            path_data (list[SVGPathSegment] | PathData): A list of path
+                segments.
         Returns:
-            list[SVGPathSegment]: A new list of path segments.
+            list[SVGPathSegment] | PathData: A new list of path segments. If
+                path_data is a PathData object, returns a new PathData object.
         """
         normalized_path_data = list()
         start_x = None
@@ -1462,41 +2309,308 @@ class PathParser(object):
                 # bearing: 'B'|'b' angle+
                 bearing = path_segment.get_bearing(bearing)
             last_command = command
+        if isinstance(path_data, PathData):
+            return PathData.from_segments(normalized_path_data)
         return normalized_path_data
 
     @staticmethod
-    def parse(text):
+    def _scan(text, strict=False):
+        """Scans text in a single pass and yields the commands and the values
+        of the path segments.
+
+        Arguments:
+            text (str): A text to scan.
+            strict (bool, optional): If True, stops scanning at the first
+                error. Otherwise, skips the path segment containing the error
+                and resumes at the next command.
+        Yields:
+            tuple[str, list[float]]: The command and the values of the path
+                segment.
+        """
+        # See https://svgwg.org/specs/paths/#PathDataBNF
+        # See https://svgwg.org/specs/paths/#PathDataErrorHandling
+        if text is None:
+            return
+        path_segment_types = PathParser.PATH_SEGMENT_TYPES
+        re_path_values = PathParser._RE_PATH_VALUES
+        match_number = PathParser._RE_PATH_NUMBER.match
+        match_wsp = PathParser._RE_PATH_WSP.match
+        match_comma_wsp = PathParser._RE_PATH_COMMA_WSP.match
+        search_command = PathParser._RE_PATH_COMMAND.search
+        length = len(text)
+        pos = match_wsp(text).end()
+        first = True
+        while pos < length:
+            path_type = text[pos]
+            if path_type not in path_segment_types:
+                # unexpected character
+                if strict:
+                    return
+                it = search_command(text, pos)
+                if it is None:
+                    return
+                pos = it.start()
+                continue
+            if first and strict and path_type not in 'Mm':
+                # path data must begin with a "moveto" command
+                return
+            first = False
+            pos = match_wsp(text, pos + 1).end()
+            if path_type in 'Zz':
+                yield path_type, []
+                continue
+            match_values = re_path_values[path_type.upper()].match
+            isarc = path_type in 'Aa'
+            error = strict and text.startswith(',', pos)
+            count = 0
+            while not error:
+                it = match_values(text, pos)
+                if it is None:
+                    # end of the path segments, or an incomplete one
+                    pos = match_comma_wsp(text, pos).end()
+                    error = count == 0 or match_number(text, pos) is not None
+                    break
+                args = [float(x) for x in it.groups()]
+                if isarc:
+                    # large-arc-flag and sweep-flag
+                    args[3] = int(args[3])
+                    args[4] = int(args[4])
+                yield path_type, args
+                count += 1
+                pos = it.end()
+            if error:
+                if strict:
+                    return
+                it = search_command(text, pos)
+                if it is None:
+                    return
+                pos = it.start()
+
+    @staticmethod
+    def iterparse(text, strict=False):
+        """Parses text into path segments and yields them one at a time.
+
+        Arguments:
+            text (str): A text to parse.
+            strict (bool, optional): If True, stops parsing at the first error
+                as the SVG specification requires. Otherwise, skips the path
+                segment containing the error and resumes at the next command.
+        Yields:
+            SVGPathSegment: A path segment.
+        """
+        for path_type, args in PathParser._scan(text, strict):
+            yield SVGPathSegment(path_type, *args)
+
+    @staticmethod
+    def parse(text, compact=False, strict=False):
         """Parses text into a list of path segments and returns it.
 
         Arguments:
             text (str): A text to parse.
+            compact (bool, optional): If True, returns a PathData object
+                instead of a list.
+            strict (bool, optional): If True, stops parsing at the first error
+                as the SVG specification requires. Otherwise, skips the path
+                segment containing the error and resumes at the next command.
         Returns:
-            list[SVGPathSegment]: A list of path segments.
+            list[SVGPathSegment] | PathData: A list of path segments.
         """
-        path_data = list()
-        if text is None:
-            return path_data
-        for it in PathParser.RE_PATH_SEGMENT_LIST.finditer(text.strip()):
-            path_type = it.group('type').strip()
-            if path_type in 'Zz':
-                path_data.append(SVGPathSegment(path_type))
-            elif path_type in PathParser.PATH_SEGMENT_TYPES:
-                values = it.group('values').strip()
-                args_sequence = list()
-                if len(values) > 0:
-                    number_sequence = list()
-                    for it2 in PathParser.RE_NUMBER_SEQUENCE.finditer(values):
-                        number = it2.group('number')
-                        number_sequence.append(float(number))
-                    argc = PathParser._PATH_SEGMENT_VALUES_LENGTH.get(
-                        path_type.upper())
-                    args_sequence = zip(*[iter(number_sequence)] * argc)
-                for args in iter(args_sequence):
-                    path_data.append(SVGPathSegment(path_type, *args))
-        return path_data
+        if not compact:
+            return list(PathParser.iterparse(text, strict))
+        commands = list()
+        values = list()
+        for path_type, args in PathParser._scan(text, strict):
+            commands.append(path_type)
+            values.extend(args)
+        return PathData(''.join(commands), values)
+
+    @staticmethod
+    def _iter_primitives(path_data):
+        """Yields the starting points of the subpaths ('M') and the drawn
+        parts of the path as straight lines ('L'), closing lines ('Z'), cubic
+        bezier curves ('C') and elliptical arcs ('A'), together with the
+        indices of their source path segments in path_data.
+        The values of each drawn part start with the absolute coordinates of
+        its starting point: 'L' and 'Z' (x0,y0 x,y), 'C' (x0,y0 x1,y1 x2,y2
+        x,y) and 'A' (x0,y0 rx ry x-axis-rotation large-arc-flag sweep-flag
+        x,y).
+        The quadratic and smooth curves are converted to cubic bezier curves,
+        and the implicit lineto commands of 'M' are converted to straight
+        lines.
+        """
+        commands, values, indices = PathParser._toabsolute(path_data)
+        offsets = PathData(''.join(commands), values).offsets.tolist()
+        start_x = None
+        start_y = None
+        cpx = 0
+        cpy = 0
+        x1 = None  # control point for next shorthand/smooth curve
+        y1 = None
+        last_command = None
+        for n, command in enumerate(commands):
+            index = indices[n]
+            args = values[offsets[n]:offsets[n + 1]]
+            if command == 'A':
+                # elliptical arc: 'A' (rx ry r fa fs x,y)+
+                yield index, 'A', [cpx, cpy] + args
+            elif command in 'CS':
+                # cubic bezier curveto: 'C' (x1,y1 x2,y2 x,y)+
+                # smooth cubic bezier curveto: 'S' (x2,y2 x,y)+
+                if command == 'S':
+                    if last_command is None or last_command not in 'CS':
+                        x1, y1 = cpx, cpy
+                    args = [x1, y1] + args
+                yield index, 'C', [cpx, cpy] + args
+                x1 = 2 * args[4] - args[2]
+                y1 = 2 * args[5] - args[3]
+            elif command in 'QT':
+                # quadratic bezier curveto: 'Q' (x1,y1 x,y)+
+                # smooth quadratic bezier curveto: 'T' (x,y)+
+                if command == 'T':
+                    if last_command is None or last_command not in 'QT':
+                        x1, y1 = cpx, cpy
+                    args = [x1, y1] + args
+                qx, qy, x, y = args
+                yield index, 'C', [cpx, cpy,
+                                   cpx + 2 / 3 * (qx - cpx),
+                                   cpy + 2 / 3 * (qy - cpy),
+                                   x + 2 / 3 * (qx - x),
+                                   y + 2 / 3 * (qy - y),
+                                   x, y]
+                x1 = 2 * x - qx
+                y1 = 2 * y - qy
+            elif command == 'L' or (command == 'M' and last_command == 'M'):
+                # lineto: 'L' (x,y)+
+                # moveto: 'M' (x,y)+ (implicit "lineto" command)
+                yield index, 'L', [cpx, cpy] + args
+            elif command == 'M':
+                # moveto: 'M' (x,y)+
+                yield index, 'M', args
+            elif command == 'Z':
+                # pathclose: 'Z'|'z'
+                if start_x is not None and start_y is not None:
+                    # line to the start point
+                    yield index, 'Z', [cpx, cpy, start_x, start_y]
+                    cpx = start_x
+                    cpy = start_y
+                last_command = command
+                continue
+            cpx, cpy = args[-2:]
+            if ((command == 'M'
+                 and (last_command is None or last_command != 'M'))
+                    or (start_x is None or start_y is None)):
+                start_x = cpx
+                start_y = cpy
+            last_command = command
+
+    @staticmethod
+    def _iter_values(path_data):
+        """Yields the indices, the commands and the values of the valid path
+        segments.
+        """
+        if isinstance(path_data, PathData):
+            commands = path_data.commands.tobytes().decode('ascii')
+            values = path_data.values.tolist()
+            offsets = path_data.offsets.tolist()
+            for index, path_type in enumerate(commands):
+                yield (index, path_type,
+                       values[offsets[index]:offsets[index + 1]])
+            return
+        for index, path_segment in enumerate(path_data):
+            if not isinstance(path_segment, SVGPathSegment):
+                raise TypeError('Expected SVGPathSegment, got {}'.format(
+                    type(path_segment)))
+            if not path_segment.isvalid():
+                continue
+            yield index, path_segment.type, list(path_segment.values)
+
+    @staticmethod
+    def _toabsolute(path_data):
+        """Converts to absolute path segments ('A', 'C', 'L', 'M', 'Q', 'S',
+        'T' and 'Z'), and returns their commands and values.
+        The horizontal and vertical lineto commands are converted to 'L', and
+        the bearing commands are applied and removed.
+
+        Arguments:
+            path_data (list[SVGPathSegment] | PathData): A list of path
+                segments.
+        Returns:
+            list[str]: The commands of the path segments.
+            list[float]: The values of the path segments in order.
+            list[int]: The indices of the source path segments in path_data.
+        """
+        commands = list()
+        values = list()
+        indices = list()
+        start_x = None
+        start_y = None
+        cpx = 0
+        cpy = 0
+        bearing = 0  # current bearing
+        last_command = None
+        for index, command, args in PathParser._iter_values(path_data):
+            path_type = command
+            if command in 'Bb':
+                # bearing: 'B'|'b' angle+
+                bearing = args[0] if command == 'B' else bearing + args[0]
+                last_command = command
+                continue
+            elif command in 'Zz':
+                # pathclose: 'Z'|'z'
+                commands.append('Z')
+                indices.append(index)
+                if start_x is not None and start_y is not None:
+                    cpx = start_x
+                    cpy = start_y
+                last_command = command
+                continue
+            elif command == 'H':
+                path_type = 'L'
+                args = [args[0], cpy]
+            elif command == 'V':
+                path_type = 'L'
+                args = [cpx, args[0]]
+            elif command.islower() and bearing != 0:
+                abs_path_segment = PathSegment.toabsolute(
+                    SVGPathSegment(command, *args), cpx, cpy, bearing)
+                path_type = abs_path_segment.type
+                args = list(abs_path_segment.values)
+            elif command == 'h':
+                path_type = 'L'
+                args = [cpx + args[0], cpy]
+            elif command == 'v':
+                path_type = 'L'
+                args = [cpx, cpy + args[0]]
+            elif command == 'a':
+                path_type = 'A'
+                args[5] += cpx
+                args[6] += cpy
+            elif command.islower():
+                path_type = command.upper()
+                args[0::2] = [x + cpx for x in args[0::2]]
+                args[1::2] = [y + cpy for y in args[1::2]]
+            commands.append(path_type)
+            values.extend(args)
+            indices.append(index)
+            cpx, cpy = args[-2:]
+            if ((command in 'Mm'
+                 and (last_command is None or last_command not in 'Mm'))
+                    or (start_x is None or start_y is None)):
+                start_x = cpx
+                start_y = cpy
+            last_command = command
+        return commands, values, indices
 
     @staticmethod
     def tostring(path_data):
+        """Returns the path data as a string.
+
+        Arguments:
+            path_data (list[SVGPathSegment] | PathData): A list of path
+                segments.
+        Returns:
+            str: The path data string.
+        """
         # See https://svgwg.org/specs/paths/#PathDataBNF
         svg_path = list()
         last_path_type = None
@@ -1515,53 +2629,49 @@ class PathParser(object):
 
     @staticmethod
     def transform(path_data, matrix):
-        transformed_path_data = list()
-        start_x = None
-        start_y = None
-        cpx = None
-        cpy = None
-        bearing = 0  # current bearing
-        last_command = None
-        for path_segment in iter(path_data):
-            if not isinstance(path_segment, SVGPathSegment):
-                raise TypeError('Expected SVGPathSegment, got {}'.format(
-                    type(path_segment)))
-            if not path_segment.isvalid():
-                continue
-            command = path_segment.type
-            if command in 'AaCcHhLlMmQqSsTtVv':
-                # elliptical arc: 'A'|'a' (rx ry r fa fs x,y)+
-                # cubic bezier curveto: 'C'|'c' (x1,y1 x2,y2 x,y)+
-                # horizontal lineto: 'H'|'h' x+
-                # lineto: 'L'|'l' (x,y)+
-                # moveto: 'M'|'m' (x,y)+
-                # quadratic bezier curveto: 'Q'|'q' (x1,y1 x,y)+
-                # smooth cubic bezier curveto: 'S'|'s' (x2,y2 x,y)+
-                # smooth quadratic bezier curveto: 'T'|'t' (x,y)+
-                # vertical lineto: 'V'|'v' y+
-                transformed = PathSegment.transform(path_segment,
-                                                    cpx, cpy, bearing, matrix)
-                transformed_path_data.append(transformed)
-                if command.islower():
-                    abs_path_segment = PathSegment.toabsolute(path_segment,
-                                                              cpx, cpy,
-                                                              bearing)
-                else:
-                    abs_path_segment = path_segment
-                cpx, cpy = abs_path_segment.end
-                if ((command in 'Mm'
-                     and (last_command is None or last_command not in 'Mm'))
-                        or (start_x is None or start_y is None)):
-                    start_x = cpx
-                    start_y = cpy
-            elif command in 'Bb':
-                # bearing: 'B'|'b' angle+
-                bearing = path_segment.get_bearing(bearing)
-            elif command in 'Zz':
-                # pathclose: 'Z'|'z'
-                transformed_path_data.append(SVGPathSegment('Z'))
-                if start_x is not None and start_y is not None:
-                    cpx = start_x
-                    cpy = start_y
-            last_command = command
-        return transformed_path_data
+        """Transforms the path segments by the transformation matrix and
+        returns them.
+        The path segments are converted to absolute ones, and all of their
+        coordinates are transformed at once.
+
+        Arguments:
+            path_data (list[SVGPathSegment] | PathData): A list of path
+                segments.
+            matrix (DOMMatrixReadOnly): The transformation matrix.
+        Returns:
+            list[SVGPathSegment] | PathData: A new list of path segments. If
+                path_data is a PathData object, returns a new PathData object.
+        """
+        commands, values, _ = PathParser._toabsolute(path_data)
+        transformed = PathData(''.join(commands), values)
+        values = transformed.values
+        if len(values) > 0:
+            argc = np.diff(transformed.offsets)
+            starts = transformed.offsets[:-1]
+            isarc = transformed.commands == ord('A')
+
+            # all coordinate pairs except the first five values of 'A'
+            index = np.arange(len(values)) - np.repeat(starts, argc)
+            mask = ~(np.repeat(isarc, argc) & (index < 5))
+            points = values[mask].reshape(-1, 2)
+            a, b, c, d, e, f = (matrix.a, matrix.b, matrix.c, matrix.d,
+                                matrix.e, matrix.f)
+            values[mask] = (points.dot(np.array([[a, b], [c, d]]))
+                            + np.array([e, f])).ravel()
+
+            if isarc.any():
+                # 'A' (rx ry x-axis-rotation large-arc-flag sweep-flag x y)
+                arcs = starts[isarc]
+                rx, ry, x_axis_rotation, sweep_flag = \
+                    _transform_elliptical_arcs(matrix,
+                                               values[arcs],
+                                               values[arcs + 1],
+                                               values[arcs + 2],
+                                               values[arcs + 4])
+                values[arcs] = rx
+                values[arcs + 1] = ry
+                values[arcs + 2] = x_axis_rotation
+                values[arcs + 4] = sweep_flag
+        if isinstance(path_data, PathData):
+            return transformed
+        return transformed.tolist()
@@ -13,12 +13,17 @@
 # limitations under the License.
 
 
+import weakref
+from collections.abc import Mapping
 from logging import getLogger
 
-from lxml import cssselect, etree
+import cssselect
+import tinycss2
+from lxml import etree
 
 from .css import CSSParser, CSSRule, CSSStyleSheet
-from .utils import normalize_url
+from .utils import CaseInsensitiveMapping, get_content_type, \
+    get_resource_loader, normalize_url
 
 
 _SVG_UA_CSS_STYLESHEET = '''
@@ -82,8 +87,600 @@ svg|svg, svg {
 
 logger = getLogger(__name__)
 
+_ua_css_style_sheet = None
 
-def flatten_css_rules(element, css_rules):
+_STRUCTURAL_PSEUDO_CLASSES = frozenset([
+    'first-child', 'last-child', 'only-child', 'first-of-type',
+    'last-of-type', 'only-of-type', 'nth-child', 'nth-last-child',
+    'nth-of-type', 'nth-last-of-type',
+])
+
+# owner (Document or root element) -> _CSSCacheEntry
+_css_cache = weakref.WeakKeyDictionary()
+
+
+class _CSSCacheEntry(object):
+    """The parsed and flattened style sheets of a document."""
+
+    __slots__ = ('source_key', 'matched_media', 'style_sheets', 'css_rules',
+                 '_rule_index')
+
+    def __init__(self, source_key, matched_media, style_sheets, css_rules):
+        self.source_key = source_key
+        self.matched_media = matched_media
+        self.style_sheets = style_sheets
+        self.css_rules = css_rules
+        self._rule_index = None
+
+    @property
+    def rule_index(self):
+        if self._rule_index is None:
+            self._rule_index = RuleIndex(self.css_rules)
+        return self._rule_index
+
+    def is_valid(self, source_key, win):
+        if source_key != self.source_key:
+            return False
+        for media, matches in self.matched_media:
+            if _match_media(win, media) != matches:
+                return False
+        return True
+
+
+def _get_css_cache_entry(element):
+    root = element.getroottree().getroot()
+    doc = root.owner_document
+    win = doc.default_view if doc is not None else None
+    owner = doc if doc is not None else root
+    source_key = _get_css_source_key(root, doc)
+    entry = _css_cache.get(owner)
+    if entry is not None and entry.is_valid(source_key, win):
+        return entry
+
+    matched_media = list()
+    loader = _prefetch_css_style_sheets(root, doc)
+    style_sheets = [_get_ua_css_style_sheet()]
+    style_sheets.extend(
+        get_css_style_sheets_from_xml_stylesheet(
+            root, matched_media=matched_media, loader=loader))
+    style_sheets.extend(
+        get_css_style_sheets_from_svg_document(
+            root, matched_media=matched_media, loader=loader))
+    css_rules = list()
+    for css_style_sheet in style_sheets:
+        css_rules.extend(css_style_sheet.css_rules)
+    css_rules = flatten_css_rules(root, css_rules,
+                                  matched_media=matched_media)
+    entry = _CSSCacheEntry(source_key, matched_media, style_sheets,
+                           css_rules)
+    _css_cache[owner] = entry
+    return entry
+
+
+def _get_css_source_key(root, doc):
+    """Returns a snapshot of everything the style sheets of a document are
+    built from: the document URL, the 'xml-stylesheet' processing
+    instructions and the <link> and <style> elements.
+    """
+    key = [doc.document_uri if doc is not None else None]
+    for node in root.itersiblings(preceding=True):
+        if (isinstance(node, etree.PIBase)
+                and node.target == 'xml-stylesheet'):
+            key.append((node.target, node.text))
+    for element in root.iter(tag=('{*}link', '{*}style')):
+        key.append((element.tag, tuple(element.items()), element.text))
+    return tuple(key)
+
+
+class _PrefetchedResourceLoader(object):
+    """A resource loader that returns the prefetched responses first."""
+
+    def __init__(self, loader, responses):
+        self._loader = loader
+        self._responses = responses
+
+    def load(self, src, encoding=None):
+        response = self._responses.get(src)
+        if response is None:
+            return self._loader.load(src, encoding=encoding)
+        elif isinstance(response, Exception):
+            raise response
+        data, headers = response
+        if encoding is not None:
+            data = data.decode(encoding)
+        return data, CaseInsensitiveMapping(headers)
+
+
+def _get_import_urls(rules, base_url, win):
+    urls = list()
+    for rule in rules:
+        if rule.type != 'at-rule' or rule.lower_at_keyword != 'import':
+            continue
+        href = None
+        mediums = list()
+        for token in rule.prelude:
+            if href is None:
+                if token.type in ('string', 'url'):
+                    href = token.value
+            else:
+                mediums.append(token)
+        if href is None:
+            continue
+        media = tinycss2.serialize(mediums).strip()
+        if not _match_media_text(win, media):
+            continue
+        try:
+            urls.append(normalize_url(href, base_url).href)
+        except ValueError:
+            pass
+    return urls
+
+
+def _is_link_style_sheet(element):
+    """Returns True if the <link> element is a link to a (non-alternate)
+    style sheet.
+    """
+    rel_list = element.rel_list
+    as_ = element.as_
+    return not ('alternate' in rel_list
+                or ('stylesheet' not in rel_list
+                    and not ('preload' in rel_list and as_ == 'style'))
+                or ('preload' in rel_list and as_ != 'style'))
+
+
+def _prefetch_css_style_sheets(root, doc):
+    """Loads the style sheets that are linked from a document, and the style
+    sheets that they import, concurrently one nesting level at a time.
+    The links are filtered in the same way as
+    get_css_style_sheets_from_xml_stylesheet() and
+    get_css_style_sheet_from_element() do.
+
+    Arguments:
+        root (Element): The root element of the document.
+        doc (Document): The document or None.
+    Returns:
+        _PrefetchedResourceLoader: A resource loader that returns the loaded
+            responses.
+    """
+    loader = get_resource_loader(root)
+    if doc is not None:
+        win = doc.default_view
+        base_url = doc.document_uri
+    else:
+        win = None
+        base_url = None
+    urls = list()
+    for node in root.itersiblings(preceding=True):
+        if (not isinstance(node, etree.PIBase)
+                or node.target != 'xml-stylesheet'):
+            continue
+        href = node.get('href')
+        if (href is None
+                or len(href) == 0
+                or href[0] == '#'
+                or node.get('alternate', '') == 'yes'
+                or node.get('type', 'text/css') != 'text/css'
+                or not _match_media_text(win, node.get('media', ''))):
+            continue
+        urls.append(normalize_url(href, base_url).href)
+    for element in root.iter(tag=('{*}link', '{*}style')):
+        if etree.QName(element).localname == 'link':
+            href = element.get('href')
+            if (href is None
+                    or len(href) == 0
+                    or href[0] == '#'
+                    or not _is_link_style_sheet(element)
+                    or not _match_media_text(win, element.media)):
+                continue
+            urls.append(normalize_url(href, base_url).href)
+        elif (element.text is not None
+              and element.type == 'text/css'
+              and _match_media_text(win, element.media)):
+            owner_document = getattr(element, 'owner_document', None)
+            import_base_url = (owner_document.location.href
+                               if owner_document is not None else None)
+            rules = tinycss2.parse_stylesheet(element.text,
+                                              skip_comments=True,
+                                              skip_whitespace=True)
+            urls.extend(_get_import_urls(rules, import_base_url, win))
+
+    responses = dict()
+    while len(urls) > 0:
+        results = loader.load_all(urls)
+        responses.update(results)
+        urls = list()
+        for url, response in results.items():
+            if isinstance(response, Exception):
+                continue
+            data, headers = response
+            if not isinstance(data, bytes):
+                continue
+            content_type = get_content_type(headers)
+            encoding = ('utf-8' if content_type is None
+                        else content_type.get('charset', 'utf-8'))
+            rules, _ = tinycss2.parse_stylesheet_bytes(
+                css_bytes=data,
+                protocol_encoding=encoding,
+                skip_comments=True,
+                skip_whitespace=True)
+            urls.extend(x for x in _get_import_urls(rules, url, win)
+                        if x not in responses)
+    return _PrefetchedResourceLoader(loader, responses)
+
+
+def _get_ua_css_style_sheet():
+    global _ua_css_style_sheet
+    if _ua_css_style_sheet is None:
+        css_style_sheet = CSSStyleSheet()
+        css_style_sheet.insert_rule(_SVG_UA_CSS_STYLESHEET)
+        _ua_css_style_sheet = css_style_sheet
+    return _ua_css_style_sheet
+
+
+def _match_media(win, media, matched_media=None):
+    if win is None:
+        logger.debug('no active window: media={}'.format(repr(media)))
+        matches = False
+    else:
+        matches = win.match_media(media).matches
+    if matched_media is not None:
+        matched_media.append((media, matches))
+    return matches
+
+
+def _match_media_text(win, media):
+    if media in ['', 'all']:
+        return True
+    return _match_media(win, media)
+
+
+def _get_selector_keys(selector_text):
+    """Returns the bucket keys of a group of selectors: one
+    ('id' | 'class' | 'tag' | '*', name) pair per selector, taken from its
+    rightmost compound selector.
+    """
+    try:
+        selectors = cssselect.parse(selector_text)
+    except cssselect.SelectorSyntaxError:
+        return []
+    keys = list()
+    for selector in selectors:
+        tree = selector.parsed_tree
+        if isinstance(tree, cssselect.parser.CombinedSelector):
+            tree = tree.subselector
+        id_ = class_name = None
+        while not isinstance(tree, cssselect.parser.Element):
+            if isinstance(tree, cssselect.parser.Hash):
+                id_ = tree.id
+            elif isinstance(tree, cssselect.parser.Class):
+                class_name = tree.class_name
+            tree = tree.selector
+        if id_ is not None:
+            keys.append(('id', id_))
+        elif class_name is not None:
+            keys.append(('class', class_name))
+        elif tree.element is not None:
+            keys.append(('tag', tree.element))
+        else:
+            keys.append(('*', None))
+    return keys
+
+
+def _has_sibling_selectors(selector_text):
+    """Returns True if a group of selectors depends on the siblings of an
+    element: a next-sibling or subsequent-sibling combinator, or a
+    structural pseudo-class such as ':first-child'.
+    """
+    try:
+        selectors = cssselect.parse(selector_text)
+    except cssselect.SelectorSyntaxError:
+        return False
+    trees = [selector.parsed_tree for selector in selectors]
+    while len(trees) > 0:
+        tree = trees.pop()
+        if isinstance(tree, cssselect.parser.CombinedSelector):
+            if tree.combinator in ('+', '~'):
+                return True
+            trees.extend([tree.selector, tree.subselector])
+            continue
+        if isinstance(tree, cssselect.parser.Pseudo):
+            if tree.ident.lower() in _STRUCTURAL_PSEUDO_CLASSES:
+                return True
+        elif isinstance(tree, cssselect.parser.Function):
+            if tree.name.lower() in _STRUCTURAL_PSEUDO_CLASSES:
+                return True
+        elif isinstance(tree, cssselect.parser.Negation):
+            trees.append(tree.subselector)
+        selector = getattr(tree, 'selector', None)
+        if selector is not None:
+            trees.append(selector)
+    return False
+
+
+class _FrozenList(tuple):
+    """A read-only list value of a computed style."""
+
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            other = tuple(other)
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = tuple.__hash__
+
+    def copy(self):
+        return _thaw(self)
+
+
+class _FrozenDict(Mapping):
+    """A read-only dict value of a computed style."""
+
+    __slots__ = ('_data', '_hash')
+
+    def __init__(self, data):
+        self._data = data
+        self._hash = None
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(frozenset(self._data.items()))
+        return self._hash
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return repr(self._data)
+
+    def copy(self):
+        return _thaw(self)
+
+
+def _freeze(value):
+    if isinstance(value, list):
+        return _FrozenList(_freeze(x) for x in value)
+    elif isinstance(value, dict):
+        return _FrozenDict({key: _freeze(x) for key, x in value.items()})
+    return value
+
+
+def _thaw(value):
+    if isinstance(value, _FrozenList):
+        return [_thaw(x) for x in value]
+    elif isinstance(value, _FrozenDict):
+        return {key: _thaw(x) for key, x in value.items()}
+    return value
+
+
+class ComputedStyle(Mapping):
+    """Represents an immutable computed style.
+
+    The property names are held in a layout shared by all computed styles
+    with the same properties, and the values in a tuple. List and dict
+    values are stored as read-only sequences and mappings. Equal computed
+    styles can be interned to share one object.
+    """
+
+    __slots__ = ('_layout', '_values', '_hash', '__weakref__')
+
+    _layouts = dict()
+    _interned = weakref.WeakValueDictionary()
+
+    def __init__(self, style=None):
+        """Constructs a ComputedStyle object.
+
+        Arguments:
+            style (dict, optional): The computed properties.
+        """
+        if style is None:
+            style = dict()
+        keys = tuple(style.keys())
+        layout = ComputedStyle._layouts.get(keys)
+        if layout is None:
+            layout = keys, {key: index for index, key in enumerate(keys)}
+            ComputedStyle._layouts[keys] = layout
+        self._layout = layout
+        self._values = tuple(_freeze(value) for value in style.values())
+        self._hash = None
+
+    def __contains__(self, key):
+        return key in self._layout[1]
+
+    def __eq__(self, other):
+        if isinstance(other, ComputedStyle):
+            if self._layout is other._layout:
+                return self._values == other._values
+            return dict(self.items()) == dict(other.items())
+        elif isinstance(other, Mapping):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    def __getitem__(self, key):
+        return self._values[self._layout[1][key]]
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(frozenset(zip(self._layout[0], self._values)))
+        return self._hash
+
+    def __iter__(self):
+        return iter(self._layout[0])
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, repr(self.to_dict()))
+
+    @staticmethod
+    def intern(style):
+        """Returns the interned computed style equal to the style.
+
+        Arguments:
+            style (dict, ComputedStyle): The computed properties.
+        Returns:
+            ComputedStyle: A shared ComputedStyle object.
+        """
+        if not isinstance(style, ComputedStyle):
+            style = ComputedStyle(style)
+        key = style._layout[0], style._values
+        try:
+            return ComputedStyle._interned.setdefault(key, style)
+        except TypeError:
+            return style  # unhashable value
+
+    def replace(self, *args, **kwargs):
+        """Returns a new computed style with some properties replaced.
+        This object is not changed.
+
+        Arguments:
+            *args: A dict of the properties to be replaced.
+            **kwargs: The properties to be replaced.
+        Returns:
+            ComputedStyle: A new ComputedStyle object.
+        """
+        style = dict(zip(self._layout[0], self._values))
+        style.update(*args, **kwargs)
+        return ComputedStyle(style)
+
+    def to_dict(self):
+        """Returns a mutable copy of the computed style.
+
+        Returns:
+            dict: The computed properties.
+        """
+        return {key: _thaw(value)
+                for key, value in zip(self._layout[0], self._values)}
+
+
+class RuleIndex(object):
+    """Represents an index of CSS style rules.
+
+    Style rules are bucketed by the id, a class name or the local name of
+    the rightmost compound selector (or as universal), so that an element
+    is tested only against the rules that could match it.
+    """
+
+    def __init__(self, css_rules):
+        """Constructs a RuleIndex object.
+
+        Arguments:
+            css_rules (list[CSSRule]): A list of flattened CSS rules.
+        """
+        self._css_rules = list(css_rules)
+        self._buckets = {'id': dict(), 'class': dict(), 'tag': dict()}
+        self._universal = list()
+        self._style_rules = list()
+        self._has_sibling_selectors = False
+        namespaces = dict()
+        for position, css_rule in enumerate(self._css_rules):
+            if css_rule.type == CSSRule.NAMESPACE_RULE:
+                if len(css_rule.namespace_uri) > 0:
+                    prefix = css_rule.prefix
+                    if len(prefix) == 0:
+                        prefix = 'svg'
+                    namespaces = dict(namespaces)
+                    namespaces[prefix] = css_rule.namespace_uri
+                continue
+            elif css_rule.type != CSSRule.STYLE_RULE:
+                continue
+            entry = position, css_rule, namespaces
+            self._style_rules.append((css_rule, namespaces))
+            if (not self._has_sibling_selectors
+                    and _has_sibling_selectors(css_rule.selector_text)):
+                self._has_sibling_selectors = True
+            for kind, name in set(_get_selector_keys(css_rule.selector_text)):
+                if kind == '*':
+                    self._universal.append(entry)
+                else:
+                    self._buckets[kind].setdefault(name, []).append(entry)
+
+    @property
+    def css_rules(self):
+        """list[CSSRule]: A list of the indexed CSS rules in source order."""
+        return self._css_rules
+
+    @property
+    def has_sibling_selectors(self):
+        """bool: True if a selector of the indexed rules depends on the
+        siblings of an element.
+        """
+        return self._has_sibling_selectors
+
+    def get_candidates(self, element):
+        """Returns the style rules that could match the element.
+
+        Arguments:
+            element (Element): An element to be matched.
+        Returns:
+            list[tuple[CSSStyleRule, dict]]: A list of style rules and the
+                namespace prefixes declared by the preceding '@namespace'
+                rules, in source order.
+        """
+        buckets = self._buckets
+        entries = list(self._universal)
+        id_ = element.get('id')
+        if id_ is not None:
+            entries.extend(buckets['id'].get(id_, ()))
+        class_names = element.get('class')
+        if class_names is not None:
+            class_map = buckets['class']
+            for class_name in set(class_names.split()):
+                entries.extend(class_map.get(class_name, ()))
+        entries.extend(
+            buckets['tag'].get(etree.QName(element).localname, ()))
+        # a rule with a selector list can be in more than one bucket
+        entries = dict((entry[0], entry) for entry in entries)
+        return [(css_rule, namespaces)
+                for _, css_rule, namespaces in
+                sorted(entries.values(), key=lambda x: x[0])]
+
+    def match(self, root):
+        """Evaluates the selector of each style rule once against the whole
+        tree.
+        The result is the same as testing each element with
+        get_matched_css_rules().
+
+        Arguments:
+            root (Element): The root element of the tree.
+        Returns:
+            dict[Element, list[CSSStyleRule]]: A map of the elements to the
+                matching style rules in source order. Elements that match no
+                rules are not included.
+        """
+        namespaces = _get_default_namespaces(root)
+        merged = dict()
+        matched_rules = dict()
+        for css_rule, declared in self._style_rules:
+            if len(declared) == 0:
+                rule_namespaces = namespaces
+            else:
+                rule_namespaces = merged.get(id(declared))
+                if rule_namespaces is None:
+                    rule_namespaces = dict(namespaces)
+                    rule_namespaces.update(declared)
+                    merged[id(declared)] = rule_namespaces
+            for element in css_rule.select(root, rule_namespaces):
+                matched_rules.setdefault(element, []).append(css_rule)
+        return matched_rules
+
+
+def clear_css_cache():
+    """Discards all cached style sheets."""
+    _css_cache.clear()
+
+
+def flatten_css_rules(element, css_rules, matched_media=None):
     doc = element.owner_document
     win = doc.default_view if doc is not None else None
     flattened = list()
@@ -92,64 +689,73 @@ def flatten_css_rules(element, css_rules):
             # '@import' at-rule
             media = css_rule.media.media_text
             if media not in ['', 'all']:
-                if win is None:
-                    logger.debug('no active window: {}'.format(element))
-                    continue
-                mql = win.match_media(media)
-                if not mql.matches:
+                if not _match_media(win, media, matched_media):
                     logger.debug('media not matched: media={}'.format(
                         repr(media)))
                     continue
             flattened.extend(
-                flatten_css_rules(element, css_rule.style_sheet.css_rules))
+                flatten_css_rules(element, css_rule.style_sheet.css_rules,
+                                  matched_media=matched_media))
         elif css_rule.type == CSSRule.MEDIA_RULE:
             # '@media' at-rule
             media = css_rule.media.media_text
             if media not in ['', 'all']:
-                if win is None:
-                    logger.debug('no active window: {}'.format(element))
-                    continue
-                mql = win.match_media(media)
-                if not mql.matches:
+                if not _match_media(win, media, matched_media):
                     logger.debug('media not matched: media={}'.format(
                         repr(media)))
                     continue
             flattened.extend(
-                flatten_css_rules(element, css_rule.css_rules))
+                flatten_css_rules(element, css_rule.css_rules,
+                                  matched_media=matched_media))
         else:
             flattened.append(css_rule)
     return flattened
 
 
 def get_css_rules(element):
-    css_rules = list()
-    style_sheets = get_css_style_sheets(element)
-    for css_style_sheet in style_sheets:
-        css_rules.extend(css_style_sheet.css_rules)
-    flattened = flatten_css_rules(element, css_rules)
-    return flattened
+    """Returns the flattened CSS rules that apply to the document of the
+    element.
 
+    The style sheets are parsed once per document and reused until a
+    <link> or <style> element, an 'xml-stylesheet' processing instruction
+    or the result of a media query they depend on changes.
 
-def get_css_style_sheets(element):
-    style_sheets = list()
+    Arguments:
+        element (Element): An element of the document.
+    Returns:
+        list[CSSRule]: A list of CSS rules.
+    """
+    return list(_get_css_cache_entry(element).css_rules)
 
-    # user-agent style sheet
-    css_style_sheet = CSSStyleSheet()
-    css_style_sheet.insert_rule(_SVG_UA_CSS_STYLESHEET)
-    style_sheets.append(css_style_sheet)
 
-    root = element.getroottree().getroot()
+def get_css_rule_index(element):
+    """Returns the index of the flattened CSS rules that apply to the
+    document of the element.
+    See also get_css_rules().
 
-    # xml-stylesheet
-    style_sheets.extend(get_css_style_sheets_from_xml_stylesheet(root))
+    Arguments:
+        element (Element): An element of the document.
+    Returns:
+        RuleIndex: An index of CSS rules.
+    """
+    return _get_css_cache_entry(element).rule_index
 
-    # linked into or embedded stylesheet
-    style_sheets.extend(get_css_style_sheets_from_svg_document(root))
 
-    return style_sheets
+def get_css_style_sheets(element):
+    """Returns the CSS style sheets of the document of the element: the
+    user-agent style sheet, the 'xml-stylesheet' style sheets, and the
+    linked or embedded style sheets.
+
+    Arguments:
+        element (Element): An element of the document.
+    Returns:
+        list[CSSStyleSheet]: A list of CSS style sheets.
+    """
+    return list(_get_css_cache_entry(element).style_sheets)
 
 
-def get_css_style_sheet_from_element(element, doc=None):
+def get_css_style_sheet_from_element(element, doc=None, matched_media=None,
+                                     loader=None):
     local_name = element.local_name
     if local_name not in ['link', 'style']:
         raise ValueError(
@@ -164,14 +770,9 @@ def get_css_style_sheet_from_element(element, doc=None):
         base_url = None
 
     if local_name == 'link':
-        rel_list = element.rel_list
-        as_ = element.as_
-        if ('alternate' in rel_list
-                or ('stylesheet' not in rel_list
-                    and not ('preload' in rel_list and as_ == 'style'))
-                or ('preload' in rel_list and as_ != 'style')):
+        if not _is_link_style_sheet(element):
             logger.debug('not a style sheet: {} rel={} as={}'.format(
-                element, repr(rel_list), repr(as_)))
+                element, repr(element.rel_list), repr(element.as_)))
             return None  # TODO: support alternative style sheet.
         href = element.href
         if href is None or href[0] == '#':
@@ -180,17 +781,14 @@ def get_css_style_sheet_from_element(element, doc=None):
             return None
         media = element.media
         if media not in ['', 'all']:
-            if win is None:
-                logger.debug('no active window: {}'.format(element))
-                return None
-            mql = win.match_media(media)
-            if not mql.matches:
+            if not _match_media(win, media, matched_media):
                 logger.debug('media not matched: {} media={}'.format(
                     element, repr(media)))
                 return None
         url = normalize_url(href, base_url)
         css_style_sheet = CSSParser.parse(url.href,
-                                          owner_node=element)
+                                          owner_node=element,
+                                          loader=loader)
         return css_style_sheet
     else:  # 'style'
         if element.type != 'text/css' or element.text is None:
@@ -202,11 +800,7 @@ def get_css_style_sheet_from_element(element, doc=None):
             return None
         media = element.media
         if media not in ['', 'all']:
-            if win is None:
-                logger.debug('no active window: {}'.format(element))
-                return None
-            mql = win.match_media(media)
-            if not mql.matches:
+            if not _match_media(win, media, matched_media):
                 logger.debug('media not matched: {} media={}'.format(
                     element, repr(media)))
                 return None
@@ -215,24 +809,28 @@ def get_css_style_sheet_from_element(element, doc=None):
                                         title=element.title,
                                         media=element.media)
         css_rules = CSSParser.fromstring(element.text,
-                                         parent_style_sheet=css_style_sheet)
+                                         parent_style_sheet=css_style_sheet,
+                                         loader=loader)
         css_style_sheet.css_rules.extend(css_rules)
         return css_style_sheet
 
 
-def get_css_style_sheets_from_svg_document(root):
+def get_css_style_sheets_from_svg_document(root, matched_media=None,
+                                           loader=None):
     style_sheets = list()
     doc = root.owner_document
     for element in root.iter(tag=('{*}link', '{*}style')):
         # FIXME: iterated node's owner_document returns None.
-        css_style_sheet = get_css_style_sheet_from_element(element, doc)
+        css_style_sheet = get_css_style_sheet_from_element(
+            element, doc, matched_media=matched_media, loader=loader)
         if css_style_sheet is None:
             continue
         style_sheets.append(css_style_sheet)
     return style_sheets
 
 
-def get_css_style_sheets_from_xml_stylesheet(root):
+def get_css_style_sheets_from_xml_stylesheet(root, matched_media=None,
+                                             loader=None):
     style_sheets = list()
     doc = root.owner_document
     if doc is not None:
@@ -259,11 +857,7 @@ def get_css_style_sheets_from_xml_stylesheet(root):
             continue  # TODO: support alternative style sheet.
         media = element.get('media', '')
         if media not in ['', 'all']:
-            if win is None:
-                logger.debug('no active window: {}'.format(root))
-                continue
-            mql = win.match_media(media)
-            if not mql.matches:
+            if not _match_media(win, media, matched_media):
                 logger.debug('media not matched: media={}'.format(
                     repr(media)))
                 continue
@@ -271,37 +865,56 @@ def get_css_style_sheets_from_xml_stylesheet(root):
         url = normalize_url(href, base_url)
         css_style_sheet = CSSParser.parse(url.href,
                                           owner_node=element,
-                                          encoding=encoding)
+                                          encoding=encoding,
+                                          loader=loader)
         style_sheets.append(css_style_sheet)
     return style_sheets
 
 
-def get_css_style(element, css_rules):
-    style = dict()
-    style_important = dict()
+def _get_default_namespaces(element):
     namespaces = element.nsmap.copy()
     uri = namespaces.pop(None, None)
     if uri is not None:
         namespaces['svg'] = uri
+    return namespaces
+
+
+def get_css_style(element, css_rules):
+    css_rules = get_matched_css_rules(element, css_rules)
+    return get_matched_css_style(css_rules)
+
+
+def get_matched_css_rules(element, css_rules):
+    """Returns the style rules that match the element.
+
+    Arguments:
+        element (Element): An element to be matched.
+        css_rules (list[CSSRule], RuleIndex): A list of CSS rules or an index
+            of CSS rules.
+    Returns:
+        list[CSSStyleRule]: A list of the matching style rules in source
+            order.
+    """
+    matched = list()
+    namespaces = _get_default_namespaces(element)
+    if isinstance(css_rules, RuleIndex):
+        merged = dict()
+        for css_rule, declared in css_rules.get_candidates(element):
+            if len(declared) == 0:
+                rule_namespaces = namespaces
+            else:
+                rule_namespaces = merged.get(id(declared))
+                if rule_namespaces is None:
+                    rule_namespaces = dict(namespaces)
+                    rule_namespaces.update(declared)
+                    merged[id(declared)] = rule_namespaces
+            if css_rule.matches(element, rule_namespaces):
+                matched.append(css_rule)
+        return matched
     for css_rule in css_rules:
         if css_rule.type == CSSRule.STYLE_RULE:
-            try:
-                selector = cssselect.CSSSelector(css_rule.selector_text,
-                                                 namespaces=namespaces)
-                matched = selector(element)
-                if len(matched) > 0 and element in matched:
-                    for key, (value, priority) in css_rule.style.items():
-                        style[key] = value
-                        if priority == 'important':
-                            style_important[key] = value
-            except cssselect.ExpressionError as exp:
-                logger.info('ExpressionError: {}: \'{}\''.format(
-                    exp,
-                    css_rule.selector_text))
-            except cssselect.SelectorSyntaxError as exp:
-                logger.info('SelectorSyntaxError: {}: \'{}\''.format(
-                    exp,
-                    css_rule.selector_text))
+            if css_rule.matches(element, namespaces):
+                matched.append(css_rule)
         elif css_rule.type == CSSRule.FONT_FACE_RULE:
             # TODO: support CSS @font-face at-rule.
             pass
@@ -314,4 +927,25 @@ def get_css_style(element, css_rules):
                 if len(prefix) == 0:
                     prefix = 'svg'
                 namespaces[prefix] = css_rule.namespace_uri
+    return matched
+
+
+def get_matched_css_style(css_rules):
+    """Returns the declarations of the style rules that match an element.
+    See also RuleIndex.match().
+
+    Arguments:
+        css_rules (list[CSSStyleRule]): A list of the matching style rules
+            in source order.
+    Returns:
+        tuple[dict, dict]: The declared properties and the important
+            properties.
+    """
+    style = dict()
+    style_important = dict()
+    for css_rule in css_rules:
+        for key, (value, priority) in css_rule.style.items():
+            style[key] = value
+            if priority == 'important':
+                style_important[key] = value
     return style, style_important
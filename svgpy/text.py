@@ -13,8 +13,6 @@
 # limitations under the License.
 
 
-import copy
-
 from .base import SVGElement, SVGGraphicsElement, SVGPathDataSettings
 from .core import CSSUtils, Font, SVGLength
 from .dom import Element, Node
@@ -81,8 +79,8 @@ class SVGTextContentElement(SVGGraphicsElement):
         key = hash(element)
         style = style_map.get(key)
         if style is None:
-            style = element.get_computed_style()
-            style_map[key] = copy.deepcopy(style)
+            style = element.get_computed_style(frozen=True)
+            style_map[key] = style
         if element.text is not None:
             out_text = CSSUtils.normalize_text_content(
                 element,
@@ -175,13 +173,15 @@ class SVGTextContentElement(SVGGraphicsElement):
                 for info in iter(chars_info):
                     key = info[SVGTextContentElement._CHARS_ID]
                     style = info[SVGTextContentElement._CHARS_STYLE]
-                    style_map[key] = copy.deepcopy(style)
+                    style_map[key] = style
 
+                position_map = dict()
                 for info in iter(chars_info):
                     path_data, advance_list, bbox, (x, y) = \
                         SVGTextContentElement._get_text_path_data(
                             info[SVGTextContentElement._CHARS_ELEMENT],
                             style_map,
+                            position_map,
                             info[SVGTextContentElement._CHARS_TEXT],
                             x, y)
                     info[SVGTextContentElement._CHARS_PATH_DATA] = path_data
@@ -192,12 +192,15 @@ class SVGTextContentElement(SVGGraphicsElement):
         return chars_info
 
     @staticmethod
-    def _get_text_path_data(element, style_map, out_text, start_x, start_y):
+    def _get_text_path_data(element, style_map, position_map, out_text,
+                            start_x, start_y):
         """Returns the addressable characters.
 
         Arguments:
             element (SVGElement):
             style_map (dict):
+            position_map (dict): The remaining 'x', 'y', 'dx', 'dy' and
+                'rotate' values of the elements. Consumed values are removed.
             out_text (str): A text for rendering.
             start_x (float):
             start_y (float):
@@ -208,29 +211,39 @@ class SVGTextContentElement(SVGGraphicsElement):
             tuple[float, float]:
         """
 
-        def _get_inherited_attribute(_element, _style_map, _key,
-                                     _default=None):
+        def _get_inherited_attribute(_element, _style_map, _position_map,
+                                     _key, _default=None):
             while _element is not None:
                 if (_element.node_type == Node.ELEMENT_NODE
                         and _element.istext()
                         and _element.isdisplay()):
+                    _position_key = hash(_element), _key
+                    _value = _position_map.get(_position_key)
+                    if _value is not None:
+                        return _value
                     _style = _style_map.get(hash(_element))
                     if _style is None:
-                        _style = _element.get_computed_style()
+                        _style = _element.get_computed_style(frozen=True)
                         _style_map[hash(_element)] = _style
                     _value = _style.get(_key)
                     if _value is not None:
+                        _value = list(_value)
+                        _position_map[_position_key] = _value
                         return _value
                 _element = _element.getparent()
             return _default
 
         # TODO: support line-breaking and word-breaking.
-        x_list = _get_inherited_attribute(element, style_map, 'x', [])
-        y_list = _get_inherited_attribute(element, style_map, 'y', [])
-        dx_list = _get_inherited_attribute(element, style_map, 'dx', [])
-        dy_list = _get_inherited_attribute(element, style_map, 'dy', [])
+        x_list = _get_inherited_attribute(
+            element, style_map, position_map, 'x', [])
+        y_list = _get_inherited_attribute(
+            element, style_map, position_map, 'y', [])
+        dx_list = _get_inherited_attribute(
+            element, style_map, position_map, 'dx', [])
+        dy_list = _get_inherited_attribute(
+            element, style_map, position_map, 'dy', [])
         rotate_list = _get_inherited_attribute(
-            element, style_map, 'rotate', [])
+            element, style_map, position_map, 'rotate', [])
 
         style = style_map.get(hash(element))  # computed style
         assert style is not None
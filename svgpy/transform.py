@@ -31,6 +31,111 @@ _RE_NUMBER_SEQUENCE = re.compile(
     r"(\s*,\s*|\s+)?")
 
 
+def _parse_transform_list(text):
+    """Parses a text into a list of tuples of the transform type and the
+    values of each transform function.
+    """
+    items = list()
+    for it in _RE_TRANSFORM_LIST.finditer(text.strip()):
+        function_name = it.group('name').strip()
+        number_sequence = list()
+        for it2 in _RE_NUMBER_SEQUENCE.finditer(it.group('values').strip()):
+            number_sequence.append(float(it2.group('number')))
+        transform_type = _TRANSFORM_TYPE_MAP.get(
+            function_name,
+            SVGTransform.SVG_TRANSFORM_UNKNOWN)
+        items.append((transform_type, tuple(number_sequence)))
+    return items
+
+
+class ParsedTransformList(object):
+    """Represents an immutable parsed transform list.
+
+    The elements with the same 'transform' attribute can share one
+    ParsedTransformList object: the text is parsed once, and the matrices
+    are computed once when first needed.
+
+    Examples:
+        >>> parsed = ParsedTransformList('translate(50 30) rotate(30)')
+        >>> len(parsed)
+        2
+        >>> parsed.to_transform_list().tostring()
+        'translate(50, 30) rotate(30)'
+        >>> parsed.matrix.tostring()
+        'matrix(0.866025, 0.5, -0.5, 0.866025, 50, 30)'
+    """
+
+    __slots__ = ('_items', '_matrices', '_matrix', '_text')
+
+    def __init__(self, text):
+        """Constructs a ParsedTransformList object.
+
+        Arguments:
+            text (str): A text to be parsed.
+        """
+        self._items = tuple(_parse_transform_list(text))
+        self._text = text
+        self._matrices = None
+        self._matrix = None
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return '<{}.{} object at {} {}>'.format(
+            type(self).__module__, type(self).__name__, hex(id(self)),
+            repr(self._text))
+
+    @property
+    def items(self):
+        """tuple[tuple[int, tuple[float, ...]], ...]: A tuple of the
+        transform type and the values of each transform function.
+        """
+        return self._items
+
+    @property
+    def matrices(self):
+        """tuple[DOMMatrixReadOnly, ...]: The matrix of each transform
+        function.
+        """
+        if self._matrices is None:
+            matrices = list()
+            for transform_type, number_sequence in self._items:
+                matrix = SVGTransform(transform_type, *number_sequence).matrix
+                if matrix is not None:
+                    matrix = DOMMatrixReadOnly(matrix.tolist())
+                matrices.append(matrix)
+            self._matrices = tuple(matrices)
+        return self._matrices
+
+    @property
+    def matrix(self):
+        """DOMMatrixReadOnly: The matrix of the transform list or None."""
+        if self._matrix is None and len(self._items) > 0:
+            matrix = DOMMatrix()
+            for transform_matrix in self.matrices:
+                matrix *= transform_matrix
+            self._matrix = DOMMatrixReadOnly(matrix.tolist())
+        return self._matrix
+
+    @property
+    def text(self):
+        """str: The parsed text."""
+        return self._text
+
+    def to_transform_list(self):
+        """Returns a new SVGTransformList object.
+
+        Returns:
+            SVGTransformList: A new list of SVGTransform objects.
+        """
+        transform_list = SVGTransformList()
+        for transform_type, number_sequence in self._items:
+            transform_list.append(SVGTransform(transform_type,
+                                               *number_sequence))
+        return transform_list
+
+
 class SVGTransform(object):
     """Represents the transform function values."""
 
@@ -501,15 +606,7 @@ class SVGTransformList(MutableSequence):
             rotate(30)
         """
         transform_list = SVGTransformList()
-        for it in _RE_TRANSFORM_LIST.finditer(text.strip()):
-            function_name = it.group('name').strip()
-            number_sequence = list()
-            for it2 in _RE_NUMBER_SEQUENCE.finditer(
-                    it.group('values').strip()):
-                number_sequence.append(float(it2.group('number')))
-            transform_type = _TRANSFORM_TYPE_MAP.get(
-                function_name,
-                SVGTransform.SVG_TRANSFORM_UNKNOWN)
+        for transform_type, number_sequence in _parse_transform_list(text):
             transform_list.append(SVGTransform(transform_type,
                                                *number_sequence))
         return transform_list
@@ -14,13 +14,23 @@
 
 
 import base64
+import hashlib
+import http.client
+import json
 import os
 import re
+import tempfile
+import threading
+import time
 from collections import OrderedDict
 from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from logging import getLogger
 from pathlib import PurePath
-from urllib.parse import unquote
-from urllib.request import urlopen
+from urllib.error import HTTPError, URLError
+from urllib.parse import unquote, urljoin, urlsplit, urlunsplit
+from urllib.request import getproxies, proxy_bypass, url2pathname, urlopen
 
 from .exception import InvalidCharacterError, NamespaceError
 from .url import Location, URL
@@ -170,6 +180,26 @@ def get_elements_by_tag_name_ns(element, namespace, local_name,
                          local_name=local_name)
 
 
+def get_resource_loader(node=None):
+    """Returns the resource loader of the document that the node belongs to.
+
+    Arguments:
+        node (Node, optional): A node of the document.
+    Returns:
+        ResourceLoader: The resource loader of the document, or the default
+            resource loader if the node is not associated with a document.
+    """
+    doc = None
+    if node is not None:
+        doc = getattr(node, 'owner_document', None)
+        if doc is None and hasattr(node, 'getroottree'):
+            root = node.getroottree().getroot()
+            doc = getattr(root, 'owner_document', None)
+    if doc is not None:
+        return doc.resource_loader
+    return default_resource_loader
+
+
 def is_ascii_whitespace(value):
     if any(ch in value for ch in _ASCII_WHITESPACE):
         return True
@@ -303,6 +333,77 @@ class CaseInsensitiveMapping(MutableMapping):
         return self._data.values()
 
 
+class LRUCache(MutableMapping):
+    """Represents a mapping that holds at most `maxsize` items, and discards
+    the least recently used item when it is full.
+    """
+
+    def __init__(self, maxsize=128):
+        """Constructs a LRUCache object.
+
+        Arguments:
+            maxsize (int, optional): The maximum number of items. If None, the
+                cache can grow without bound.
+        """
+        self._data = OrderedDict()
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def __getitem__(self, key):
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            raise
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return '<{}.{} object at 0x{:x} (hits={}, misses={}, maxsize={}, ' \
+               'currsize={})>'.format(
+                   type(self).__module__, type(self).__name__, id(self),
+                   self.hits, self.misses, self._maxsize, len(self._data))
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if self._maxsize is not None:
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Removes all items and resets the statistics."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self):
+        """int: The maximum number of items."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize):
+        self._maxsize = maxsize
+        if maxsize is not None:
+            while len(self._data) > maxsize:
+                self._data.popitem(last=False)
+
+
 class QualifiedName(object):
     """Utility class for the qualified name."""
 
@@ -391,3 +492,357 @@ class QualifiedName(object):
     def namespace_uri(self):
         """str: The namespace URI or None."""
         return self._namespace
+
+
+class _ResourceEntry(object):
+    """A cached response."""
+
+    __slots__ = ('data', 'headers', 'expires', 'validator')
+
+    def __init__(self, data, headers, expires=None, validator=None):
+        self.data = data
+        self.headers = headers
+        self.expires = expires
+        self.validator = validator
+
+
+class ResourceLoader(object):
+    """Loads the resources by URL, and caches them.
+
+    The responses are held in an in-memory LRU cache, and optionally in a
+    directory. A cached 'file:' resource is reused while the modification
+    time and the size of the file are unchanged. A cached HTTP(S) response
+    is reused while it is fresh according to the 'Cache-Control' and
+    'Expires' headers, and is revalidated by the 'ETag' and
+    'Last-Modified' headers after that. The HTTP(S) connections are kept
+    alive and reused. As with urllib.request.urlopen(), the proxy servers
+    are taken from the environment (e.g. 'HTTP_PROXY', 'HTTPS_PROXY' and
+    'NO_PROXY').
+    """
+
+    MAX_REDIRECTS = 10
+
+    def __init__(self, maxsize=128, cache_dir=None, timeout=None,
+                 max_workers=8):
+        """Constructs a ResourceLoader object.
+
+        Arguments:
+            maxsize (int, optional): The maximum number of the resources in
+                the in-memory cache. If None, the cache can grow without
+                bound.
+            cache_dir (str, optional): The directory of the on-disk cache
+                for HTTP(S) responses. If None, the on-disk cache is not used.
+            timeout (float, optional): The timeout in seconds for blocking
+                operations.
+            max_workers (int, optional): The maximum number of the resources
+                to be loaded concurrently by load_all().
+        """
+        self._cache = LRUCache(maxsize=maxsize)
+        self._cache_dir = cache_dir
+        self._timeout = timeout
+        self._max_workers = max_workers
+        self._connections = dict()
+        self._lock = threading.RLock()
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @property
+    def cache(self):
+        """LRUCache: The in-memory cache."""
+        return self._cache
+
+    @property
+    def cache_dir(self):
+        """str: The directory of the on-disk cache or None."""
+        return self._cache_dir
+
+    def clear(self):
+        """Removes all resources from the in-memory cache, and closes the
+        idle connections.
+        """
+        with self._lock:
+            self._cache.clear()
+            connections = self._connections
+            self._connections = dict()
+        for idle in connections.values():
+            for conn in idle:
+                conn.close()
+
+    def load(self, src, encoding=None):
+        """Loads the resource.
+
+        Arguments:
+            src (str, URL): The URL of the resource.
+            encoding (str, optional): The character encoding to decode the
+                resource. If None, returns the bytes.
+        Returns:
+            tuple[bytes | str, CaseInsensitiveMapping]: The resource and the
+                response headers.
+        """
+        if isinstance(src, URL):
+            url = src
+        elif isinstance(src, str):
+            url = URL(src)
+        else:
+            raise TypeError('Expected str or URL, got {}'.format(src))
+        scheme = url.protocol
+        if scheme == 'file:':
+            entry = self._load_file(url.tostring(exclude_fragment=True))
+        elif scheme in ('http:', 'https:'):
+            entry = self._load_http(url.tostring(exclude_fragment=True))
+        else:
+            return load(url, encoding=encoding)
+        data = entry.data
+        if encoding is not None:
+            data = data.decode(encoding)
+        return data, CaseInsensitiveMapping(entry.headers)
+
+    def load_all(self, urls):
+        """Loads the resources concurrently.
+
+        Arguments:
+            urls (list[str]): The URLs of the resources.
+        Returns:
+            dict[str, tuple[bytes, CaseInsensitiveMapping] | Exception]: The
+                resources and the response headers, or the exceptions raised
+                while loading them, in the order of the URLs.
+        """
+        urls = list(OrderedDict.fromkeys(urls))
+        results = OrderedDict()
+        if len(urls) == 0:
+            return results
+        max_workers = max(1, min(len(urls), self._max_workers))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(url, executor.submit(self.load, url))
+                       for url in urls]
+            for url, future in futures:
+                try:
+                    results[url] = future.result()
+                except Exception as exp:
+                    results[url] = exp
+        return results
+
+    def _get(self, key):
+        with self._lock:
+            return self._cache.get(key)
+
+    def _set(self, key, entry):
+        with self._lock:
+            self._cache[key] = entry
+
+    def _load_file(self, href):
+        path = url2pathname(urlsplit(href).path)
+        try:
+            stat = os.stat(path)
+            validator = stat.st_mtime_ns, stat.st_size
+        except OSError:
+            validator = None
+        entry = self._get(href)
+        if (entry is not None
+                and validator is not None
+                and entry.validator == validator):
+            return entry
+        data, headers = load(href, timeout=self._timeout)
+        entry = _ResourceEntry(data, list(headers.items()),
+                               validator=validator)
+        if validator is not None:
+            self._set(href, entry)
+        return entry
+
+    def _load_http(self, href):
+        entry = self._get(href)
+        if entry is None:
+            entry = self._read_disk_cache(href)
+        if entry is not None and entry.expires is not None \
+                and time.time() < entry.expires:
+            return entry
+
+        request_headers = dict()
+        if entry is not None and entry.validator is not None:
+            etag, last_modified = entry.validator
+            if etag is not None:
+                request_headers['If-None-Match'] = etag
+            if last_modified is not None:
+                request_headers['If-Modified-Since'] = last_modified
+        status, reason, headers, data = self._request(href, request_headers)
+        headers = CaseInsensitiveMapping(headers)
+        if status == 304 and entry is not None:
+            updated = headers
+            headers = CaseInsensitiveMapping(entry.headers)
+            for name in ('Cache-Control', 'Date', 'ETag', 'Expires',
+                         'Last-Modified'):
+                if name in updated:
+                    headers[name] = updated[name]
+            data = entry.data
+        elif status != 200:
+            raise HTTPError(href, status, reason, headers, None)
+
+        cache_control = [x.strip().lower() for x in
+                         headers.get('Cache-Control', '').split(',')]
+        expires = _get_expiration_time(headers, cache_control)
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        validator = ((etag, last_modified)
+                     if etag is not None or last_modified is not None
+                     else None)
+        entry = _ResourceEntry(data, list(headers.items()), expires,
+                               validator)
+        if 'no-store' not in cache_control:
+            self._set(href, entry)
+            self._write_disk_cache(href, entry)
+        return entry
+
+    def _request(self, href, request_headers):
+        for _ in range(ResourceLoader.MAX_REDIRECTS + 1):
+            status, reason, headers, data = self._request_once(
+                href, request_headers)
+            location = CaseInsensitiveMapping(headers).get('Location')
+            if status not in (301, 302, 303, 307, 308) or location is None:
+                return status, reason, headers, data
+            href = urljoin(href, location)
+        raise HTTPError(href, status, 'Too many redirects', headers, None)
+
+    def _request_once(self, href, request_headers):
+        parts = urlsplit(href)
+        proxy = _get_proxy(parts.scheme, parts.netloc)
+        key = parts.scheme, parts.netloc, proxy
+        path = parts.path if len(parts.path) > 0 else '/'
+        if len(parts.query) > 0:
+            path += '?' + parts.query
+        if proxy is not None and parts.scheme == 'http':
+            # the absolute-form of the request target
+            path = urlunsplit((parts.scheme, parts.netloc, path, '', ''))
+            _, authorization = proxy
+            if authorization is not None:
+                request_headers = dict(request_headers)
+                request_headers['Proxy-Authorization'] = authorization
+        logger = getLogger('{}.{}'.format(__name__, type(self).__name__))
+        while True:
+            conn, reused = self._get_connection(key)
+            try:
+                logger.debug('GET \'{}\''.format(href))
+                conn.request('GET', path, headers=request_headers)
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError) as exp:
+                conn.close()
+                if reused:
+                    continue  # the idle connection has been closed
+                raise URLError(exp)
+            if response.will_close:
+                conn.close()
+            else:
+                self._release_connection(key, conn)
+            return response.status, response.reason, \
+                response.getheaders(), data
+
+    def _get_connection(self, key):
+        with self._lock:
+            idle = self._connections.get(key)
+            if idle:
+                return idle.pop(), True
+        scheme, netloc, proxy = key
+        host = netloc if proxy is None else proxy[0]
+        if scheme == 'https':
+            conn = http.client.HTTPSConnection(host, timeout=self._timeout)
+            if proxy is not None:
+                _, authorization = proxy
+                headers = ({'Proxy-Authorization': authorization}
+                           if authorization is not None else None)
+                conn.set_tunnel(netloc, headers=headers)
+        else:
+            conn = http.client.HTTPConnection(host, timeout=self._timeout)
+        return conn, False
+
+    def _release_connection(self, key, conn):
+        with self._lock:
+            self._connections.setdefault(key, list()).append(conn)
+
+    def _get_disk_cache_path(self, href):
+        name = hashlib.sha1(href.encode('utf-8')).hexdigest()
+        return os.path.join(self._cache_dir, name)
+
+    def _read_disk_cache(self, href):
+        if self._cache_dir is None:
+            return None
+        path = self._get_disk_cache_path(href)
+        try:
+            with open(path + '.json', 'r', encoding='utf-8') as fp:
+                meta = json.load(fp)
+            with open(path + '.data', 'rb') as fp:
+                data = fp.read()
+        except (OSError, ValueError):
+            return None
+        if meta.get('url') != href:
+            return None
+        validator = meta.get('validator')
+        entry = _ResourceEntry(data,
+                               [tuple(x) for x in meta['headers']],
+                               meta.get('expires'),
+                               tuple(validator) if validator else None)
+        self._set(href, entry)
+        return entry
+
+    def _write_disk_cache(self, href, entry):
+        if self._cache_dir is None:
+            return
+        path = self._get_disk_cache_path(href)
+        meta = {
+            'url': href,
+            'headers': entry.headers,
+            'expires': entry.expires,
+            'validator': entry.validator,
+        }
+        try:
+            for suffix, content, mode in [('.data', entry.data, 'wb'),
+                                          ('.json', json.dumps(meta), 'w')]:
+                fd, temp = tempfile.mkstemp(dir=self._cache_dir)
+                with os.fdopen(fd, mode) as fp:
+                    fp.write(content)
+                os.replace(temp, path + suffix)
+        except OSError as exp:
+            logger = getLogger('{}.{}'.format(__name__, type(self).__name__))
+            logger.info('failed to write the cache: \'{}\': {}'.format(
+                href, repr(exp)))
+
+
+def _get_proxy(scheme, netloc):
+    """Returns the address of the proxy server for the URL and the value of
+    the 'Proxy-Authorization' header, or None if the URL is not proxied
+    (see urllib.request.getproxies() and urllib.request.proxy_bypass()).
+    """
+    proxy = getproxies().get(scheme)
+    if proxy is None or proxy_bypass(netloc.rpartition('@')[2]):
+        return None
+    if '://' not in proxy:
+        proxy = 'http://' + proxy
+    parts = urlsplit(proxy)
+    authorization = None
+    if parts.username is not None:
+        credentials = '{}:{}'.format(unquote(parts.username),
+                                     unquote(parts.password or ''))
+        authorization = 'Basic ' + base64.b64encode(
+            credentials.encode('utf-8')).decode('ascii')
+    return parts.netloc.rpartition('@')[2], authorization
+
+
+def _get_expiration_time(headers, cache_control):
+    if 'no-cache' in cache_control or 'no-store' in cache_control:
+        return None
+    now = time.time()
+    for directive in cache_control:
+        if directive.startswith('max-age='):
+            try:
+                return now + int(directive[8:].strip('"'))
+            except ValueError:
+                return None
+    expires = headers.get('Expires')
+    if expires is not None:
+        try:
+            return parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+default_resource_loader = ResourceLoader()
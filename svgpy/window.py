@@ -21,17 +21,21 @@ from logging import getLogger
 
 from lxml import etree
 
+from .base import CTMResolver
 from .core import SVGLength
 from .css import mediaquery as mq
 from .css.screen import Screen
 from .dom import Element, Node, NonElementParentNode, ParentNode, \
-    node_insert_before
+    StyleResolver, node_insert_before
 from .exception import HierarchyRequestError
 from .style import get_css_style_sheets
 from .url import Location
-from .utils import get_content_type, get_element_by_id, \
-    get_elements_by_class_name, get_elements_by_tag_name, \
-    get_elements_by_tag_name_ns, load, normalize_url
+from .utils import LRUCache, ResourceLoader, default_resource_loader, \
+    get_content_type, get_element_by_id, get_elements_by_class_name, \
+    get_elements_by_tag_name, get_elements_by_tag_name_ns, load, \
+    normalize_url
+
+_media_query_cache = LRUCache(maxsize=256)
 
 
 class BrowsingContext(object):
@@ -96,7 +100,11 @@ class Document(Node, NonElementParentNode, ParentNode, Collection):
             self._location = default_view.location
         else:
             self._location = Location(self._browsing_context)
+        self._ctm_resolver = None
         self._registered_property_set = dict()
+        self._resource_loader = None
+        self._style_resolver = None
+        self._transform_cache = LRUCache(maxsize=1024)
 
     def __contains__(self, node):
         return node in self.child_nodes
@@ -132,6 +140,12 @@ class Document(Node, NonElementParentNode, ParentNode, Collection):
         """str: The MIME type of the current document."""
         return self._content_type
 
+    @property
+    def ctm_resolver(self):
+        """CTMResolver: The CTM resolver of the compute_ctms() calls or None.
+        """
+        return self._ctm_resolver
+
     @property
     def default_view(self):
         """Window: The active window that is associated with the current
@@ -214,6 +228,29 @@ class Document(Node, NonElementParentNode, ParentNode, Collection):
         """
         return self._registered_property_set
 
+    @property
+    def resource_loader(self):
+        """ResourceLoader: The resource loader of the current document.
+        Defaults to the resource loader of the associated window.
+        """
+        if self._resource_loader is not None:
+            return self._resource_loader
+        win = self.default_view
+        if win is not None:
+            return win.resource_loader
+        return default_resource_loader
+
+    @resource_loader.setter
+    def resource_loader(self, loader):
+        self._resource_loader = loader
+
+    @property
+    def style_resolver(self):
+        """StyleResolver: The style resolver of the last compute_styles()
+        call or None.
+        """
+        return self._style_resolver
+
     @property
     def style_sheets(self):
         """list[StyleSheet]: A list of the document CSS style sheets."""
@@ -229,6 +266,14 @@ class Document(Node, NonElementParentNode, ParentNode, Collection):
     def text_content(self, text):
         pass  # do nothing
 
+    @property
+    def transform_cache(self):
+        """LRUCache: The parsed 'transform' attributes of the elements of the
+        document, keyed by the attribute text. The elements with the same
+        'transform' attribute share one ParsedTransformList object.
+        """
+        return self._transform_cache
+
     @property
     def url(self):
         """str: The entire URL of the current document."""
@@ -287,6 +332,47 @@ class Document(Node, NonElementParentNode, ParentNode, Collection):
         _ = document
         return False
 
+    def compute_ctms(self, root=None):
+        """Resolves the current transformation matrices (CTM) of the element
+        and its descendants in a single top-down pass.
+        The results are stored, and SVGGraphicsElement.get_ctm() and
+        SVGGraphicsElement.get_screen_ctm() return them while the
+        'transform' attributes, the SVG viewport attributes and the parents
+        of the element and its ancestors are unchanged. See CTMResolver.
+
+        Arguments:
+            root (Element, optional): The root of the subtree. If not
+                specified, the document element is used.
+        """
+        if root is None:
+            root = self._document_element
+            if root is None:
+                return
+        if self._ctm_resolver is None:
+            self._ctm_resolver = CTMResolver()
+        self._ctm_resolver.resolve(root)
+
+    def compute_styles(self, selector_first=False):
+        """Resolves the styles of all elements of the document in a single
+        top-down pass.
+        The results are stored, and Element.get_computed_style() and
+        Element.get_inherited_style() return them while the element and its
+        ancestors are unchanged; the styles that may have changed are
+        resolved again. See StyleResolver.
+
+        Arguments:
+            selector_first (bool, optional): If True, each style rule is
+                evaluated once against the whole document instead of being
+                tested against each element. See StyleResolver.
+        """
+        self._style_resolver = None
+        root = self._document_element
+        if root is None:
+            return
+        style_resolver = StyleResolver(selector_first=selector_first)
+        style_resolver.resolve(root)
+        self._style_resolver = style_resolver
+
     def create_attribute(self, local_name):
         """Creates a new attribute instance, and returns it.
         See also SVGParser.create_attribute().
@@ -557,11 +643,14 @@ class Document(Node, NonElementParentNode, ParentNode, Collection):
         resource = url.href
         logger = getLogger('{}.{}'.format(__name__, self.__class__.__name__))
         logger.debug('navigate to \'{}\''.format(resource))
+        self._ctm_resolver = None
+        self._style_resolver = None
         root = self._document_element
         if root is not None:
             self.remove(root)
         if url.protocol != 'about:':
-            root = self._implementation.parse(resource)
+            root = self._implementation.parse(resource,
+                                              loader=self.resource_loader)
             self.append(root)
         return self
 
@@ -709,7 +798,11 @@ class MediaQueryList(object):
         """
         self._browsing_context = browsing_context
         self._query = query
-        self._tree = mq.parse(self._query)
+        tree = _media_query_cache.get(query)
+        if tree is None:
+            tree = mq.parse(query)
+            _media_query_cache[query] = tree
+        self._tree = tree
 
     @property
     def matches(self):
@@ -717,39 +810,12 @@ class MediaQueryList(object):
         doc = self._browsing_context.document
         win = self._browsing_context.window
         context = doc.document_element
-        if context is not None:
-            _, _, vpw, vph = context.get_viewport_size()
-            width = vpw.value()
-            height = vph.value()
-        else:
-            width = win.inner_width
-            height = win.inner_height
-        aspect_ratio = Fraction(int(width), int(height))
-        screen = win.screen
-        device_aspect_ratio = Fraction(int(screen.width), int(screen.height))
-        conditions = {
-            'media': screen.media,
-            'width': '{}px'.format(width),
-            'height': '{}px'.format(height),
-            'aspect-ratio': '{}'.format(aspect_ratio),
-            'orientation': screen.orientation.type,
-            'resolution': '{}dppx'.format(win.device_pixel_ratio),
-            'scan': screen.scan,
-            'grid': 0,
-            'update': screen.update,
-            'overflow-block': 'none',
-            'overflow-inline': 'none',
-            'color': screen.color_depth,
-            'color-index': 1 << screen.color_depth,
-            'monochrome': screen.monochrome,
-            'color-gamut': screen.color_gamut,
-            # deprecated media features
-            'device-width': '{}px'.format(screen.width),
-            'device-height': '{}px'.format(screen.height),
-            'device-aspect-ratio': '{}'.format(device_aspect_ratio),
-        }
-        matches, _ = mq.match(self._tree, conditions, _mql_compare,
-                              user_data=context)
+        conditions, results = win._get_media_conditions(context)
+        matches = results.get(self._query)
+        if matches is None:
+            matches, _ = mq.match(self._tree, conditions, _mql_compare,
+                                  user_data=context)
+            results[self._query] = matches
         return matches
 
     @property
@@ -824,17 +890,22 @@ class SVGDOMImplementation(DOMImplementation):
                                    nsmap=nsmap)
         return doc
 
-    def parse(self, source):
+    def parse(self, source, loader=None):
         """Parses an SVG document, and returns the root element of it.
 
         Arguments:
             source (str, file): An URL or a file-like object of an SVG
                 document.
+            loader (ResourceLoader, optional): A resource loader to load the
+                document. If None, the document is loaded without caching.
         Returns:
             Element: A root element of the document.
         """
         if isinstance(source, str):
-            data, headers = load(source)
+            if loader is not None:
+                data, headers = loader.load(source)
+            else:
+                data, headers = load(source)
             content_type = get_content_type(headers)
             if content_type is None:
                 charset = 'utf-8'
@@ -867,6 +938,8 @@ class Window(object):
         self._inner_width = self._screen.width
         self._inner_height = self._screen.height
         self._page_zoom_scale = 1.
+        self._media_state = None
+        self._resource_loader = default_resource_loader
 
     @property
     def device_pixel_ratio(self):
@@ -921,6 +994,20 @@ class Window(object):
     def page_zoom_scale(self, scale):
         self._page_zoom_scale = float(scale)
 
+    @property
+    def resource_loader(self):
+        """ResourceLoader: The resource loader that loads the documents and
+        the style sheets.
+        """
+        return self._resource_loader
+
+    @resource_loader.setter
+    def resource_loader(self, loader):
+        if not isinstance(loader, ResourceLoader):
+            raise TypeError('Expected ResourceLoader, got '
+                            + repr(type(loader)))
+        self._resource_loader = loader
+
     @property
     def screen(self):
         """Screen: The Screen object that is associated with the current
@@ -928,6 +1015,63 @@ class Window(object):
         """
         return self._screen
 
+    def _get_media_conditions(self, context):
+        """Returns the values of the media features and a dict of the
+        media query results, both shared until the viewport or the screen
+        changes.
+        """
+        screen = self._screen
+        key = (context,
+               context.get('width') if context is not None else None,
+               context.get('height') if context is not None else None,
+               self._inner_width,
+               self._inner_height,
+               self.device_pixel_ratio,
+               screen.media,
+               screen.width,
+               screen.height,
+               screen.orientation.angle,
+               screen.color_depth,
+               screen.monochrome,
+               screen.color_gamut,
+               screen.scan,
+               screen.update)
+        if self._media_state is not None and self._media_state[0] == key:
+            return self._media_state[1:]
+
+        if context is not None:
+            _, _, vpw, vph = context.get_viewport_size()
+            width = vpw.value()
+            height = vph.value()
+        else:
+            width = self._inner_width
+            height = self._inner_height
+        aspect_ratio = Fraction(int(width), int(height))
+        device_aspect_ratio = Fraction(int(screen.width), int(screen.height))
+        conditions = {
+            'media': screen.media,
+            'width': '{}px'.format(width),
+            'height': '{}px'.format(height),
+            'aspect-ratio': '{}'.format(aspect_ratio),
+            'orientation': screen.orientation.type,
+            'resolution': '{}dppx'.format(self.device_pixel_ratio),
+            'scan': screen.scan,
+            'grid': 0,
+            'update': screen.update,
+            'overflow-block': 'none',
+            'overflow-inline': 'none',
+            'color': screen.color_depth,
+            'color-index': 1 << screen.color_depth,
+            'monochrome': screen.monochrome,
+            'color-gamut': screen.color_gamut,
+            # deprecated media features
+            'device-width': '{}px'.format(screen.width),
+            'device-height': '{}px'.format(screen.height),
+            'device-aspect-ratio': '{}'.format(device_aspect_ratio),
+        }
+        self._media_state = key, conditions, dict()
+        return self._media_state[1:]
+
     def match_media(self, query):
         """Returns a new MediaQueryList object, with the context object’s
         associated Document, with parsed media query list as its associated
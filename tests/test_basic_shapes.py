@@ -12,8 +12,8 @@ from svgpy.element import HTMLAudioElement, HTMLVideoElement, \
     SVGRectElement, SVGSVGElement, SVGTextElement
 from svgpy import Comment, DOMMatrix, DOMRect, Element, Font, HTMLElement, \
     Node, PathParser, SVGLength, SVGParser, \
-    SVGPathDataSettings, SVGPreserveAspectRatio, SVGZoomAndPan, window, \
-    formatter
+    SVGPathDataSettings, SVGPreserveAspectRatio, SVGTransform, \
+    SVGZoomAndPan, window, formatter
 
 SVG_ARCS02 = '''
 <svg width="12cm" height="5.25cm" viewBox="0 0 1200 525" version="1.1"
@@ -518,6 +518,76 @@ class BasicShapesTestCase(unittest.TestCase):
         self.assertEqual(100 * 2, bbox.width)
         self.assertEqual(100 * 2, bbox.height)
 
+    def test_circle_get_point_at_length(self):
+        parser = SVGParser()
+        circle = parser.create_element('circle')
+        circle.attributes.update({
+            'cx': '100',
+            'cy': '100',
+            'r': '50',
+        })
+        index = circle.get_path_length_index()
+        self.assertIs(index, circle.get_path_length_index())
+
+        x, y = circle.get_point_at_length(math.pi * 25)
+        self.assertAlmostEqual(100, x)
+        self.assertAlmostEqual(150, y)
+        self.assertAlmostEqual(
+            180, abs(circle.get_tangent_at_length(math.pi * 25)))
+        self.assertEqual(1, circle.get_path_segment_at_length(math.pi * 20))
+        self.assertEqual(2, circle.get_path_segment_at_length(math.pi * 30))
+
+        # geometry changed
+        circle.attributes['r'] = '100'
+        self.assertIsNot(index, circle.get_path_length_index())
+        self.assertAlmostEqual(2 * math.pi * 100, circle.get_total_length())
+        x, y = circle.get_point_at_length(math.pi * 50)
+        self.assertAlmostEqual(100, x)
+        self.assertAlmostEqual(200, y)
+
+    def test_circle_get_points_at_lengths(self):
+        parser = SVGParser()
+        root = parser.create_element('svg')
+        root.attributes.update({
+            'width': '200',
+            'height': '200',
+        })
+        circle = root.create_sub_element('circle')
+        circle.attributes.update({
+            'cx': '100',
+            'cy': '100',
+            'r': '50',
+        })
+        distances = [0, math.pi * 25, math.pi * 50, math.pi * 75]
+        points = circle.get_points_at_lengths(distances)
+        self.assertEqual((4, 2), points.shape)
+        expected = [(150, 100), (100, 150), (50, 100), (100, 50)]
+        for (x, y), (ex, ey) in zip(points.tolist(), expected):
+            self.assertAlmostEqual(ex, x)
+            self.assertAlmostEqual(ey, y)
+        tangents = circle.get_tangents_at_lengths(distances)
+        for angle, expected in zip(tangents.tolist(), [90, 180, 90, 0]):
+            self.assertAlmostEqual(expected, abs(angle))
+        self.assertEqual(
+            [1, 2, 3, 4],
+            circle.get_path_segments_at_lengths(
+                [d + 1 for d in distances]).tolist())
+
+        # the attributes are unchanged
+        index = circle.get_path_length_index()
+        root.attributes['width'] = '400'
+        self.assertIs(index, circle.get_path_length_index())
+
+        # the geometry depends on the size of the SVG viewport
+        circle.attributes['r'] = '10%'
+        index = circle.get_path_length_index()
+        self.assertAlmostEqual(
+            2 * math.pi * 0.1 * math.sqrt((400 ** 2 + 200 ** 2) / 2),
+            circle.get_total_length())
+        root.attributes['height'] = '400'
+        self.assertIsNot(index, circle.get_path_length_index())
+        self.assertAlmostEqual(2 * math.pi * 40, circle.get_total_length())
+
     def test_circle_get_total_length00(self):
         # circle: initial value
         parser = SVGParser()
@@ -631,6 +701,77 @@ class BasicShapesTestCase(unittest.TestCase):
             " 600,100 655.228,100 700,144.772 700,200 Z"
         self.assertEqual(expected, exp)
 
+    def test_compute_ctms01(self):
+        doc = window.document
+        root = doc.create_element('svg')
+        doc.append_child(root)
+        root.attributes.update({
+            'width': '10cm',
+            'height': '4cm',
+            'viewBox': '0 0 400 400',
+        })
+        group = root.create_sub_element('g')
+        group.attributes.update({
+            'transform': 'translate(10 20) rotate(30)',
+        })
+        svg02 = group.create_sub_element('svg')
+        svg02.attributes.update({
+            'x': '1cm',
+            'y': '1cm',
+            'width': '200',
+            'height': '100',
+            'viewBox': '0 0 20 20',
+        })
+        rect = svg02.create_sub_element('rect')
+        rect.attributes.update({
+            'transform': 'scale(2)',
+        })
+        root.current_scale = 2
+        elements = [root, group, svg02, rect]
+        expected = [(element.get_ctm().tolist(),
+                     element.get_screen_ctm().tolist())
+                    for element in elements]
+        self.assertIsNone(doc.ctm_resolver)
+
+        doc.compute_ctms()
+        resolver = doc.ctm_resolver
+        self.assertIsNotNone(resolver)
+        for element, (ctm, screen_ctm) in zip(elements, expected):
+            self.assertEqual(ctm, resolver.get_ctm(element).tolist())
+            self.assertEqual(ctm, element.get_ctm().tolist())
+            self.assertEqual(screen_ctm,
+                             resolver.get_screen_ctm(element).tolist())
+            self.assertEqual(screen_ctm, element.get_screen_ctm().tolist())
+
+        # the results are copies of the resolved matrices
+        rect.get_ctm().translate_self(10, 10)
+        self.assertEqual(ctm, rect.get_ctm().tolist())
+
+        # changes of the ancestors are detected
+        group.set('transform', 'translate(10 20)')
+        self.assertIsNone(resolver.get_ctm(rect))
+        ctm = rect.get_ctm().tolist()
+        doc.compute_ctms(group)
+        self.assertEqual(ctm, resolver.get_ctm(rect).tolist())
+        svg02.set('viewBox', '0 0 10 10')
+        self.assertIsNone(resolver.get_ctm(rect))
+        doc.compute_ctms()
+        root.current_scale = 1
+        self.assertIsNotNone(resolver.get_ctm(rect))
+        self.assertIsNone(resolver.get_screen_ctm(rect))
+        rect.getparent().remove(rect)
+        self.assertIsNone(resolver.get_ctm(rect))
+
+        # invalid entries are discarded
+        self.assertNotIn(rect, resolver._entries)
+        group.remove(svg02)
+        doc.compute_ctms()
+        self.assertEqual({root, group}, set(resolver._entries))
+
+        # the resolver is discarded on navigation
+        window.location = 'about:blank'
+        self.assertIsNone(doc.ctm_resolver)
+
     def test_ellipse_get_bbox08(self):
         parser = SVGParser()
         ellipse = parser.create_element('ellipse')
@@ -2418,6 +2559,62 @@ class BasicShapesTestCase(unittest.TestCase):
         self.assertAlmostEqual(e, ctm.e, places=places)
         self.assertAlmostEqual(f, ctm.f, places=places)
 
+    def test_path_get_path_data_cache(self):
+        parser = SVGParser()
+        cache = SVGPathElement.path_data_cache
+        cache.clear()
+        d = 'M10,20 h30 q10,0 10,10 a5,5 0 1 0 10,0 z'
+        paths = list()
+        for _ in range(3):
+            path = parser.create_element('path')
+            path.attributes['d'] = d
+            paths.append(path)
+
+        path_data = paths[0].get_path_data()
+        self.assertEqual(1, cache.misses)
+        self.assertEqual(0, cache.hits)
+        self.assertEqual(d, PathParser.tostring(path_data))
+
+        # modifying the returned list does not affect the cache
+        path_data[0].set_moveto_abs(0, 0)
+        path_data.pop()
+        self.assertEqual(d, PathParser.tostring(paths[1].get_path_data()))
+        self.assertEqual(1, cache.misses)
+        self.assertEqual(1, cache.hits)
+
+        settings = SVGPathDataSettings()
+        settings.normalize = True
+        normalized = paths[2].get_path_data(settings)
+        self.assertEqual(2, cache.misses)
+        self.assertEqual(
+            PathParser.tostring(PathParser.normalize(PathParser.parse(d))),
+            PathParser.tostring(normalized))
+        paths[1].get_path_data(settings)
+        self.assertEqual(2, cache.hits)
+        self.assertEqual(2, len(cache))
+
+    def test_path_get_point_at_length(self):
+        parser = SVGParser()
+        path = parser.create_element('path')
+        path.attributes['d'] = 'M10,10 h100 v100'
+        self.assertAlmostEqual(200, path.get_total_length())
+        x, y = path.get_point_at_length(150)
+        self.assertAlmostEqual(110, x)
+        self.assertAlmostEqual(60, y)
+        self.assertAlmostEqual(90, path.get_tangent_at_length(150))
+        self.assertEqual(2, path.get_path_segment_at_length(150))
+
+        # 'd' changed
+        path.set('d', 'M10,10 v100 h100')
+        x, y = path.get_point_at_length(150)
+        self.assertAlmostEqual(60, x)
+        self.assertAlmostEqual(110, y)
+        self.assertAlmostEqual(0, path.get_tangent_at_length(150))
+
+        path.attributes.pop('d')
+        self.assertEqual(0, path.get_total_length())
+        self.assertEqual((0, 0), path.get_point_at_length(150))
+
     def test_path_get_total_length01(self):
         # See also: arcs02.html
         parser = SVGParser()
@@ -3447,6 +3644,51 @@ class BasicShapesTestCase(unittest.TestCase):
         self.assertAlmostEqual(e, screen_ctm.e, places=places)
         self.assertAlmostEqual(f, screen_ctm.f, places=places)
 
+    def test_transform_cache01(self):
+        doc = window.document
+        root = doc.create_element('svg')
+        doc.append_child(root)
+        rects = list()
+        for _ in range(3):
+            group = root.create_sub_element('g')
+            group.set('transform', 'translate(10,10)')
+            rect = group.create_sub_element('rect')
+            rect.attributes.update({
+                'width': '10',
+                'height': '10',
+                'transform': 'rotate(45)',
+            })
+            rects.append(rect)
+
+        cache = doc.transform_cache
+        cache.clear()
+        expected = rects[0].get_ctm()
+        for rect in rects:
+            self.assertEqual(expected, rect.get_ctm())
+        # one entry per distinct 'transform' attribute
+        self.assertEqual(2, len(cache))
+        self.assertEqual(2, cache.misses)
+        self.assertEqual(6, cache.hits)
+
+        # a new SVGTransformList object for each access
+        transform_list = rects[0].transform
+        self.assertEqual('rotate(45)', transform_list.tostring())
+        transform_list.append(SVGTransform(SVGTransform.SVG_TRANSFORM_SCALE,
+                                           2))
+        self.assertEqual('rotate(45)', rects[0].transform.tostring())
+        self.assertEqual(expected, rects[1].get_ctm())
+
+        rects[0].transform = transform_list
+        self.assertNotEqual(expected, rects[0].get_ctm())
+        self.assertEqual(3, len(cache))
+
+        # the elements without a document
+        parser = SVGParser()
+        rect = parser.create_element('rect')
+        rect.set('transform', 'rotate(45)')
+        self.assertEqual('rotate(45)', rect.transform.tostring())
+        self.assertEqual(3, len(cache))
+
     def test_viewport01_01(self):
         # See also: SVGPreserveAspectRatio.html
         # https://svgwg.org/svg2-draft/coords.html#ViewBoxAttribute
@@ -3782,5 +4024,64 @@ class BasicShapesTestCase(unittest.TestCase):
         self.assertEqual(200, vbh.value())
 
 
+    def test_viewport04(self):
+        # cached SVG viewports
+        doc = window.document
+        root = doc.create_element('svg')
+        doc.append_child(root)
+        root.attributes.update({
+            'width': '50%',
+            'height': '300',
+            'viewBox': '0 0 100 50',
+        })
+        svg02 = root.create_sub_element('svg')
+        svg02.attributes.update({
+            'x': '10%',
+            'y': '10',
+            'width': '50%',
+            'height': '5cm',
+            'viewBox': '0 0 10 10',
+        })
+        rect = svg02.create_sub_element('rect')
+        inner_width = window.inner_width
+        window.inner_width = 1000
+
+        vpx, vpy, vpw, vph = rect.get_viewport_size()
+        self.assertEqual(25, vpx.value())
+        self.assertEqual(10, vpy.value())
+        self.assertEqual(250, vpw.value())
+        self.assertEqual('5cm', vph.tostring())
+        matrix = rect.get_viewport_transformation_matrix()
+
+        # the results are copies of the cached values
+        vpw *= 2
+        vpx, vpy, vpw, vph = rect.get_viewport_size()
+        self.assertEqual(250, vpw.value())
+        matrix.translate_self(10, 10)
+        self.assertEqual(
+            svg02.get_viewport_transformation_matrix().tolist(),
+            rect.get_viewport_transformation_matrix().tolist())
+        self.assertNotEqual(matrix.tolist(),
+                            rect.get_viewport_transformation_matrix().tolist())
+
+        # attributes changed
+        svg02.set('width', '25%')
+        _, _, vpw, _ = rect.get_viewport_size()
+        self.assertEqual(125, vpw.value())
+        svg02.set('viewBox', '0 0 5 5')
+        self.assertNotEqual(
+            matrix.tolist(),
+            rect.get_viewport_transformation_matrix().tolist())
+
+        # initial viewport changed
+        window.inner_width = 2000
+        _, _, vpw, _ = root.get_viewport_size()
+        self.assertEqual(1000, vpw.value())
+        window.inner_width = 1000
+        _, _, vpw, _ = root.get_viewport_size()
+        self.assertEqual(500, vpw.value())
+        window.inner_width = inner_width
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -3073,6 +3073,90 @@ class CSSOMTestCase(unittest.TestCase):
         style.set_property('display', '')  # remove
         self.assertEqual(0, style.length)
 
+    def test_css_style_rule_matches(self):
+        stylesheet = '''
+        svg|rect.a, svg|circle { fill: red; }
+        :host(use) > symbol { display: inline; }
+        '''
+        rules = CSSParser.fromstring(stylesheet)
+        self.assertEqual(2, len(rules))
+
+        parser = SVGParser()
+        svg = '''
+        <svg xmlns="http://www.w3.org/2000/svg">
+          <rect class="a"/><rect class="b"/><circle/>
+        </svg>
+        '''
+        root = parser.fromstring(svg)
+        rect_a, rect_b, circle = root
+        namespaces = {'svg': 'http://www.w3.org/2000/svg'}
+
+        rule = rules[0]
+        self.assertTrue(rule.matches(rect_a, namespaces))
+        self.assertFalse(rule.matches(rect_b, namespaces))
+        self.assertTrue(rule.matches(circle, namespaces))
+        self.assertFalse(rule.matches(root, namespaces))
+
+        # compiled once per namespace map
+        matcher = rule.get_matcher(namespaces)
+        self.assertIsNotNone(matcher)
+        self.assertIs(matcher, rule.get_matcher(dict(namespaces)))
+        self.assertIsNot(matcher, rule.get_matcher())
+
+        # whole-tree selector
+        self.assertEqual([rect_a, circle], rule.select(root, namespaces))
+        self.assertIsNot(matcher, rule.get_selector(namespaces))
+        self.assertIs(rule.get_selector(namespaces),
+                      rule.get_selector(namespaces))
+
+        # unsupported selector
+        rule = rules[1]
+        self.assertIsNone(rule.get_matcher(namespaces))
+        self.assertFalse(rule.matches(root, namespaces))
+        self.assertEqual([], rule.select(root, namespaces))
+
+    def test_css_style_rule_matches_combinators(self):
+        stylesheet = '''
+        svg|g svg|rect { fill: red; }
+        svg|g > svg|rect { fill: green; }
+        svg|rect + svg|circle { fill: blue; }
+        svg|rect.a ~ svg|circle { fill: yellow; }
+        svg|svg > svg|g > svg|circle:first-child { fill: gray; }
+        '''
+        rules = CSSParser.fromstring(stylesheet)
+        self.assertEqual(5, len(rules))
+
+        parser = SVGParser()
+        svg = '''
+        <svg xmlns="http://www.w3.org/2000/svg">
+          <g><a><rect/></a><rect class="a"/><circle/></g>
+          <rect/><text/><circle/>
+        </svg>
+        '''
+        root = parser.fromstring(svg)
+        g, rect_c, text, circle_c = root
+        a, rect_b, circle_a = g
+        rect_a = a[0]
+        namespaces = {'svg': 'http://www.w3.org/2000/svg'}
+        elements = [root, g, a, rect_a, rect_b, circle_a, rect_c, text,
+                    circle_c]
+
+        expected = [
+            [rect_a, rect_b],  # descendant
+            [rect_b],  # child
+            [circle_a],  # next-sibling
+            [circle_a],  # subsequent-sibling
+            [],  # not the first child
+        ]
+        for rule, matched in zip(rules, expected):
+            self.assertEqual(
+                matched,
+                [element for element in elements
+                 if rule.matches(element, namespaces)],
+                msg=rule.selector_text)
+            self.assertEqual(matched, rule.select(root, namespaces),
+                             msg=rule.selector_text)
+
     def test_link_style_sheet_link(self):
         # HTMLLinkElement#sheet
         doc = window.document
@@ -5,7 +5,7 @@ import unittest
 
 sys.path.extend(['.', '..'])
 
-from svgpy import Font, SVGLength, SVGParser, formatter
+from svgpy import Font, LengthResolver, SVGLength, SVGParser, formatter
 
 places = 0
 delta = 1
@@ -607,6 +607,80 @@ class LengthTestCase(unittest.TestCase):
         self.assertIsNone(a.unit)
         self.assertEqual('0', a.tostring())
 
+    def test_length_resolver01(self):
+        parser = SVGParser()
+        root = parser.fromstring(
+            '<svg xmlns="http://www.w3.org/2000/svg" font-size="20"'
+            ' width="600" height="400">'
+            '<g font-size="10"><rect/></g></svg>')
+        rect = root[0][0]
+        resolver = LengthResolver(rect)
+        self.assertIs(rect, resolver.context)
+        self.assertEqual(10, resolver.font_size)
+        self.assertEqual(20, resolver.root_font_size)
+        self.assertEqual((600, 400), resolver.viewport_size)
+
+        for text, direction in [('2em', None),
+                                ('2rem', None),
+                                ('50%', SVGLength.DIRECTION_HORIZONTAL),
+                                ('50%', SVGLength.DIRECTION_VERTICAL),
+                                ('50%', SVGLength.DIRECTION_UNSPECIFIED),
+                                ('10vmax', None),
+                                ('1in', None)]:
+            expected = SVGLength(text, context=rect,
+                                 direction=direction).value()
+            self.assertEqual(expected,
+                             resolver.value(text, direction=direction),
+                             msg=(text, direction))
+        self.assertEqual(2, resolver.value('20px', unit='em'))
+        self.assertIs(resolver, resolver.with_context(rect))
+        self.assertIs(root, resolver.with_context(root).context)
+
+        resolver = LengthResolver()
+        self.assertEqual(Font.default_font_size, resolver.font_size)
+        self.assertEqual((100, 100), resolver.viewport_size)
+        self.assertEqual(
+            50,
+            resolver.value('50%', direction=SVGLength.DIRECTION_HORIZONTAL))
+
+    def test_init_shared(self):
+        parser = SVGParser()
+        root = parser.fromstring(
+            '<svg xmlns="http://www.w3.org/2000/svg" font-size="20">'
+            '<rect/></svg>')
+        rect = root[0]
+        a = SVGLength('2em', context=rect)
+        self.assertRaises(AttributeError, lambda: setattr(a, 'foo', 1))
+        self.assertEqual(40, a.value())
+
+        # the results share the context element
+        for b in [a + SVGLength('1mm'), a - SVGLength('1mm'), a * 2, a / 2,
+                  -a, abs(a), +a, a ** 2]:
+            self.assertIs(rect, b.context)
+            self.assertEqual('em', b.unit)
+        self.assertEqual(80, (a * 2).value())
+
+        # parsed values are cached by the text
+        self.assertEqual((2.0, 'em'), SVGLength.parse('2em'))
+        self.assertIn('2em', SVGLength._parse_cache)
+        self.assertEqual((1.5, 'mm'), SVGLength.parse('1.5MM'))
+        self.assertEqual('1.5mm', str(SVGLength('1.5MM')))
+        self.assertEqual('100', str(SVGLength('1e2')))
+        self.assertEqual('0.00001', str(SVGLength('0.00001')))
+        self.assertEqual('-0.0000001px', str(SVGLength('-1e-7px')))
+        self.assertEqual('44.5mm',
+                         str(SVGLength('12mm') - SVGLength('-3.25cm')))
+        self.assertEqual('0vw', str(SVGLength('7vw') - SVGLength('7vh')))
+        self.assertEqual('0pc', str(-SVGLength('0pc')))
+
+        # short decimal values add up exactly
+        a = SVGLength('0.1')
+        for _ in range(9):
+            a += SVGLength('0.1')
+        self.assertEqual(1, a.value())
+        self.assertEqual(0.3, (SVGLength('0.1') + SVGLength('0.2')).value())
+        self.assertEqual(0.1, (SVGLength('0.3') - SVGLength('0.2')).value())
+
     def test_isub(self):
         a = SVGLength('0.1mm')
         a -= SVGLength('0.1mm')
@@ -722,6 +796,10 @@ class LengthTestCase(unittest.TestCase):
         b = a ** 2
         self.assertEqual(SVGLength('6.25px'), b)
 
+        a = SVGLength('3')
+        self.assertEqual(SVGLength('4'), pow(a, 2, 5))
+        self.assertRaises(ValueError, lambda: pow(SVGLength('3.5'), 2, 5))
+
     def test_precision(self):
         a = SVGLength('1cm')  # 37.79527559055118
         self.assertEqual('37.795', a.tostring(SVGLength.TYPE_NUMBER))
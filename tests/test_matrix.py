@@ -813,6 +813,57 @@ class MatrixTestCase(unittest.TestCase):
             'matrix(1.5, 0, 0, 1.5, 200, 40)',
             m.tostring())
 
+    def test_multiply04(self):
+        # 2d matrix vs. 3d matrix
+        m = DOMMatrix()
+        m3d = DOMMatrix()
+        m3d.m34 = 0.5
+        src = m3d.matrix.copy()
+        for matrix in (m, m3d):
+            matrix.translate_self(100, 100)
+            matrix.rotate_self(0, 0, 25)
+            matrix.scale_self(2, 1.5, 1, 10, 20)
+            matrix.skew_x_self(25)
+            matrix.skew_y_self(-10)
+            matrix *= DOMMatrix([1, 2, 3, 4, 5, 6])
+            matrix.invert_self()
+        self.assertTrue(m.is2d)
+        self.assertFalse(m3d.is2d)
+        expected = np.dot(m3d.matrix, src)
+        self.assertTrue(np.allclose(expected, m.matrix))
+
+        x, y = m.transform_point(10, 20)
+        expected = np.dot(m.matrix, [10, 20, 0, 1])
+        self.assertAlmostEqual(expected[0], x, places=places)
+        self.assertAlmostEqual(expected[1], y, places=places)
+        self.assertEqual(4, len(m.transform_point(10, 20, 30)))
+
+        m = DOMMatrix([1, 0, 0, 0, 0, 0])
+        self.assertRaises(np.linalg.LinAlgError, lambda: m.invert_self())
+
+    def test_promote_3d(self):
+        m = DOMMatrix([1, 2, 3, 4, 5, 6])
+        m.m33 = 1
+        self.assertTrue(m.is2d)
+        m.m33 = 2
+        self.assertFalse(m.is2d)
+        self.assertEqual(
+            'matrix3d(1, 2, 0, 0, 3, 4, 0, 0, 0, 0, 2, 0, 5, 6, 0, 1)',
+            m.tostring())
+
+        m = DOMMatrix([1, 2, 3, 4, 5, 6])
+        m.translate_self(0, 0, 10)
+        self.assertEqual(
+            'matrix3d(1, 2, 0, 0, 3, 4, 0, 0, 0, 0, 1, 0, 5, 6, 10, 1)',
+            m.tostring())
+
+        m = DOMMatrix([1, 2, 3, 4, 5, 6])
+        m *= DOMMatrix(m43=10, is2d=False)
+        self.assertEqual(
+            'matrix3d(1, 2, 0, 0, 3, 4, 0, 0, 0, 0, 1, 0, 5, 6, 10, 1)',
+            m.tostring())
+        self.assertRaises(AttributeError, setattr, m, 'foo', 1)
+
     def test_property_2d(self):
         a = 11
         b = 12
@@ -572,6 +572,32 @@ class MediaQueryTestCase(unittest.TestCase):
         mql = window.match_media(query)
         self.assertTrue(mql.matches)
 
+    def test_match_media_cache01(self):
+        query = '(orientation: landscape)'
+        mql = window.match_media(query)
+        self.assertTrue(mql.matches)
+        mql2 = window.match_media(query)
+        self.assertIs(mql._tree, mql2._tree)  # parsed once
+        conditions, results = window._get_media_conditions(None)
+        self.assertEqual('1280px', conditions['width'])
+        self.assertEqual({query: True}, results)
+        self.assertTrue(mql2.matches)
+
+        # results are recomputed when the screen changes
+        window.screen.orientation.angle = 90
+        self.assertTrue(not mql.matches)
+        window.screen.orientation.angle = 0
+        self.assertTrue(mql.matches)
+
+        # or when the viewport changes
+        query = '(min-width: 1000px)'
+        mql = window.match_media(query)
+        self.assertTrue(mql.matches)
+        window.inner_width = 999
+        self.assertTrue(not mql.matches)
+        window.inner_width = 1000
+        self.assertTrue(mql.matches)
+
 
 if __name__ == '__main__':
     unittest.main()
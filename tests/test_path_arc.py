@@ -594,6 +594,24 @@ class PathArcTestCase(unittest.TestCase):
         expected = 775.18701171875
         self.assertAlmostEqual(expected, n, places=places)
 
+    def test_path_arc_flags(self):
+        # flags without separators
+        d = 'M0,0 a10,10 0 0010,10 a10 10 0 1 1-10-10 A1,1,0,1,0,5,5'
+        path_data = PathParser.parse(d)
+        self.assertEqual(4, len(path_data))
+        self.assertEqual((10, 10, 0, 0, 0, 10, 10), path_data[1].values)
+        self.assertEqual((10, 10, 0, 1, 1, -10, -10), path_data[2].values)
+        self.assertEqual((1, 1, 0, 1, 0, 5, 5), path_data[3].values)
+
+    def test_path_arc_flags_invalid(self):
+        # the flag must be "0" or "1"
+        d = 'M0,0 a10,10 0 2,0 10,10 L20,20'
+        path_data = PathParser.parse(d)
+        self.assertEqual('M0,0 L20,20', PathParser.tostring(path_data))
+
+        path_data = PathParser.parse(d, strict=True)
+        self.assertEqual('M0,0', PathParser.tostring(path_data))
+
     def test_path_normalize01(self):
         # cx=0 cy=0 r=100
         # large_arc_flag=0, sweep_flag=0
@@ -763,6 +781,65 @@ class PathArcTestCase(unittest.TestCase):
                    " A7,7 0 1 0 -15.556,22.627 Z"
         self.assertEqual(expected, exp)
 
+    def test_path_transform04(self):
+        # non-uniform scaling
+        d = 'M10,0 A10,10 0 0 1 0,10 A10,10 0 0 1 -10,0' \
+            ' a10,10 0 0 1 10,-10 a10,10 0 0 1 10,10 z'
+        path_data = PathParser.parse(d)
+        matrix = DOMMatrix()
+        matrix.scale_self(2, 1)
+        transformed = PathParser.transform(path_data, matrix)
+        exp = PathParser.tostring(transformed)
+        expected = "M20,0 A20,10 0 0 1 0,10 20,10 0 0 1 -20,0" \
+                   " 20,10 0 0 1 0,-10 20,10 0 0 1 20,0 Z"
+        self.assertEqual(expected, exp)
+
+        normalized = PathParser.normalize(transformed)
+        bbox = PathParser.get_bbox(normalized)
+        self.assertAlmostEqual(-20, bbox.x)
+        self.assertAlmostEqual(-10, bbox.y)
+        self.assertAlmostEqual(40, bbox.width)
+        self.assertAlmostEqual(20, bbox.height)
+
+    def test_path_transform05(self):
+        # reflection reverses the sweep flag
+        d = 'M10,0 A10,10 0 0 1 0,10'
+        path_data = PathParser.parse(d)
+        matrix = DOMMatrix()
+        matrix.scale_self(1, -1)
+        transformed = PathParser.transform(path_data, matrix)
+        exp = PathParser.tostring(transformed)
+        expected = "M10,0 A10,10 0 0 0 0,-10"
+        self.assertEqual(expected, exp)
+
+    def test_path_transform06(self):
+        # rotation and non-uniform scaling of an ellipse
+        d = 'M0,0 A20,10 30 0 1 40,0'
+        path_data = PathParser.parse(d)
+        matrix = DOMMatrix()
+        matrix.rotate_self(rot_z=45)
+        transformed = PathParser.transform(path_data, matrix)
+        exp = PathParser.tostring(transformed)
+        expected = "M0,0 A20,10 75 0 1 28.284,28.284"
+        self.assertEqual(expected, exp)
+
+        matrix = DOMMatrix()
+        matrix.scale_self(2, 0.5)
+        transformed = PathParser.transform(path_data, matrix)
+        rx, ry, x_axis_rotation, fa, fs, x, y = transformed[1].values
+        # points on the ellipse: (rx*cos(t), ry*sin(t)) rotated by 30 degrees
+        for t in range(0, 360, 30):
+            t = math.radians(t)
+            r = math.radians(30)
+            px = 20 * math.cos(t) * math.cos(r) - 10 * math.sin(t) * math.sin(r)
+            py = 20 * math.cos(t) * math.sin(r) + 10 * math.sin(t) * math.cos(r)
+            px, py = 2 * px, 0.5 * py
+            r = math.radians(x_axis_rotation)
+            u = px * math.cos(r) + py * math.sin(r)
+            v = -px * math.sin(r) + py * math.cos(r)
+            self.assertAlmostEqual(1, (u / rx) ** 2 + (v / ry) ** 2)
+        self.assertEqual((0, 1, 80, 0), (fa, fs, x, y))
+
     def test_segment_arcto_abs(self):
         segment = SVGPathSegment('A')
         self.assertTrue(not segment.isvalid())
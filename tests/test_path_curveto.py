@@ -3,15 +3,25 @@
 import sys
 import unittest
 
+import numpy as np
+
 sys.path.extend(['.', '..'])
 
 from svgpy import DOMMatrix, PathParser, SVGPathSegment, formatter
-from svgpy.path import PathSegment
+from svgpy.path import CubicBezierCurve, PathSegment
 
 places = 0
 delta = 1
 
 
+def curves_length(p, n=100000):
+    # reference length of the polyline through n + 1 points on the curve
+    t = np.linspace(0, 1, n + 1)[:, np.newaxis]
+    points = ((1 - t) ** 3 * p[0] + 3 * (1 - t) ** 2 * t * p[1]
+              + 3 * (1 - t) * t ** 2 * p[2] + t ** 3 * p[3])
+    return np.hypot(*np.diff(points, axis=0).T).sum()
+
+
 # Test with: Chrome 64.0 (Linux 64-bit)
 class PathCurvetoTestCase(unittest.TestCase):
     def setUp(self):
@@ -712,6 +722,115 @@ class PathCurvetoTestCase(unittest.TestCase):
                    " 1133.333,133.333 1266.667,133.333 1400,300"
         self.assertEqual(expected, d)
 
+    def test_cubic_bezier_extrema(self):
+        curves = np.array([[[100, 200], [100, 100], [250, 100], [250, 200]],
+                           [[250, 200], [250, 300], [400, 300], [400, 200]],
+                           [[0, 0], [10, 0], [20, 0], [30, 0]]])
+        points = CubicBezierCurve.get_extrema(curves)
+        self.assertEqual((12, 2), points.shape)
+        for index, p in enumerate(curves):
+            curve = CubicBezierCurve(*p)
+            bbox = curve.get_bbox()
+            extrema = points[index * 4:index * 4 + 4]
+            xs = [p[0][0], p[3][0]] + extrema[:, 0].tolist()
+            ys = [p[0][1], p[3][1]] + extrema[:, 1].tolist()
+            self.assertAlmostEqual(bbox.x, min(xs))
+            self.assertAlmostEqual(bbox.y, min(ys))
+            self.assertAlmostEqual(bbox.right, max(xs))
+            self.assertAlmostEqual(bbox.bottom, max(ys))
+
+    def test_cubic_bezier_bbox_batch(self):
+        d = 'M10,10 c20,-30 40,30 60,0 s40,-30 60,0 q20,40 40,0 t40,0' \
+            ' C200,40 150,-20 130,10 Z m-20,-20 c5,5 -5,5 0,0'
+        path_data = PathParser.parse(d)
+        normalized = PathParser.normalize(path_data)
+        bbox = PathParser.get_bbox(normalized)
+
+        expected = None
+        cpx, cpy = None, None
+        for path_segment in normalized:
+            if path_segment.type == 'C':
+                p = np.array([cpx, cpy] + list(path_segment.values))
+                rect = CubicBezierCurve(*p.reshape(4, 2)).get_bbox()
+                if expected is None:
+                    expected = rect
+                else:
+                    x1 = min(expected.x, rect.x)
+                    y1 = min(expected.y, rect.y)
+                    x2 = max(expected.right, rect.right)
+                    y2 = max(expected.bottom, rect.bottom)
+                    expected.set_coords(x1, y1, x2, y2)
+            if path_segment.type in 'CLM':
+                cpx, cpy = path_segment.end
+        self.assertAlmostEqual(expected.x, bbox.x)
+        self.assertAlmostEqual(expected.y, bbox.y)
+        self.assertAlmostEqual(expected.width, bbox.width)
+        self.assertAlmostEqual(expected.height, bbox.height)
+
+    def test_cubic_bezier_lengths(self):
+        curves = np.array([[[0, 0], [10, 0], [20, 0], [30, 0]],
+                           [[0, 0], [0, 0], [30, 40], [30, 40]],
+                           [[100, 200], [100, 100], [250, 100], [250, 200]],
+                           [[0, 0], [100, 100], [0, 100], [100, 0]],
+                           [[5, 5], [5, 5], [5, 5], [5, 5]]])
+        lengths, errors = CubicBezierCurve.get_lengths(curves)
+        self.assertEqual((5,), lengths.shape)
+        self.assertEqual((5,), errors.shape)
+        self.assertAlmostEqual(30, lengths[0])
+        self.assertAlmostEqual(50, lengths[1])
+        self.assertAlmostEqual(curves_length(curves[2]), lengths[2],
+                               places=6)
+        self.assertAlmostEqual(0, lengths[4])
+        self.assertTrue(np.all(errors <= CubicBezierCurve.length_tol))
+
+        for index, p in enumerate(curves):
+            curve = CubicBezierCurve(*p)
+            self.assertAlmostEqual(lengths[index], curve.get_length())
+
+        # cusp
+        lengths, errors = CubicBezierCurve.get_lengths(curves[3:4],
+                                                       tolerance=1e-3)
+        self.assertAlmostEqual(lengths[0], curves_length(curves[3]),
+                               places=3)
+        self.assertTrue(errors[0] <= 1e-3)
+
+        lengths, errors = CubicBezierCurve.get_lengths(np.empty((0, 4, 2)))
+        self.assertEqual(0, len(lengths))
+        self.assertEqual(0, len(errors))
+
+    def test_cubic_bezier_total_length(self):
+        d = 'M10,10 c20,-30 40,30 60,0 s40,-30 60,0 q20,40 40,0 t40,0' \
+            ' C200,40 150,-20 130,10 Z m-20,-20 c5,5 -5,5 0,0'
+        path_data = PathParser.parse(d)
+        normalized = PathParser.normalize(path_data)
+        expected = 0
+        start_x, start_y = None, None
+        cpx, cpy = None, None
+        for path_segment in normalized:
+            if path_segment.type == 'C':
+                p = np.array([cpx, cpy] + list(path_segment.values))
+                expected += curves_length(p.reshape(4, 2))
+            elif path_segment.type == 'L':
+                x, y = path_segment.end
+                expected += np.hypot(x - cpx, y - cpy)
+            elif path_segment.type == 'Z':
+                expected += np.hypot(start_x - cpx, start_y - cpy)
+                cpx, cpy = start_x, start_y
+            if path_segment.type == 'M':
+                start_x, start_y = path_segment.end
+            if path_segment.type in 'CLM':
+                cpx, cpy = path_segment.end
+        self.assertAlmostEqual(expected,
+                               PathParser.get_total_length(path_data),
+                               places=6)
+        self.assertAlmostEqual(expected,
+                               PathParser.get_total_length(normalized),
+                               places=6)
+        self.assertAlmostEqual(expected,
+                               PathParser.get_total_length(path_data,
+                                                           tolerance=1e-6),
+                               places=4)
+
     def test_quad02_path01_transform(self):
         # See also: quad01.html
         d = 'M200,300 Q400,50 600,300 T1000,300 1400,300'
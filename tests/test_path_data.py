@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.extend(['.', '..'])
+
+from svgpy import DOMMatrix, PathData, PathParser, SVGPathSegment, formatter
+
+
+class PathDataTestCase(unittest.TestCase):
+    def setUp(self):
+        formatter.precision = 3
+
+    def test_path_data_add(self):
+        a = PathParser.parse('M10,20 L30,40', compact=True)
+        b = PathParser.parse('l5,5 z', compact=True)
+        path_data = a + b
+        self.assertIsInstance(path_data, PathData)
+        self.assertEqual(4, len(path_data))
+        self.assertEqual('M10,20 L30,40 l5,5 z', path_data.tostring())
+
+        path_data = a + [SVGPathSegment('Z')]
+        self.assertEqual('M10,20 L30,40 Z', path_data.tostring())
+
+        path_data = list()
+        path_data += a
+        self.assertEqual(2, len(path_data))
+        self.assertIsInstance(path_data[0], SVGPathSegment)
+
+    def test_path_data_arrays(self):
+        d = 'M10,20 H30 a5,5 0 1,0 10,0 Z'
+        path_data = PathParser.parse(d, compact=True)
+        self.assertEqual(b'MHaZ', path_data.commands.tobytes())
+        self.assertEqual(np.float64, path_data.values.dtype)
+        self.assertEqual([10, 20, 30, 5, 5, 0, 1, 0, 10, 0],
+                         path_data.values.tolist())
+        self.assertEqual([0, 2, 3, 10, 10], path_data.offsets.tolist())
+        self.assertTrue(path_data.nbytes > 0)
+
+    def test_path_data_empty(self):
+        path_data = PathData()
+        self.assertEqual(0, len(path_data))
+        self.assertEqual([], list(path_data))
+        self.assertEqual('', PathParser.tostring(path_data))
+
+        path_data = PathParser.parse(None, compact=True)
+        self.assertIsInstance(path_data, PathData)
+        self.assertEqual(0, len(path_data))
+
+    def test_path_data_eq(self):
+        d = 'M10,20 L30,40 a5,5 0 1,0 10,0 z'
+        path_data = PathParser.parse(d)
+        compact = PathParser.parse(d, compact=True)
+        self.assertEqual(path_data, compact)
+        self.assertEqual(compact, path_data)
+        self.assertEqual(compact, PathData.from_segments(path_data))
+        self.assertNotEqual(compact, path_data[:-1])
+
+    def test_path_data_getitem(self):
+        d = 'M10,20 L30,40 a5,5 0 1,0 10,0 z'
+        path_data = PathParser.parse(d, compact=True)
+        self.assertEqual(4, len(path_data))
+        segment = path_data[0]
+        self.assertIsInstance(segment, SVGPathSegment)
+        self.assertEqual('M', segment.type)
+        self.assertEqual((10, 20), segment.values)
+
+        segment = path_data[-2]
+        self.assertEqual('a', segment.type)
+        self.assertEqual((5, 5, 0, 1, 0, 10, 0), segment.values)
+        self.assertIsInstance(segment.values[3], int)
+
+        segment = path_data[3]
+        self.assertEqual('z', segment.type)
+        self.assertEqual((), segment.values)
+
+        self.assertRaises(IndexError, lambda: path_data[4])
+        self.assertRaises(IndexError, lambda: path_data[-5])
+
+        sliced = path_data[1:3]
+        self.assertIsInstance(sliced, PathData)
+        self.assertEqual('L30,40 a5,5 0 1 0 10,0', sliced.tostring())
+
+        sliced = path_data[::2]
+        self.assertEqual('M10,20 a5,5 0 1 0 10,0', sliced.tostring())
+
+        sliced = path_data[3:1]
+        self.assertEqual(0, len(sliced))
+
+    def test_path_data_invalid(self):
+        self.assertRaises(ValueError, lambda: PathData('M', [1]))
+        self.assertRaises(ValueError, lambda: PathData('X', [1, 2]))
+        self.assertRaises(ValueError,
+                          lambda: PathData.from_segments(
+                              [SVGPathSegment('L', 1)]))
+        self.assertRaises(TypeError,
+                          lambda: PathData.from_segments([('M', 1, 2)]))
+
+        # skip invalid segments
+        path_data = PathData.from_segments([SVGPathSegment('M', 1, 2),
+                                            SVGPathSegment('L'),
+                                            SVGPathSegment()])
+        self.assertEqual(1, len(path_data))
+
+    def test_path_data_normalize(self):
+        d = 'M10,20 h30 q10,0 10,10 t10,10 a5,5 0 1,0 10,0 z'
+        path_data = PathParser.parse(d)
+        expected = PathParser.normalize(path_data)
+        compact = PathParser.parse(d, compact=True)
+        normalized = PathParser.normalize(compact)
+        self.assertIsInstance(normalized, PathData)
+        self.assertEqual(expected, normalized)
+        self.assertEqual(PathParser.tostring(expected),
+                         PathParser.tostring(normalized))
+
+        bbox = PathParser.get_bbox(normalized)
+        expected_bbox = PathParser.get_bbox(expected)
+        self.assertEqual(expected_bbox, bbox)
+
+        self.assertAlmostEqual(PathParser.get_total_length(path_data),
+                               PathParser.get_total_length(compact))
+
+    def test_path_data_transform(self):
+        d = 'M10,20 h30 v10 l-5,5 z'
+        path_data = PathParser.parse(d)
+        compact = PathParser.parse(d, compact=True)
+        matrix = DOMMatrix().translate(10, 10).scale(2)
+        expected = PathParser.transform(path_data, matrix)
+        transformed = PathParser.transform(compact, matrix)
+        self.assertIsInstance(transformed, PathData)
+        self.assertEqual(PathParser.tostring(expected),
+                         PathParser.tostring(transformed))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.extend(['.', '..'])
+
+from svgpy import PathLengthIndex, PathParser
+
+
+def get_distances(points, vertices):
+    # distances from the points to the polyline
+    a = vertices[:-1]
+    ab = vertices[1:] - a
+    ap = points[:, np.newaxis] - a
+    squared = np.maximum((ab ** 2).sum(axis=1), 1e-300)
+    t = np.clip((ap * ab).sum(axis=2) / squared, 0, 1)
+    nearest = a + t[:, :, np.newaxis] * ab
+    return np.hypot(*(nearest - points[:, np.newaxis]).T).min(axis=0)
+
+
+class PathFlattenTestCase(unittest.TestCase):
+    def test_flatten_arc(self):
+        d = 'M150,100 A50,50 0 0 1 100,150 50,50 0 0 1 50,100' \
+            ' 50,50 0 0 1 100,50 50,50 0 0 1 150,100 Z'
+        vertices, offsets = PathParser.flatten(PathParser.parse(d),
+                                               tolerance=0.01)
+        self.assertEqual([0, len(vertices)], offsets.tolist())
+        radii = np.hypot(vertices[:, 0] - 100, vertices[:, 1] - 100)
+        self.assertTrue(np.allclose(radii, 50))
+
+        # the sagitta of each chord
+        chords = np.hypot(*np.diff(vertices, axis=0).T)
+        sagittas = 50 - np.sqrt(50 ** 2 - (chords / 2) ** 2)
+        self.assertTrue(np.all(sagittas <= 0.01))
+        self.assertTrue(np.any(sagittas > 0.0025))
+
+    def test_flatten_curves(self):
+        d = 'M10,10 c20,-30 40,30 60,0 s40,-30 60,0 q20,40 40,0 t40,0' \
+            ' A50,30 30 0 1 200,100 Z'
+        path_data = PathParser.parse(d)
+        for tolerance in (1, 0.1, 0.01):
+            vertices, offsets = PathParser.flatten(path_data, tolerance)
+            self.assertEqual((len(vertices), 2), vertices.shape)
+            self.assertEqual([0, len(vertices)], offsets.tolist())
+            self.assertEqual([10, 10], vertices[0].tolist())
+            self.assertEqual([10, 10], vertices[-1].tolist())
+
+            index = PathLengthIndex(path_data)
+            points = index.get_points_at_lengths(
+                np.linspace(0, index.total_length, 2001))
+            distances = get_distances(points, vertices)
+            self.assertTrue(distances.max() <= tolerance,
+                            msg=(tolerance, distances.max()))
+
+        # more vertices for the smaller tolerance
+        coarse, _ = PathParser.flatten(path_data, 1)
+        fine, _ = PathParser.flatten(path_data, 0.01)
+        self.assertTrue(len(coarse) < len(fine))
+
+    def test_flatten_empty(self):
+        vertices, offsets = PathParser.flatten([])
+        self.assertEqual((0, 2), vertices.shape)
+        self.assertEqual([0], offsets.tolist())
+
+        vertices, offsets = PathParser.flatten(PathParser.parse('M5,6'))
+        self.assertEqual([[5, 6]], vertices.tolist())
+        self.assertEqual([0, 1], offsets.tolist())
+
+    def test_flatten_lines(self):
+        d = 'M10,10 h100 v100 z m-20,-20 h30 v30 z l5,5 M0,0 0,100'
+        path_data = PathParser.parse(d, compact=True)
+        vertices, offsets = PathParser.flatten(path_data)
+        self.assertEqual([0, 4, 8, 10, 12], offsets.tolist())
+        expected = [[10, 10], [110, 10], [110, 110], [10, 10],
+                    [-10, -10], [20, -10], [20, 20], [-10, -10],
+                    [-10, -10], [-5, -5],
+                    [0, 0], [0, 100]]
+        self.assertEqual(expected, vertices.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
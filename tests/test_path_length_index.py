@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+import math
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.extend(['.', '..'])
+
+from svgpy import PathLengthIndex, PathParser
+
+
+class PathLengthIndexTestCase(unittest.TestCase):
+    def test_arc(self):
+        # circle
+        d = 'M150,100 A50,50 0 0 1 100,150 50,50 0 0 1 50,100' \
+            ' 50,50 0 0 1 100,50 50,50 0 0 1 150,100 Z'
+        index = PathLengthIndex(PathParser.parse(d))
+        self.assertAlmostEqual(2 * math.pi * 50, index.total_length)
+
+        x, y = index.get_point_at_length(math.pi * 25)
+        self.assertAlmostEqual(100, x)
+        self.assertAlmostEqual(150, y)
+        self.assertAlmostEqual(180,
+                               abs(index.get_tangent_at_length(math.pi * 25)))
+
+        # points on the circle
+        distances = np.linspace(0, index.total_length, 101)
+        points = index.get_points_at_lengths(distances)
+        radii = np.hypot(points[:, 0] - 100, points[:, 1] - 100)
+        self.assertTrue(np.allclose(radii, 50))
+        angles = np.arctan2(points[:, 1] - 100, points[:, 0] - 100)
+        expected = distances / 50
+        self.assertTrue(np.allclose(np.cos(angles), np.cos(expected)))
+        self.assertTrue(np.allclose(np.sin(angles), np.sin(expected)))
+
+        # ellipse: rx > ry
+        d = 'M250,0 A250,100 0 0 1 0,100 250,100 0 0 1 -250,0' \
+            ' 250,100 0 0 1 0,-100 250,100 0 0 1 250,0 Z'
+        index = PathLengthIndex(PathParser.parse(d))
+        expected = PathParser.get_total_length(PathParser.parse(d))
+        self.assertAlmostEqual(expected, index.total_length)
+        x, y = index.get_point_at_length(index.total_length / 2)
+        self.assertAlmostEqual(-250, x)
+        self.assertAlmostEqual(0, y)
+
+    def test_arc_as_line(self):
+        d = 'M10,10 A0,0 0 0 1 40,50'
+        index = PathLengthIndex(PathParser.parse(d))
+        self.assertAlmostEqual(50, index.total_length)
+        x, y = index.get_point_at_length(25)
+        self.assertAlmostEqual(25, x)
+        self.assertAlmostEqual(30, y)
+
+    def test_clamp(self):
+        d = 'M10,20 H110'
+        index = PathLengthIndex(PathParser.parse(d))
+        self.assertEqual((10, 20), index.get_point_at_length(-10))
+        self.assertEqual((110, 20), index.get_point_at_length(1000))
+
+    def test_curve(self):
+        # symmetric cubic bezier curve
+        d = 'M0,0 C0,100 100,100 100,0'
+        path_data = PathParser.parse(d)
+        index = PathLengthIndex(path_data)
+        self.assertAlmostEqual(PathParser.get_total_length(path_data),
+                               index.total_length)
+        x, y = index.get_point_at_length(index.total_length / 2)
+        self.assertAlmostEqual(50, x)
+        self.assertAlmostEqual(75, y)
+        self.assertAlmostEqual(0, index.get_tangent_at_length(
+            index.total_length / 2))
+        self.assertAlmostEqual(90, index.get_tangent_at_length(0))
+        self.assertAlmostEqual(-90, index.get_tangent_at_length(
+            index.total_length))
+
+        # the points along the curve
+        t = np.linspace(0, 1, 100001)[:, np.newaxis]
+        p = np.array([[0, 0], [0, 100], [100, 100], [100, 0]])
+        samples = ((1 - t) ** 3 * p[0] + 3 * (1 - t) ** 2 * t * p[1]
+                   + 3 * (1 - t) * t ** 2 * p[2] + t ** 3 * p[3])
+        lengths = np.concatenate(
+            ([0], np.cumsum(np.hypot(*np.diff(samples, axis=0).T))))
+        distances = np.linspace(0, index.total_length, 11)
+        points = index.get_points_at_lengths(distances)
+        expected_x = np.interp(distances, lengths, samples[:, 0])
+        expected_y = np.interp(distances, lengths, samples[:, 1])
+        self.assertTrue(np.allclose(expected_x, points[:, 0], atol=1e-4))
+        self.assertTrue(np.allclose(expected_y, points[:, 1], atol=1e-4))
+
+        # coincident control point
+        d = 'M0,0 C0,0 100,0 100,100'
+        index = PathLengthIndex(PathParser.parse(d))
+        self.assertAlmostEqual(0, index.get_tangent_at_length(0))
+
+    def test_empty(self):
+        index = PathLengthIndex([])
+        self.assertEqual(0, index.total_length)
+        self.assertEqual((0, 0), index.get_point_at_length(10))
+        self.assertEqual(0, index.get_tangent_at_length(10))
+        self.assertEqual(0, index.get_segment_at_length(10))
+
+        index = PathLengthIndex(PathParser.parse('M5,6'))
+        self.assertEqual(0, index.total_length)
+        self.assertEqual((5, 6), index.get_point_at_length(10))
+
+    def test_lines(self):
+        d = 'M10,10 h100 v100 h-100 z'
+        path_data = PathParser.parse(d, compact=True)
+        index = PathLengthIndex(path_data)
+        self.assertAlmostEqual(400, index.total_length)
+        expected = [(0, (10, 10), 0, 1),
+                    (50, (60, 10), 0, 1),
+                    (150, (110, 60), 90, 2),
+                    (250, (60, 110), 180, 3),
+                    (350, (10, 60), -90, 4),
+                    (400, (10, 10), -90, 4)]
+        for distance, (x, y), angle, segment in expected:
+            point = index.get_point_at_length(distance)
+            self.assertAlmostEqual(x, point[0], msg=distance)
+            self.assertAlmostEqual(y, point[1], msg=distance)
+            self.assertAlmostEqual(angle,
+                                   index.get_tangent_at_length(distance),
+                                   msg=distance)
+            self.assertEqual(segment, index.get_segment_at_length(distance),
+                             msg=distance)
+
+        distances = [distance for distance, _, _, _ in expected]
+        points = index.get_points_at_lengths(distances)
+        self.assertEqual((6, 2), points.shape)
+        self.assertEqual([1, 1, 2, 3, 4, 4],
+                         index.get_segments_at_lengths(distances).tolist())
+
+    def test_segments(self):
+        d = 'M10,10 B90 l100,0 q50,0 50,50 t50,50 M300,300 L310,300' \
+            ' a10,10 0 0 1 0,20'
+        path_data = PathParser.parse(d)
+        index = PathLengthIndex(path_data)
+        self.assertAlmostEqual(PathParser.get_total_length(path_data),
+                               index.total_length)
+        self.assertEqual(2, index.get_segment_at_length(50))
+        self.assertEqual(3, index.get_segment_at_length(110))
+        self.assertEqual(6, index.get_segment_at_length(
+            index.total_length - 35))
+        self.assertEqual(7, index.get_segment_at_length(
+            index.total_length - 20))
+        self.assertEqual(7, index.get_segment_at_length(index.total_length))
+
+        # bearing
+        x, y = index.get_point_at_length(50)
+        self.assertAlmostEqual(10, x)
+        self.assertAlmostEqual(60, y)
+
+
+if __name__ == '__main__':
+    unittest.main()
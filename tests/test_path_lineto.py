@@ -104,6 +104,26 @@ class PathLinetoTestCase(unittest.TestCase):
         expected = 'M100,100 L300,100 200,300 Z'
         self.assertEqual(expected, d)
 
+    def test_lineto_abs_bbox(self):
+        d = 'M0,0 L10,0 L10,10'
+        path_data = PathParser.parse(d)
+        bbox = PathParser.get_bbox(path_data)
+        self.assertEqual(0, bbox.x)
+        self.assertEqual(0, bbox.y)
+        self.assertEqual(10, bbox.width)
+        self.assertEqual(10, bbox.height)
+
+        # a trailing "moveto" command is not included
+        d = 'M0,0 L10,0 L10,10 M100,100'
+        path_data = PathParser.parse(d)
+        bbox = PathParser.get_bbox(path_data)
+        self.assertEqual(10, bbox.width)
+        self.assertEqual(10, bbox.height)
+
+        bbox = PathParser.get_bbox([])
+        self.assertIsNone(bbox.x)
+        self.assertIsNone(bbox.y)
+
     def test_lineto_rel_length(self):
         # See also: bearing01.html
         # "M150,10 B36 h47 b72 h47 b72 h47 b72 h47 Z"
@@ -310,6 +330,68 @@ class PathLinetoTestCase(unittest.TestCase):
         expected = 200
         self.assertAlmostEqual(expected, n)
 
+    def test_path_parse03(self):
+        # compact forms
+        d = 'M1.5.5L-1-2.5e1.5l.1.2-.3-.4z'
+        path_data = PathParser.parse(d)
+        self.assertEqual(5, len(path_data))
+        self.assertEqual(('M', (1.5, 0.5)),
+                         (path_data[0].type, path_data[0].values))
+        self.assertEqual(('L', (-1, -25)),
+                         (path_data[1].type, path_data[1].values))
+        self.assertEqual(('l', (0.1, 0.2)),
+                         (path_data[2].type, path_data[2].values))
+        self.assertEqual(('l', (-0.3, -0.4)),
+                         (path_data[3].type, path_data[3].values))
+        self.assertEqual('z', path_data[4].type)
+
+    def test_path_parse04(self):
+        # an incomplete segment is not split into smaller numbers
+        d = 'M10,10 L20,20 30 L40,40'
+        path_data = PathParser.parse(d)
+        d = PathParser.tostring(path_data)
+        expected = 'M10,10 L20,20 40,40'
+        self.assertEqual(expected, d)
+
+    def test_path_parse_empty(self):
+        self.assertEqual([], PathParser.parse(None))
+        self.assertEqual([], PathParser.parse(''))
+        self.assertEqual([], PathParser.parse(' \t\r\n'))
+        self.assertEqual([], list(PathParser.iterparse(None)))
+
+    def test_path_parse_strict(self):
+        # render up to (but not including) the first error
+        d = 'M100,100 L200,100 L L300,100 l0,100'
+        path_data = PathParser.parse(d, strict=True)
+        d = PathParser.tostring(path_data)
+        expected = 'M100,100 L200,100'
+        self.assertEqual(expected, d)
+
+        d = 'M10,10 L20,20 30 L40,40'
+        path_data = PathParser.parse(d, strict=True)
+        d = PathParser.tostring(path_data)
+        expected = 'M10,10 L20,20'
+        self.assertEqual(expected, d)
+
+        # path data must begin with a "moveto" command
+        d = 'L10,10 L20,20'
+        path_data = PathParser.parse(d, strict=True)
+        self.assertEqual(0, len(path_data))
+
+        d = 'M10,10 # L20,20'
+        path_data = PathParser.parse(d, strict=True)
+        self.assertEqual(1, len(path_data))
+
+    def test_path_iterparse(self):
+        d = 'M0.1.2.3,4.5,-6.7-.8 8.8,.10 999e-3.5 1e+3.4 777z'
+        it = PathParser.iterparse(d)
+        path_segment = next(it)
+        self.assertIsInstance(path_segment, SVGPathSegment)
+        self.assertEqual('M', path_segment.type)
+        self.assertEqual((0.1, 0.2), path_segment.values)
+        path_data = [path_segment] + list(it)
+        self.assertEqual(PathParser.parse(d), path_data)
+
     def test_path_tostring_null(self):
         # skip invalid segments
         path_data = list()
@@ -1,21 +1,26 @@
 #!/usr/bin/env python3
 
 
+import gc
 import logging
 import os
 import sys
 import tempfile
 import unittest
 from io import StringIO
+from pathlib import Path
 from urllib.parse import unquote
 
 sys.path.extend(['.', '..'])
 
 from svgpy import Font, SVGParser, window
+from svgpy.dom import StyleResolver
 from svgpy.css import CSSRule
-from svgpy.style import get_css_rules, get_css_style_sheets_from_svg_document, \
-    get_css_style_sheets_from_xml_stylesheet, get_css_style
-from svgpy.utils import get_content_type, load
+from svgpy.style import ComputedStyle, RuleIndex, get_css_rule_index, \
+    get_css_rules, get_css_style_sheets_from_svg_document, \
+    get_css_style_sheets_from_xml_stylesheet, get_css_style, \
+    get_matched_css_rules
+from svgpy.utils import ResourceLoader, get_content_type, load
 
 # LOGGING_LEVEL = logging.DEBUG
 LOGGING_LEVEL = logging.WARNING
@@ -352,6 +357,527 @@ class StyleTestCase(unittest.TestCase):
         self.assertEqual(CSSRule.STYLE_RULE, css_rule.type)
         self.assertEqual('.tick', css_rule.selector_text)
 
+    def test_compute_styles01(self):
+        doc = window.document
+        root = doc.create_element('svg')
+        doc.append_child(root)
+        style = root.create_sub_element('style')
+        style.text = '''
+g { font: italic bold 20px serif; }
+.a { fill: red; }
+#b { display: none; }
+        '''
+        g = root.create_sub_element('g')
+        g.attributes.update({'stroke': 'blue'})
+        text = g.create_sub_element('text')
+        text.attributes.update({'class': 'a', 'font-size': '12'})
+        tspan = text.create_sub_element('tspan')
+        tspan.id = 'b'
+        rect = root.create_sub_element('rect')
+
+        elements = [root, g, text, tspan, rect]
+        expected = [element.get_computed_style() for element in elements]
+        self.assertIsNone(doc.style_resolver)
+
+        doc.compute_styles()
+        style_resolver = doc.style_resolver
+        self.assertIsInstance(style_resolver, StyleResolver)
+        for element, css_style in zip(elements, expected):
+            self.assertEqual(css_style, element.get_computed_style())
+
+        css_style = tspan.get_computed_style()
+        self.assertEqual('red', css_style['fill'])
+        self.assertEqual('blue', css_style['stroke'])
+        self.assertEqual(12, css_style['font-size'])
+        self.assertEqual(700, css_style['font-weight'])
+        self.assertEqual('italic', css_style['font-style'])
+        self.assertEqual(['serif'], css_style['font-family'])
+        self.assertEqual('none', css_style['display'])
+        self.assertFalse(tspan.isdisplay())
+        self.assertTrue(text.isdisplay())
+
+        # results are copies
+        css_style['font-family'].append('monospace')
+        self.assertEqual(['serif'],
+                         tspan.get_computed_style()['font-family'])
+
+        # resolved again after the element is modified
+        rect.attributes.update({'fill': 'green'})
+        self.assertEqual('green', rect.get_computed_style()['fill'])
+        self.assertIs(style_resolver, doc.style_resolver)
+
+        # ... or its ancestors
+        g.attributes.update({'stroke': 'red'})
+        self.assertEqual('red', tspan.get_computed_style()['stroke'])
+        tspan.id = 'c'
+        self.assertEqual('inline', tspan.get_computed_style()['display'])
+
+        # ... or the style sheets
+        style.text = '.a { fill: blue; }'
+        self.assertEqual('blue', tspan.get_computed_style()['fill'])
+        self.assertEqual(16, g.get_computed_style()['font-size'])
+
+        # ... or a preceding sibling
+        style.text = 'text + rect { stroke: yellow; }'
+        self.assertEqual('none', rect.get_computed_style()['stroke'])
+        g.remove(text)
+        root.insert(2, text)
+        self.assertEqual('yellow', rect.get_computed_style()['stroke'])
+        text.attributes.update({'display': 'none'})
+        self.assertEqual('none', text.get_computed_style()['display'])
+        self.assertEqual('yellow', rect.get_computed_style()['stroke'])
+
+        doc.compute_styles()
+        self.assertIsNot(style_resolver, doc.style_resolver)
+        for element in elements:
+            self.assertEqual(StyleResolver().get_computed_style(element),
+                             element.get_computed_style())
+
+    def test_style_resolver_sharing01(self):
+        parser = SVGParser()
+        svg = '''
+<svg xmlns="http://www.w3.org/2000/svg">
+  <style>.a { fill: red; } svg|rect:first-child { stroke: blue; }</style>
+  <g>
+    <rect class="a" width="10" height="10"/>
+    <rect class="a" width="10" height="10"/>
+    <rect class="a" width="10" height="10"/>
+    <rect class="a" width="20" height="10"/>
+    <rect class="b" width="10" height="10"/>
+  </g>
+  <g>
+    <rect class="a" width="10" height="10" stroke="green"/>
+    <rect class="a" width="10" height="10"/>
+  </g>
+</svg>
+        '''
+        root = parser.fromstring(svg)
+        style_resolver = StyleResolver()
+        style_resolver.resolve(root)
+        g1, g2 = root[1:]
+        rects = list(g1) + list(g2)
+
+        # matched rules differ (:first-child)
+        declared = [style_resolver.get_declared_style(x) for x in rects]
+        self.assertIsNot(declared[0], declared[1])
+        self.assertIs(declared[1], declared[2])
+        self.assertIsNot(declared[1], declared[3])  # width
+        self.assertIsNot(declared[1], declared[4])  # class
+        self.assertIs(declared[1], declared[6])
+
+        computed = [style_resolver.get_computed_style(x) for x in rects]
+        for element, css_style in zip(rects, computed):
+            self.assertEqual(element.get_computed_style(), css_style)
+        self.assertEqual('blue', computed[0]['stroke'])
+        self.assertEqual('none', computed[1]['stroke'])
+        self.assertEqual('green', computed[5]['stroke'])
+        self.assertEqual(20, computed[3]['width'])
+
+        # sibling and cousin rect elements share one computed style
+        shared = style_resolver._computed_styles
+        self.assertIs(shared[rects[1]], shared[rects[2]])
+        self.assertIs(shared[rects[1]], shared[rects[6]])
+        self.assertIsNot(shared[rects[1]], shared[rects[3]])
+        self.assertIsNot(shared[rects[1]], shared[rects[4]])
+        self.assertIsNot(computed[1], computed[2])  # copies
+
+    def test_style_resolver_sharing02(self):
+        # elements in different SVG viewports do not share a style
+        parser = SVGParser()
+        svg = '''
+<svg xmlns="http://www.w3.org/2000/svg" width="400" height="400">
+  <symbol width="200" height="200"><rect width="50%"/></symbol>
+  <pattern width="200" height="200"><rect width="50%"/></pattern>
+  <svg width="100" height="100"><rect width="50%"/></svg>
+</svg>
+        '''
+        root = parser.fromstring(svg)
+        rects = [x[0] for x in root]
+        expected = [x.get_computed_style() for x in rects]
+        self.assertEqual([100, 200, 50],
+                         [css_style['width'] for css_style in expected])
+
+        style_resolver = StyleResolver()
+        style_resolver.resolve(root)
+        for element, css_style in zip(rects, expected):
+            self.assertEqual(css_style,
+                             style_resolver.get_computed_style(element))
+        declared = [style_resolver.get_declared_style(x) for x in root]
+        self.assertIsNot(declared[0], declared[1])
+
+    def test_style_resolver_sharing03(self):
+        # the shared styles are discarded with the style sheets
+        parser = SVGParser()
+        svg = '''
+<svg xmlns="http://www.w3.org/2000/svg">
+  <style>.a { fill: red; }</style>
+  <rect class="a"/>
+</svg>
+        '''
+        root = parser.fromstring(svg)
+        style, rect = root
+        style_resolver = StyleResolver()
+        style_resolver.resolve(root)
+        for i in range(30):
+            fill = '#{:06x}'.format(i)
+            style.text = '.a { fill: ' + fill + '; }'
+            gc.collect()
+            self.assertEqual(fill,
+                             style_resolver.get_computed_style(rect)['fill'])
+
+        # ... and do not grow with every modification
+        for i in range(1200):
+            rect.attributes['stroke-width'] = str(i)
+            self.assertEqual(
+                i, style_resolver.get_computed_style(rect)['stroke-width'])
+        self.assertLess(len(style_resolver._shared_declared_styles), 1100)
+
+    def test_computed_style01(self):
+        parser = SVGParser()
+        svg = '''
+<svg xmlns="http://www.w3.org/2000/svg">
+  <g font-family="serif">
+    <rect class="a" width="10" height="10"/>
+    <rect class="a" width="10" height="10"/>
+    <rect width="20" height="10"/>
+  </g>
+</svg>
+        '''
+        root = parser.fromstring(svg)
+        rects = list(root[0])
+        css_style = rects[0].get_computed_style()
+        computed = rects[0].get_computed_style(frozen=True)
+        self.assertIsInstance(computed, ComputedStyle)
+        self.assertEqual(css_style, computed)
+        self.assertEqual(css_style, computed.to_dict())
+        self.assertEqual(['serif'], computed['font-family'])
+        self.assertEqual(len(css_style), len(computed))
+
+        # read-only
+        with self.assertRaises(TypeError):
+            computed['fill'] = 'red'
+        self.assertRaises(AttributeError,
+                          lambda: computed['font-family'].append('monospace'))
+        font_family = computed.to_dict()['font-family']
+        font_family.append('monospace')
+        self.assertEqual(['serif'], computed['font-family'])
+
+        # equal computed styles are shared
+        self.assertIs(computed, rects[1].get_computed_style(frozen=True))
+        self.assertIsNot(computed, rects[2].get_computed_style(frozen=True))
+        self.assertIs(computed, ComputedStyle.intern(css_style))
+
+        replaced = computed.replace({'fill': 'red'}, width=20)
+        self.assertEqual('red', replaced['fill'])
+        self.assertEqual(20, replaced['width'])
+        self.assertEqual('black', computed['fill'])
+        self.assertEqual(list(computed.keys()), list(replaced.keys()))
+
+        style_resolver = StyleResolver()
+        style_resolver.resolve(root)
+        self.assertIs(computed,
+                      style_resolver.get_computed_style(rects[0], frozen=True))
+        self.assertEqual(css_style,
+                         style_resolver.get_computed_style(rects[0]))
+
+    def test_style_resolver01(self):
+        parser = SVGParser()
+        svg = '''
+<svg xmlns="http://www.w3.org/2000/svg">
+  <style>.v { font-variant: small-caps; }</style>
+  <g font-family="Arial" font-weight="bolder" fill="inherit">
+    <g class="v" style="letter-spacing: 2; fill: red">
+      <text font-variant-ligatures="none common-ligatures"/>
+    </g>
+  </g>
+</svg>
+        '''
+        root = parser.fromstring(svg)
+        style_resolver = StyleResolver()
+        style_resolver.resolve(root)
+        for element in root.iter():
+            self.assertEqual(element.get_inherited_style(),
+                             style_resolver.get_inherited_style(element))
+
+        text = root[1][0][0]
+        css_style = style_resolver.get_inherited_style(text)
+        self.assertEqual(['Arial'], css_style['font-family'])
+        self.assertEqual('bolder', css_style['font-weight'])
+        self.assertEqual('small-caps', css_style['font-variant-caps'])
+        self.assertEqual(['none', 'common-ligatures'],
+                         css_style['font-variant-ligatures'])
+        self.assertEqual('2', css_style['letter-spacing'])
+        self.assertEqual('red', css_style['fill'])
+
+        css_style = style_resolver.get_declared_style(root[1][0])
+        self.assertEqual('red', css_style['fill'])
+        self.assertEqual('small-caps', css_style['font-variant-caps'])
+
+    def test_compute_styles02(self):
+        # selector-first matching
+        doc = window.document
+        root = doc.create_element('svg')
+        doc.append_child(root)
+        style = root.create_sub_element('style')
+        style.text = '''
+rect { fill: red; }
+.a { stroke: blue; }
+g > rect { fill: green; }
+        '''
+        g = root.create_sub_element('g')
+        rect1 = g.create_sub_element('rect')
+        rect1.attributes.update({'class': 'a'})
+        rect2 = root.create_sub_element('rect')
+
+        rule_index = get_css_rule_index(root)
+        matched_rules = rule_index.match(root)
+        selectors = [css_rule.selector_text
+                     for css_rule in matched_rules[rect1]
+                     if css_rule.parent_style_sheet.owner_node is not None]
+        self.assertEqual(['rect', '.a', 'g > rect'], selectors)
+        selectors = [css_rule.selector_text
+                     for css_rule in matched_rules[rect2]
+                     if css_rule.parent_style_sheet.owner_node is not None]
+        self.assertEqual(['rect'], selectors)
+        selectors = [css_rule.selector_text
+                     for css_rule in matched_rules[g]
+                     if css_rule.parent_style_sheet.owner_node is not None]
+        self.assertEqual([], selectors)
+
+        doc.compute_styles(selector_first=True)
+        css_style = rect1.get_computed_style()
+        self.assertEqual('green', css_style['fill'])
+        self.assertEqual('blue', css_style['stroke'])
+        css_style = rect2.get_computed_style()
+        self.assertEqual('red', css_style['fill'])
+        self.assertEqual('none', css_style['stroke'])
+        css_style = g.get_computed_style()
+        self.assertEqual('black', css_style['fill'])
+
+    def test_compute_styles03(self):
+        # both matching modes give the same styles
+        doc = window.document
+        root = doc.create_element('svg')
+        doc.append_child(root)
+        style = root.create_sub_element('style')
+        style.text = '''
+g rect { fill: red; }
+g > rect { stroke: green; }
+rect + circle { fill: blue; }
+rect ~ circle { stroke: yellow; }
+g > :first-child { stroke-width: 3; }
+g g > .a { fill: gray; }
+        '''
+        g1 = root.create_sub_element('g')
+        g2 = g1.create_sub_element('g')
+        for parent in (g1, g2, root):
+            rect = parent.create_sub_element('rect')
+            rect.attributes.update({'class': 'a'})
+            parent.create_sub_element('circle')
+            parent.create_sub_element('circle')
+            parent.create_sub_element('rect')
+        elements = list(root.iter())
+
+        doc.compute_styles()
+        expected = [element.get_computed_style() for element in elements]
+        doc.compute_styles(selector_first=True)
+        for element, css_style in zip(elements, expected):
+            self.assertEqual(css_style, element.get_computed_style())
+
+        rects = list(root.iter('{*}rect'))
+        self.assertEqual(['gray', 'red', 'red', 'red', 'black', 'black'],
+                         [x.get_computed_style()['fill'] for x in rects])
+        self.assertEqual(['green', 'green', 'green', 'green', 'none', 'none'],
+                         [x.get_computed_style()['stroke'] for x in rects])
+        circles = list(root.iter('{*}circle'))
+        self.assertEqual(['blue', 'black'] * 3,
+                         [x.get_computed_style()['fill'] for x in circles])
+        self.assertEqual(['yellow'] * 6,
+                         [x.get_computed_style()['stroke'] for x in circles])
+        self.assertEqual([3, 3, 1, 1, 1, 1],
+                         [x.get_computed_style()['stroke-width']
+                          for x in rects])
+
+    def test_get_css_rules_cache01(self):
+        # parsed style sheets are reused until the document changes
+        doc = window.document
+        root = doc.create_element('svg')
+        doc.append_child(root)
+        style = root.create_sub_element('style')
+        style.text = '#heading { font-size: 24px; }'
+        text = root.create_sub_element('text')
+        text.id = 'heading'
+
+        style_sheets = doc.style_sheets
+        self.assertEqual(2, len(style_sheets))
+        css_rules = get_css_rules(text)
+        self.assertEqual(style_sheets, doc.style_sheets)
+        self.assertEqual(css_rules, get_css_rules(root))
+        css_style, _ = get_css_style(text, css_rules)
+        self.assertEqual('24px', css_style.get('font-size'))
+
+        # <style> element changed
+        style.text = '#heading { font-size: 12px; }'
+        self.assertNotEqual(style_sheets[1], doc.style_sheets[1])
+        css_style, _ = get_css_style(text, get_css_rules(text))
+        self.assertEqual('12px', css_style.get('font-size'))
+        style_sheets = doc.style_sheets
+
+        style.set('media', 'print')
+        self.assertEqual(1, len(doc.style_sheets))
+        style.set('media', 'screen')
+        self.assertEqual(2, len(doc.style_sheets))
+
+        # <style> element added
+        style2 = root.create_sub_element('style')
+        style2.text = 'text { fill: red; }'
+        self.assertEqual(3, len(doc.style_sheets))
+        root.remove(style2)
+        self.assertEqual(2, len(doc.style_sheets))
+
+    def test_get_css_rules_cache02(self):
+        # cached rules follow the media state
+        doc = window.document
+        root = doc.create_element('svg')
+        doc.append_child(root)
+        style = root.create_sub_element('style')
+        style.text = '''
+@media (min-width: 1000px) {
+    #heading { font-size: 24px; }
+}
+        '''
+        text = root.create_sub_element('text')
+        text.id = 'heading'
+
+        css_style, _ = get_css_style(text, get_css_rules(text))
+        self.assertEqual('24px', css_style.get('font-size'))
+
+        window.inner_width = 800
+        css_style, _ = get_css_style(text, get_css_rules(text))
+        self.assertIsNone(css_style.get('font-size'))
+
+        window.inner_width = 1280
+        css_style, _ = get_css_style(text, get_css_rules(text))
+        self.assertEqual('24px', css_style.get('font-size'))
+
+        window.screen.media = 'print'
+        style.set('media', 'screen')
+        self.assertEqual(1, len(doc.style_sheets))
+        window.screen.media = 'screen'
+        self.assertEqual(2, len(doc.style_sheets))
+
+    def test_get_css_rules_import01(self):
+        # linked and imported style sheets are loaded level by level
+        class _ResourceLoader(ResourceLoader):
+            def __init__(self):
+                super().__init__()
+                self.batches = list()
+
+            def load_all(self, urls):
+                urls = list(urls)
+                self.batches.append(sorted(os.path.basename(x)
+                                           for x in urls))
+                return super().load_all(urls)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sources = {
+                'a.css': '@import url(b.css); @import "c.css";'
+                         ' #heading { fill: red; }',
+                'b.css': '@import url(a.css); #heading { stroke: blue; }',
+                'c.css': '#heading { stroke-width: 2; }',
+                'd.css': '#heading { font-size: 24px; }',
+            }
+            for name, source in sources.items():
+                with open(os.path.join(temp_dir, name), 'w') as fp:
+                    fp.write(source)
+            base_url = Path(temp_dir).as_uri() + '/'
+
+            doc = window.document
+            loader = _ResourceLoader()
+            doc.resource_loader = loader
+            try:
+                root = doc.create_element('svg')
+                doc.append_child(root)
+                style = root.create_sub_element('style')
+                style.text = '@import url({}a.css);'.format(base_url)
+                link = root.create_sub_element('link')
+                link.attributes.update({
+                    'rel': 'stylesheet',
+                    'href': base_url + 'd.css',
+                })
+                text = root.create_sub_element('text')
+                text.id = 'heading'
+
+                css_style, _ = get_css_style(text, get_css_rules(text))
+            finally:
+                doc.resource_loader = None
+
+        self.assertEqual([['a.css', 'd.css'], ['b.css', 'c.css']],
+                         loader.batches)
+        # b.css imports a.css again: skipped
+        self.assertEqual('red', css_style.get('fill'))
+        self.assertEqual('blue', css_style.get('stroke'))
+        self.assertEqual('2', css_style.get('stroke-width'))
+        self.assertEqual('24px', css_style.get('font-size'))
+
+    def test_get_css_rules_import02(self):
+        # only the applicable style sheets are loaded ahead
+        class _ResourceLoader(ResourceLoader):
+            def __init__(self):
+                super().__init__()
+                self.batches = list()
+
+            def load_all(self, urls):
+                urls = list(urls)
+                self.batches.append(sorted(os.path.basename(x)
+                                           for x in urls))
+                return super().load_all(urls)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            names = ['a.css', 'b.css', 'c.css', 'd.css', 'e.css', 'f.css',
+                     'icon.png', 'script.js']
+            for name in names:
+                with open(os.path.join(temp_dir, name), 'w') as fp:
+                    fp.write('#heading { fill: red; }')
+            base_url = Path(temp_dir).as_uri() + '/'
+
+            doc = window.document
+            loader = _ResourceLoader()
+            doc.resource_loader = loader
+            try:
+                root = doc.create_element('svg')
+                doc.append_child(root)
+                style = root.create_sub_element('style')
+                style.text = ('@import url({0}a.css) print;'
+                              ' @import url({0}b.css) screen;'.format(
+                                  base_url))
+                style = root.create_sub_element('style')
+                style.text = '@import url({}c.css);'.format(base_url)
+                style.attributes.update({'media': 'print'})
+                links = [
+                    ('stylesheet', None, None, 'd.css'),
+                    ('preload', 'style', None, 'e.css'),
+                    ('stylesheet', None, 'print', 'f.css'),
+                    ('alternate stylesheet', None, None, 'a.css'),
+                    ('icon', None, None, 'icon.png'),
+                    ('preload', 'script', None, 'script.js'),
+                ]
+                for rel, as_, media, name in links:
+                    link = root.create_sub_element('link')
+                    link.attributes.update({
+                        'rel': rel,
+                        'href': base_url + name,
+                    })
+                    if as_ is not None:
+                        link.attributes.update({'as': as_})
+                    if media is not None:
+                        link.attributes.update({'media': media})
+                get_css_rules(root)
+            finally:
+                doc.resource_loader = None
+
+        self.assertEqual([['b.css', 'd.css', 'e.css']], loader.batches)
+
     def test_get_css_style01(self):
         # 'style' element
         # See also: svg/style8.css
@@ -635,6 +1161,65 @@ class StyleTestCase(unittest.TestCase):
         self.assertTrue('fill-color' not in style_map)
         self.assertEqual('content-box', style_map['fill-origin'])
 
+    def test_rule_index01(self):
+        parser = SVGParser()
+        svg = '''
+<svg xmlns="http://www.w3.org/2000/svg">
+  <style>
+    @namespace q url(http://www.w3.org/2000/svg);
+    rect { fill: red; }
+    q|rect.a { fill: green; }
+    g > .b, #c { fill: blue; }
+    *:not(g) { stroke: black; }
+    [id] { stroke: white; }
+    text { fill: gray; }
+    circle, .d { fill: yellow; }
+  </style>
+  <rect class="a b"/>
+  <rect id="c"/>
+  <text/>
+  <circle class="d"/>
+</svg>
+        '''
+        root = parser.fromstring(svg)
+        rect1, rect2, text, circle = root[1:]
+
+        css_rules = get_css_rules(root)
+        rule_index = get_css_rule_index(root)
+        self.assertIsInstance(rule_index, RuleIndex)
+        self.assertEqual(css_rules, rule_index.css_rules)
+        self.assertIs(rule_index, get_css_rule_index(text))
+
+        selectors = [css_rule.selector_text
+                     for css_rule, _ in rule_index.get_candidates(rect1)
+                     if css_rule.parent_style_sheet.owner_node is not None]
+        self.assertEqual(['rect', 'q|rect.a', 'g > .b, #c', '*:not(g)',
+                          '[id]'], selectors)
+
+        selectors = [css_rule.selector_text
+                     for css_rule, _ in rule_index.get_candidates(text)
+                     if css_rule.parent_style_sheet.owner_node is not None]
+        self.assertEqual(['*:not(g)', '[id]', 'text'], selectors)
+
+        # a rule in more than one bucket is a candidate only once
+        selectors = [css_rule.selector_text
+                     for css_rule, _ in rule_index.get_candidates(circle)
+                     if css_rule.parent_style_sheet.owner_node is not None]
+        self.assertEqual(['*:not(g)', '[id]', 'circle, .d'], selectors)
+        self.assertEqual(get_matched_css_rules(circle, css_rules),
+                         get_matched_css_rules(circle, rule_index))
+
+        for element in root.iter():
+            expected = get_css_style(element, css_rules)
+            self.assertEqual(expected, get_css_style(element, rule_index))
+
+        css_style, _ = get_css_style(rect1, rule_index)
+        self.assertEqual('green', css_style.get('fill'))
+        self.assertEqual('black', css_style.get('stroke'))
+        css_style, _ = get_css_style(rect2, rule_index)
+        self.assertEqual('blue', css_style.get('fill'))
+        self.assertEqual('white', css_style.get('stroke'))
+
     def test_load_data01(self):
         href = 'data:,Hello%2C%20World!'
         data, headers = load(href)
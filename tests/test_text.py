@@ -443,6 +443,68 @@ class TextTestCase(unittest.TestCase):
         rect = PathParser.get_bbox(normalized)
         self.assertTrue(rect.isvalid(), msg=repr(rect))
 
+    def test_font_face02(self):
+        from svgpy.freetype import FreeType, FTMatrix
+        from svgpy import DOMMatrix, PathData, SVGPathSegment
+
+        parser = SVGParser()
+        root = parser.create_element('svg')
+        group = root.create_sub_element('g')
+        group.attributes.update({
+            'font-family': 'DejaVu Serif, serif',
+            'font-size': '20',
+        })
+        text = group.create_sub_element('text')
+
+        font = Font(text)
+        face = font.face
+        matrix = DOMMatrix()
+        matrix.rotate_self(rot_z=30)
+        matrix.translate_self(10.5, -3.25)
+        for ch in 'a@é':
+            face.load_char(ch, FreeType.FT_LOAD_NO_BITMAP)
+            outline = face.glyph.outline
+            points, tags, contours = outline.get_arrays()
+            self.assertEqual((outline.n_points, 2), points.shape)
+            self.assertEqual((outline.n_points,), tags.shape)
+            self.assertEqual((outline.n_contours,), contours.shape)
+            self.assertEqual(outline.n_points - 1, contours[-1])
+
+            path_data = PathParser.from_glyph(face, matrix)
+            compact = PathParser.from_glyph(face, matrix, compact=True)
+            self.assertIsInstance(compact, PathData)
+            self.assertEqual(path_data, compact)
+
+            # decompose with the callbacks
+            def _move_to(x, y, user):
+                user.append(SVGPathSegment('M', x / 64, y / 64))
+
+            def _line_to(x, y, user):
+                user.append(SVGPathSegment('L', x / 64, y / 64))
+
+            def _conic_to(x1, y1, x, y, user):
+                user.append(SVGPathSegment('Q', x1 / 64, y1 / 64,
+                                           x / 64, y / 64))
+
+            def _cubic_to(x1, y1, x2, y2, x, y, user):
+                user.append(SVGPathSegment('C', x1 / 64, y1 / 64,
+                                           x2 / 64, y2 / 64,
+                                           x / 64, y / 64))
+
+            transform = FTMatrix().flip_y()
+            other = FTMatrix()
+            other.a = matrix.a
+            other.b = matrix.b
+            other.c = matrix.c
+            other.d = matrix.d
+            transform *= other
+            outline.translate(int(matrix.e * 64), int(matrix.f * 64))
+            outline.transform(transform)
+            expected = list()
+            outline.decompose(_move_to, _line_to, _conic_to, _cubic_to,
+                              user=expected)
+            self.assertEqual(expected, path_data)
+
     def test_font_prop01(self):
         # 'font' property
         # https://drafts.csswg.org/css-fonts-3/#font-prop
@@ -8,6 +8,7 @@ import numpy as np
 sys.path.extend(['.', '..'])
 
 from svgpy import DOMMatrix, SVGTransform, SVGTransformList, formatter
+from svgpy.transform import ParsedTransformList
 
 
 class TransformTestCase(unittest.TestCase):
@@ -450,6 +451,37 @@ class TransformListTestCase(unittest.TestCase):
         self.assertEqual('rotate(45, 0.5, 0.7)',
                          transform_list[2].tostring())
 
+    def test_transform_list_parsed01(self):
+        t = 'translate(50 30) rotate(30) scale(2)'
+        parsed = ParsedTransformList(t)
+        self.assertEqual(t, parsed.text)
+        self.assertEqual(3, len(parsed))
+        self.assertEqual(
+            ((SVGTransform.SVG_TRANSFORM_TRANSLATE, (50, 30)),
+             (SVGTransform.SVG_TRANSFORM_ROTATE, (30,)),
+             (SVGTransform.SVG_TRANSFORM_SCALE, (2,))),
+            parsed.items)
+
+        expected = SVGTransformList.parse(t)
+        transform_list = parsed.to_transform_list()
+        self.assertIsInstance(transform_list, SVGTransformList)
+        self.assertEqual(expected.tostring(), transform_list.tostring())
+        self.assertIsNot(transform_list, parsed.to_transform_list())
+        self.assertEqual(expected.matrix.tolist(), parsed.matrix.tolist())
+        self.assertEqual([x.matrix.tolist() for x in expected],
+                         [x.tolist() for x in parsed.matrices])
+
+        # read-only and computed once
+        self.assertIs(parsed.matrix, parsed.matrix)
+        self.assertRaises(AttributeError,
+                          lambda: parsed.matrix.translate_self(1, 1))
+        self.assertRaises(AttributeError,
+                          lambda: setattr(parsed, 'foo', 1))
+
+        parsed = ParsedTransformList('')
+        self.assertEqual(0, len(parsed))
+        self.assertIsNone(parsed.matrix)
+
     def test_transform_list_remove_item(self):
         iterable = [
             SVGTransform(SVGTransform.SVG_TRANSFORM_TRANSLATE, 50, 30),